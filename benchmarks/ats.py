@@ -0,0 +1,83 @@
+"""
+Benchmark: ATS scoring throughput at batch scale.
+
+    python -m benchmarks.ats [--sizes 1000 10000 100000] [--distinct 500]
+
+Builds ``--distinct`` synthetic resumes once, indexes them repeatedly up to
+each size, and times indexing, compiling the postings, and scoring one job
+description; "loop" is the same scoring done per resume in plain Python
+(measured on the smallest size and extrapolated).
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from collections import Counter
+
+from benchmarks.synthetic import PRESETS, make_resume
+from src.ats import TermIndex, resume_text, terms
+from src.builder import build_resume
+
+JOB = (
+    "Backend engineer: Python, Flask or Django, SQL and MySQL, Docker, "
+    "Kubernetes, AWS, GitHub Actions CI, pytest, and REST API design."
+)
+
+
+def _loop_score(texts: list[str], job: str) -> list[float]:
+    counts = [Counter(terms(t)) for t in texts]
+    n = len(counts)
+    df = Counter(t for c in counts for t in c)
+
+    def vec(c):
+        return {
+            t: (1 + math.log(k)) * (math.log((1 + n) / (1 + df[t])) + 1)
+            for t, k in c.items()
+        }
+
+    q = vec(Counter(terms(job)))
+    qn = math.sqrt(sum(w * w for w in q.values()))
+    scores = []
+    for c in counts:
+        v = vec(c)
+        vn = math.sqrt(sum(w * w for w in v.values())) or 1.0
+        scores.append(sum(w * v.get(t, 0.0) for t, w in q.items()) / (vn * qn))
+    return scores
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--distinct", type=int, default=500)
+    args = parser.parse_args()
+
+    built = [
+        build_resume(make_resume(seed=i, **PRESETS["typical"]), splitter="regex")
+        for i in range(args.distinct)
+    ]
+    for size in args.sizes:
+        t0 = time.perf_counter()
+        index = TermIndex.build((str(i), built[i % len(built)]) for i in range(size))
+        t1 = time.perf_counter()
+        index._compile()
+        t2 = time.perf_counter()
+        index.score(JOB, top=20)
+        t3 = time.perf_counter()
+        nnz = len(index._indices)
+        print(
+            f"{size:>7} resumes  index {t1 - t0:7.2f} s  compile {t2 - t1:6.3f} s  "
+            f"score {(t3 - t2) * 1e3:7.1f} ms  ({nnz:,} postings)"
+        )
+
+    size = min(args.sizes)
+    texts = [resume_text(built[i % len(built)]) for i in range(size)]
+    t0 = time.perf_counter()
+    _loop_score(texts, JOB)
+    per = (time.perf_counter() - t0) / size
+    print(f"loop scoring  {per * 1e6:7.1f} us/resume -> {per * max(args.sizes):.1f} s")
+
+
+if __name__ == "__main__":
+    main()
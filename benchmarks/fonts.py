@@ -0,0 +1,66 @@
+"""
+Benchmark: Helvetica vs an embedded TrueType family.
+
+    python -m benchmarks.fonts [--font REGULAR[,BOLD[,ITALIC]]] [--rounds 50]
+
+Reports the one-off cost of parsing the TTF files, what re-parsing them for
+every resume would cost, and per-resume throughput and PDF size for both
+paths. The default family is the Vera set bundled with reportlab.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import reportlab
+from reportlab.pdfbase.ttfonts import TTFont
+
+from benchmarks.synthetic import PRESETS, make_resume
+from src.builder import build_resume
+from src.fonts import HELVETICA, parse_spec
+from src.model import Resume
+from src.pdf_generator import render_pdf
+
+_VERA = os.path.join(os.path.dirname(reportlab.__file__), "fonts", "Vera{}.ttf")
+DEFAULT_FONT = ",".join(_VERA.format(face) for face in ("", "Bd", "It"))
+
+
+def _per_call_ms(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--font", default=DEFAULT_FONT, help="TTF family spec")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="typical")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    paths = [p for p in args.font.split(",") if p]
+    start = time.perf_counter()
+    family = parse_spec(args.font)
+    first = (time.perf_counter() - start) * 1e3
+    cached = _per_call_ms(lambda: parse_spec(args.font), 1000)
+    reparse = _per_call_ms(lambda: [TTFont("bench", p) for p in paths], 5)
+    print(f"register family   first {first:8.2f} ms   cached {cached * 1e3:6.2f} us")
+    print(f"re-parse per resume     {reparse:8.2f} ms (avoided by the cache)")
+
+    raw = make_resume(**PRESETS[args.preset])
+    resume = Resume.from_raw(build_resume(raw, splitter="regex"))
+    for label, fam in (("helvetica", HELVETICA), ("truetype", family)):
+        render_pdf(resume, family=fam)  # warm styles and section cache
+        ms = _per_call_ms(lambda: render_pdf(resume, family=fam), args.rounds)
+        size = len(render_pdf(resume, family=fam))
+        print(
+            f"{label:<10} {ms:8.2f} ms/resume  {1e3 / ms:7.1f}/s  "
+            f"{size / 1024:7.1f} KiB/pdf"
+        )
+
+
+if __name__ == "__main__":
+    main()
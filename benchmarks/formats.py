@@ -0,0 +1,56 @@
+"""
+Benchmark: one format vs every format from a single build.
+
+    python -m benchmarks.formats [--preset typical] [--rounds 50]
+
+"rebuild" is what producing each format separately used to cost: one
+build_resume per format. "shared" builds once and renders every format
+through formats.render_formats.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.synthetic import PRESETS, make_resume
+from src.builder import build_resume, configured
+from src.formats import FORMATS, render_formats
+
+
+def _per_call_ms(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="typical")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    raw = make_resume(**PRESETS[args.preset])
+    with configured(rewrite_cache_size=0):  # every build pays the full rewrite
+        _run(raw, args.rounds)
+
+
+def _run(raw: dict, rounds: int) -> None:
+    def build():
+        return build_resume(raw, splitter="regex")
+
+    render_formats(build(), FORMATS)  # warm styles and section cache
+    cases = {
+        "pdf only": lambda: render_formats(build(), ("pdf",)),
+        "shared": lambda: render_formats(build(), FORMATS),
+        "rebuild": lambda: [render_formats(build(), (f,)) for f in FORMATS],
+    }
+    for fmt in FORMATS:
+        cases[f"  {fmt}"] = lambda fmt=fmt: render_formats(build(), (fmt,))
+    for label, fn in cases.items():
+        print(f"{label:<10} {_per_call_ms(fn, rounds):8.2f} ms/resume")
+
+
+if __name__ == "__main__":
+    main()
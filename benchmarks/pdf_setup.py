@@ -0,0 +1,80 @@
+"""
+Benchmark: per-resume style setup before vs after the shared style registry.
+
+    python -m benchmarks.pdf_setup [--entries 12] [--rounds 2000]
+
+"before" rebuilds the stylesheet and one TableStyle per row, as build_pdf
+used to; "after" is what build_pdf does now. Also times a whole in-memory
+build_pdf so the setup share of a render is visible.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import time
+from pathlib import Path
+
+from reportlab.platypus import TableStyle
+
+from src.builder import build_resume
+from src.pdf_generator import (
+    _build_styles,
+    _col_widths,
+    _row_style,
+    _styles,
+    build_pdf,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _legacy_setup(rows: int) -> None:
+    _build_styles()
+    for _ in range(rows):
+        TableStyle(
+            [
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                ("TOPPADDING", (0, 0), (-1, -1), 0),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+            ]
+        )
+
+
+def _registry_setup(rows: int) -> None:
+    _styles()
+    for _ in range(rows):
+        _row_style()
+        _col_widths()
+
+
+def _per_call_us(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=12, help="table rows/resume")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    before = _per_call_us(lambda: _legacy_setup(args.entries), args.rounds)
+    after = _per_call_us(lambda: _registry_setup(args.entries), args.rounds)
+    print(f"style setup  before {before:9.1f} us/resume")
+    print(f"style setup  after  {after:9.1f} us/resume  ({before / after:.0f}x less)")
+
+    raw = json.loads((ROOT / "sample_data" / "minimal.json").read_text())
+    structured = build_resume(raw, splitter="regex")
+    rounds = max(1, args.rounds // 20)
+    full = _per_call_us(lambda: build_pdf(structured, io.BytesIO()), rounds)
+    print(f"full build_pdf      {full:9.1f} us/resume (setup was {before / full:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Equivalence harness: regex sentence splitter vs NLTK punkt.
+
+    python -m benchmarks.splitter_equivalence [--corpus FILE ...]
+
+The corpus is a built-in set of resume-style summaries plus every summary
+found in sample_data/ and in any --corpus file (plain text, one summary per
+line, or JSON/JSONL raw resumes). Prints each divergence and the speedup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from src.builder import punkt_sent_tokenize, regex_sent_tokenize
+
+ROOT = Path(__file__).resolve().parents[1]
+
+BUILTIN = [
+    "I was tasked with creating the site using python. delivered outcomes.",
+    "Co-founded the club; taught female students HTML and CSS; increased coverage.",
+    "Built REST APIs, e.g. auth and billing. Upgraded services to Python 3.9.",
+    "Migrated jobs to GitHub Actions (e.g. lint, test, deploy). Cut CI time by 40%.",
+    "Worked with Dr. Okafor on the v2.1.0 release. Shipped it ahead of schedule!",
+    "Automated reports in Pandas i.e. weekly KPIs. Presented results to the VP.",
+    "Led a team of 4 at Acme Inc. and mentored interns. Reduced churn 12%.",
+    "Tested the node.js service with Jest. Fixed 30+ bugs before launch.",
+    "Managed social content. Grew engagement... Increased followers by 2x.",
+    "Was responsible for the website. Collected user feedback and optimized pages.",
+]
+
+
+def _summaries(raw: dict):
+    for section in ("experience", "projects", "extracurriculars"):
+        for entry in raw.get(section, []) or []:
+            text = " ".join(entry.get("bullets", [])) or entry.get("summary", "")
+            text = text or entry.get("description", "")
+            if text:
+                yield text
+
+
+def _load(path: Path) -> list[str]:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        return list(_summaries(json.loads(text)))
+    if path.suffix in (".jsonl", ".ndjson"):
+        return [
+            s
+            for ln in text.splitlines()
+            if ln.strip()
+            for s in _summaries(json.loads(ln))
+        ]
+    return [ln for ln in text.splitlines() if ln.strip()]
+
+
+def _time(fn, corpus: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in corpus:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", nargs="*", default=[], type=Path)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    corpus = list(BUILTIN)
+    for path in sorted((ROOT / "sample_data").glob("*.json")) + args.corpus:
+        corpus.extend(_load(path))
+
+    diverged = 0
+    for text in corpus:
+        want, got = punkt_sent_tokenize(text), regex_sent_tokenize(text)
+        if want != got:
+            diverged += 1
+            print(f"DIVERGES: {text!r}\n  punkt: {want}\n  regex: {got}")
+
+    punkt_s = _time(punkt_sent_tokenize, corpus, args.rounds)
+    regex_s = _time(regex_sent_tokenize, corpus, args.rounds)
+    print(
+        f"{len(corpus)} summaries, {diverged} divergences; "
+        f"punkt {punkt_s:.3f}s, regex {regex_s:.3f}s, "
+        f"speedup {punkt_s / regex_s:.1f}x over {args.rounds} rounds"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark suite: build_resume, story construction and doc.build timed
+separately over synthetic resumes of increasing size.
+
+    python -m benchmarks.suite [--presets tiny,typical,long] [--runs 20]
+                               [--output results.json] [--compare old.json]
+
+Reports p50/p95 latency per stage, end-to-end throughput and peak traced
+memory per preset. --output saves the results as JSON; --compare flags any
+stage whose p50 regressed by more than --tolerance and exits non-zero.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.synthetic import PRESETS, make_resume
+from src.builder import build_resume, configured
+from src.model import Resume
+from src.pdf_generator import _build_story, _doc_info, _doc_template, _styles
+
+ROOT = Path(__file__).resolve().parents[1]
+STAGES = ("build_resume", "story", "doc_build")
+
+
+def _pct(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def _one_render(raw: dict, splitter: str) -> dict:
+    t0 = time.perf_counter()
+    structured = Resume.from_raw(build_resume(raw, splitter=splitter))
+    t1 = time.perf_counter()
+    story = _build_story(structured, _styles())
+    t2 = time.perf_counter()
+    _doc_template(io.BytesIO(), _doc_info(structured)).build(story)
+    t3 = time.perf_counter()
+    return {"build_resume": t1 - t0, "story": t2 - t1, "doc_build": t3 - t2}
+
+
+def _peak_memory(raw: dict, splitter: str) -> int:
+    tracemalloc.start()
+    try:
+        _one_render(raw, splitter)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_preset(name: str, runs: int, splitter: str) -> dict:
+    # Distinct seeds so the rewrite cache can't turn the runs into lookups.
+    resumes = [make_resume(seed=i, **PRESETS[name]) for i in range(runs + 1)]
+    with configured(rewrite_cache_size=0):  # the caller's cache comes back after
+        return _measure(resumes, runs, splitter)
+
+
+def _measure(resumes: list, runs: int, splitter: str) -> dict:
+    _one_render(resumes[0], splitter)  # warm-up: tokenizer, styles, fonts
+    samples = {stage: [] for stage in STAGES}
+    start = time.perf_counter()
+    for raw in resumes[1:]:
+        for stage, secs in _one_render(raw, splitter).items():
+            samples[stage].append(secs)
+    wall = time.perf_counter() - start
+    result = {
+        stage: {
+            "p50_ms": round(_pct(vals, 0.50) * 1e3, 3),
+            "p95_ms": round(_pct(vals, 0.95) * 1e3, 3),
+            "mean_ms": round(statistics.fmean(vals) * 1e3, 3),
+        }
+        for stage, vals in samples.items()
+    }
+    result["throughput_per_s"] = round(runs / wall, 2)
+    result["peak_mem_bytes"] = _peak_memory(resumes[1], splitter)
+    return result
+
+
+def _meta(splitter: str, runs: int) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "splitter": splitter,
+        "runs": runs,
+    }
+
+
+def compare(old: dict, new: dict, tolerance: float) -> list[str]:
+    """Stages whose p50 got slower than ``tolerance`` (0.10 = 10%)."""
+    regressions = []
+    for preset, stats in new["presets"].items():
+        before = old.get("presets", {}).get(preset)
+        if not before:
+            continue
+        for stage in STAGES:
+            a, b = before[stage]["p50_ms"], stats[stage]["p50_ms"]
+            if a and b > a * (1 + tolerance):
+                regressions.append(f"{preset}/{stage}: p50 {a:.2f} -> {b:.2f} ms")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--presets", default="tiny,typical,long")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--splitter", default="punkt", choices=["punkt", "regex"])
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = {"meta": _meta(args.splitter, args.runs), "presets": {}}
+    header = "preset      " + "".join(f"{s + ' p50/p95 ms':>26}" for s in STAGES)
+    print(header + f"{'res/s':>9}{'peak MiB':>10}")
+    for name in args.presets.split(","):
+        res = results["presets"][name] = run_preset(name, args.runs, args.splitter)
+        cells = "".join(
+            f"{res[s]['p50_ms']:>17.2f} /{res[s]['p95_ms']:>7.2f}" for s in STAGES
+        )
+        mib = res["peak_mem_bytes"] / 2**20
+        print(f"{name:<12}{cells}{res['throughput_per_s']:>9.1f}{mib:>10.1f}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.compare:
+        old = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(old, results, args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
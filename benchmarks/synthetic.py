@@ -0,0 +1,129 @@
+"""
+Synthetic raw resumes shaped like sample_data/minimal.json and the test
+fixture in tests/conftest.py, with controllable size.
+"""
+
+from __future__ import annotations
+
+import random
+
+_OPENINGS = [
+    "I was tasked with {verb} the {thing} using {tech}",
+    "Was responsible for {verb} {thing} with {tech}",
+    "We {past} a {thing} in {tech}",
+    "Helped {verb} the {thing} through {tech}",
+    "{Past} the {thing}, e.g. auth and billing, via {tech}",
+    "My role included {verb} the {thing} using {tech} and {tech2}",
+]
+_VERBS = [
+    ("building", "built"),
+    ("creating", "created"),
+    ("testing", "tested"),
+    ("managing", "managed"),
+    ("deploying", "deployed"),
+    ("automating", "automated"),
+]
+_THINGS = [
+    "company website",
+    "release pipeline",
+    "reporting dashboard",
+    "REST API",
+    "mobile app",
+    "test suite",
+    "data ingestion job",
+]
+_TECH = [
+    "python",
+    "github actions",
+    "docker",
+    "kubernetes",
+    "react",
+    "aws",
+    "mysql",
+    "pandas and numpy",
+    "selenium",
+    "the cli",
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    verb, past = rng.choice(_VERBS)
+    return rng.choice(_OPENINGS).format(
+        verb=verb,
+        past=past,
+        Past=past.capitalize(),
+        thing=rng.choice(_THINGS),
+        tech=rng.choice(_TECH),
+        tech2=rng.choice(_TECH),
+    ) + rng.choice([".", ".", "; improved reliability by 20%."])
+
+
+def _summary(rng: random.Random, sentences: int) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def make_resume(
+    experiences: int = 1,
+    projects: int = 1,
+    extracurriculars: int = 1,
+    sentences: int = 2,
+    seed: int = 0,
+) -> dict:
+    """One raw resume with the given entry counts and sentences per summary."""
+    rng = random.Random(seed)
+    return {
+        "contact": {
+            "full_name": f"Candidate {seed}",
+            "email": f"candidate{seed}@example.com",
+            "location": "Abuja, Nigeria",
+        },
+        "education": [
+            {
+                "school": "Nile University of Nigeria",
+                "degree": "Information Technology",
+                "dates": "Oct 2024 - Present",
+                "location": "Abuja, Nigeria",
+                "GPA": "4.5",
+            }
+        ],
+        "skills": {
+            "languages": ["Python", "HTML", "CSS", "Java"],
+            "libraries": ["NumPy", "Pandas"],
+        },
+        "experience": [
+            {
+                "title": f"Software developer {i}",
+                "company": f"Company {i}",
+                "location": "Abuja",
+                "dates": "May 2023 - Present",
+                "summary": _summary(rng, sentences),
+            }
+            for i in range(experiences)
+        ],
+        "projects": [
+            {
+                "title": f"Project {i}",
+                "tools": rng.choice(_TECH),
+                "dates": "Aug 2024 – Present",
+                "summary": _summary(rng, sentences),
+            }
+            for i in range(projects)
+        ],
+        "extracurriculars": [
+            {
+                "title": f"Club {i}",
+                "dates": "Nov 2021 – Aug 2022",
+                "summary": _summary(rng, sentences),
+            }
+            for i in range(extracurriculars)
+        ],
+    }
+
+
+# name -> make_resume kwargs, from one entry up to hundreds of long entries
+PRESETS = {
+    "tiny": dict(experiences=1, projects=0, extracurriculars=0, sentences=1),
+    "typical": dict(experiences=3, projects=2, extracurriculars=1, sentences=3),
+    "long": dict(experiences=20, projects=10, extracurriculars=5, sentences=8),
+    "huge": dict(experiences=300, projects=100, extracurriculars=50, sentences=12),
+}
@@ -0,0 +1,86 @@
+"""
+Micro-benchmark: per-key regex loop vs single-pass tech normalizer.
+
+    python -m benchmarks.tech_normalizer [--sizes 26,250,1000,5000]
+
+Grows the tech map with synthetic names (some multi-word) and reports
+bullets/second for both strategies. The legacy loop is given precompiled
+patterns so the comparison measures scanning, not re's compile cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import time
+
+from src.builder import _TECH_MAP, compile_tech_map
+
+BULLETS = [
+    "• Built a Flask api using python and github actions with docker.",
+    "• Automated the release pipeline with jenkins, kubernetes and aws.",
+    "• Tested the react ui with selenium and pytest, increasing test coverage.",
+    "• Migrated mysql reports to pandas and numpy via the cli.",
+    "• Delivered measurable outcomes by improving reliability.",
+]
+
+
+def _synthetic_map(size: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    mapping = dict(_TECH_MAP)
+    while len(mapping) < size:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+        if rng.random() < 0.2:
+            word += " " + "".join(rng.choices(string.ascii_lowercase, k=5))
+        mapping.setdefault(word, word.title())
+    return mapping
+
+
+def _legacy(mapping: dict):
+    pats = [(re.compile(rf"\b{re.escape(k)}\b", re.I), v) for k, v in mapping.items()]
+
+    def run(s: str) -> str:
+        for pat, v in pats:
+            s = pat.sub(v, s)
+        return s
+
+    return run
+
+
+def _single_pass(mapping: dict):
+    pattern, lookup = compile_tech_map(mapping)
+
+    def run(s: str) -> str:
+        return pattern.sub(lambda m: lookup.get(m.group(0).lower(), m.group(0)), s)
+
+    return run
+
+
+def _rate(fn, budget: float) -> float:
+    n, start = 0, time.perf_counter()
+    while time.perf_counter() - start < budget:
+        for b in BULLETS:
+            fn(b)
+        n += len(BULLETS)
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="26,250,1000,5000")
+    parser.add_argument("--budget", type=float, default=0.5, help="seconds per cell")
+    args = parser.parse_args()
+
+    print(f"{'keys':>6} {'legacy/s':>12} {'single/s':>12} {'speedup':>8}")
+    for size in [int(x) for x in args.sizes.split(",")]:
+        mapping = _synthetic_map(size)
+        legacy, single = _legacy(mapping), _single_pass(mapping)
+        assert all(legacy(b) == single(b) for b in BULLETS)
+        lr, sr = _rate(legacy, args.budget), _rate(single, args.budget)
+        print(f"{size:>6} {lr:>12,.0f} {sr:>12,.0f} {sr / lr:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
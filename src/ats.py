@@ -0,0 +1,232 @@
+"""
+ATS-style keyword scoring of built resumes against a job description.
+
+Resumes are tokenized once into a sparse term index: counts are appended to
+compact arrays as resumes are added, then turned into TF-IDF weighted
+postings (term -> resumes) with NumPy. Scoring a job description only walks
+the postings of its own terms, so ranking 100k resumes is a few vectorized
+operations and needs no network access (tokenizing is regex-only, and tech
+terms are recognised with builder's _TECH_MAP vocabulary).
+
+    python -m src.ats --job posting.txt --batch resumes.jsonl [--top 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from src.builder import _TECH_LOOKUP, _TECH_RE
+from src.model import Resume
+
+# One scan per text: a tech term from the vocabulary if one starts here,
+# otherwise a plain word.
+_TOKEN_RE = re.compile(
+    rf"({_TECH_RE.pattern})|([a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*)", flags=re.I
+)
+_TECH_DISPLAY = {v.lower(): v for v in _TECH_LOOKUP.values()}
+
+# Words that carry no signal in resumes or job postings.
+STOPWORDS = frozenset("""
+    a about above across after all also an and any are as at be been being both
+    but by can could did do does doing each etc for from had has have having he
+    her his how i if in into is it its just may me more most my no not of on
+    one or other our out over own per plus same she should so some such than
+    that the their them then there these they this those through to too under
+    up us using very was we were what when where which while who will with
+    within would you your
+    ability able candidate experience experienced familiarity include including
+    knowledge preferred required requirements responsibilities role skills
+    strong team work working year years
+    """.split())
+
+
+def terms(text: str) -> list[str]:
+    """
+    Keywords in ``text``, lowercased, in order: tech terms in their canonical
+    form (so "cli" and "command line" match) and the remaining words.
+    """
+    found = []
+    for tech, word in _TOKEN_RE.findall(text.lower()):
+        if tech:
+            found.append(_TECH_LOOKUP[tech].lower())
+        elif len(word) > 1 and word not in STOPWORDS and not word.isdigit():
+            found.append(word)
+    return found
+
+
+def display(term: str) -> str:
+    return _TECH_DISPLAY.get(term, term)
+
+
+def resume_text(structured) -> str:
+    """The scorable text of a built resume (a Resume or build_resume's dict)."""
+    r = Resume.coerce(structured)
+    parts = []
+    for ed in r.education:
+        parts += [ed.degree, ed.school]
+    for e in r.experience:
+        parts += [e.title, e.company, *e.bullets]
+    for p in r.projects:
+        parts += [p.title, p.tools, *p.bullets]
+    for category, items in r.skills.items():
+        parts += [category, *items]
+    for ex in r.extracurriculars:
+        parts += [ex.title, *ex.bullets]
+    return "\n".join(parts)
+
+
+class TermIndex:
+    """
+    Resume x term counts, appended row by row into flat arrays (CSR layout)
+    and compiled lazily into TF-IDF postings for scoring.
+    """
+
+    def __init__(self):
+        self.vocab: dict[str, int] = {}
+        self.names: list[str] = []
+        self._indptr = array("q", [0])
+        self._indices = array("i")
+        self._counts = array("f")
+        self._postings = None  # compiled on first score after an add
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, structured) -> None:
+        vocab = self.vocab
+        for term, n in Counter(terms(resume_text(structured))).items():
+            self._indices.append(vocab.setdefault(term, len(vocab)))
+            self._counts.append(n)
+        self._indptr.append(len(self._indices))
+        self.names.append(str(name))
+        self._postings = None
+
+    @classmethod
+    def build(cls, items: Iterable[tuple[str, object]]) -> TermIndex:
+        """Index ``(name, built resume)`` pairs."""
+        index = cls()
+        for name, structured in items:
+            index.add(name, structured)
+        return index
+
+    def _compile(self):
+        """
+        Sublinear TF (1 + log count) x smoothed IDF per entry, row norms, and
+        the entries regrouped by term (postings) with a stable sort, so each
+        term's rows stay in ascending order.
+        """
+        if self._postings is not None:
+            return self._postings
+        n = len(self.names)
+        indptr = np.array(self._indptr, dtype=np.int64)
+        indices = np.array(self._indices, dtype=np.int32)
+        counts = np.array(self._counts, dtype=np.float32)
+        rows = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+
+        df = np.bincount(indices, minlength=len(self.vocab))
+        idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+        weights = (1 + np.log(counts)) * idf[indices]
+        norms = np.sqrt(np.bincount(rows, weights=weights**2, minlength=n))
+
+        order = np.argsort(indices, kind="stable")
+        starts = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(df, out=starts[1:])
+        self._postings = (idf, norms, starts, rows[order], weights[order])
+        return self._postings
+
+    def score(self, job_description: str, top: int = 10, keywords: int = 15):
+        """
+        Rank resumes by TF-IDF cosine similarity to ``job_description``.
+        Returns up to ``top`` entries, best first, each with the job's
+        keywords (most important first) the resume matches and misses.
+        """
+        job = Counter(terms(job_description))
+        if not job:
+            raise ValueError("Job description has no scorable keywords")
+        n = len(self.names)
+        if n == 0:
+            return []
+        idf, norms, starts, post_rows, post_weights = self._compile()
+
+        # Query weights; terms no resume has still count towards its norm.
+        unseen_idf = np.log(1 + n) + 1
+        query = []
+        for term, count in job.items():
+            tid = self.vocab.get(term)
+            weight = (1 + np.log(count)) * (idf[tid] if tid is not None else unseen_idf)
+            query.append((float(weight), term, tid))
+        query.sort(key=lambda q: (-q[0], q[1]))
+        q_norm = np.sqrt(sum(w * w for w, _, _ in query))
+
+        dots = np.zeros(n, dtype=np.float64)
+        for weight, _, tid in query:
+            if tid is not None:
+                lo, hi = starts[tid], starts[tid + 1]
+                dots[post_rows[lo:hi]] += weight * post_weights[lo:hi]
+        scores = np.divide(dots, norms * q_norm, out=np.zeros(n), where=norms > 0)
+
+        k = min(top, n)
+        best = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+        best = best[np.lexsort((best, -scores[best]))]
+
+        results = []
+        for rank, row in enumerate(best, start=1):
+            matched, missing = [], []
+            for _, term, tid in query:
+                hit = tid is not None and _has(post_rows, starts, tid, row)
+                (matched if hit else missing).append(display(term))
+            results.append(
+                {
+                    "rank": rank,
+                    "name": self.names[row],
+                    "score": round(float(scores[row]), 4),
+                    "matched": matched[:keywords],
+                    "missing": missing[:keywords],
+                }
+            )
+        return results
+
+
+def _has(post_rows, starts, tid: int, row: int) -> bool:
+    # postings rows are sorted, so membership is a binary search
+    lo, hi = starts[tid], starts[tid + 1]
+    i = lo + np.searchsorted(post_rows[lo:hi], row)
+    return bool(i < hi and post_rows[i] == row)
+
+
+def main(argv=None) -> int:
+    from src.batch import iter_records
+    from src.builder import build_resume
+
+    parser = argparse.ArgumentParser(description="Rank resumes against a job")
+    parser.add_argument("--job", required=True, help="Job description text file")
+    parser.add_argument(
+        "--batch", required=True, metavar="SOURCE", help="Resumes, as for the CLI"
+    )
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--keywords", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    index = TermIndex()
+    for name, raw, error in iter_records(args.batch):
+        if raw is not None:
+            index.add(name, build_resume(raw))
+        else:
+            print(f"skipped {name}: {error}", file=sys.stderr)
+    job = Path(args.job).read_text(encoding="utf-8")
+    for result in index.score(job, top=args.top, keywords=args.keywords):
+        print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""Batch rendering: many raw resumes -> one PDF each, in a single process."""
+
+from __future__ import annotations
+
+import io
+import itertools
+import json
+import logging
+import re
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from src import pdf_cache, profiling
+from src.builder import build_resume, warm_up
+from src.model import Resume
+
+logger = logging.getLogger(__name__)
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+# Streaming reads: characters pulled per read, and the largest single record
+# (in characters) buffered before giving up on a malformed JSON array.
+READ_CHUNK = 1 << 16
+MAX_RECORD_CHARS = 16 << 20
+
+# (name, raw resume or None, error message or None)
+Record = tuple[str, dict | None, str | None]
+
+
+def _safe_name(name: str) -> str:
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", str(name)).strip("._")
+    return name or "resume"
+
+
+def _json_error(exc: Exception) -> str:
+    # json raises RecursionError, not JSONDecodeError, on very deep nesting
+    if isinstance(exc, RecursionError):
+        return "nested too deeply"
+    return getattr(exc, "msg", str(exc))
+
+
+def _iter_jsonl(lines: Iterable[str], stem: str) -> Iterator[Record]:
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        fallback = f"{stem}-{lineno:06d}"
+        try:
+            raw = json.loads(line)
+        except (ValueError, RecursionError) as exc:
+            yield fallback, None, f"line {lineno}: invalid JSON ({_json_error(exc)})"
+            continue
+        yield _record(raw, fallback, f"line {lineno}")
+
+
+def _record(raw, fallback: str, where: str) -> Record:
+    if not isinstance(raw, dict):
+        return fallback, None, f"{where}: expected a JSON object"
+    return _safe_name(raw.get("id") or fallback), raw, None
+
+
+class _TextCursor:
+    """Buffered cursor over a text stream, for incremental JSON decoding."""
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, fh, head: str, pos: int = 0):
+        self.fh, self.buf, self.pos = fh, head, pos
+
+    def _more(self, size: int | None = None) -> bool:
+        # drop what has been consumed so the buffer never outgrows one record
+        chunk = self.fh.read(size or READ_CHUNK)
+        self.buf, self.pos = self.buf[self.pos :] + chunk, 0
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._more():
+                return self.buf[self.pos : self.pos + 1]
+
+    def decode(self):
+        """
+        Decode the value at the cursor. An incomplete value at least doubles
+        the pending text before the next attempt, so a large record costs a
+        linear number of decoded characters, not one retry per chunk. A value
+        ending exactly at the end of the buffer (e.g. a number cut at a chunk
+        boundary) is only accepted once more input or end of input confirms it.
+        """
+        self.peek()
+        while True:
+            pending = len(self.buf) - self.pos
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if pending > MAX_RECORD_CHARS or not self._more(
+                    max(pending, READ_CHUNK)
+                ):
+                    raise
+                continue
+            if end < len(self.buf) or not self._more():
+                self.pos = end
+                return value
+
+
+def _iter_json_array(fh, head: str, stem: str) -> Iterator[Record]:
+    """
+    Decode a top-level JSON array (text ``head`` followed by the rest of
+    ``fh``) one element at a time; memory is bounded by the largest element.
+    A malformed (or too deeply nested) element ends the stream with an error
+    record, since there is no reliable point to resynchronise from.
+    """
+    cursor = _TextCursor(fh, head, head.index("[") + 1)
+    if cursor.peek() == "]":
+        return
+    for index in itertools.count(1):
+        fallback, where = f"{stem}-{index:06d}", f"element {index}"
+        try:
+            raw = cursor.decode()
+        except (json.JSONDecodeError, RecursionError) as exc:
+            yield fallback, None, f"{where}: invalid JSON ({_json_error(exc)})"
+            return
+        yield _record(raw, fallback, where)
+        sep = cursor.peek()
+        if sep == "]":
+            return
+        if sep != ",":
+            yield fallback, None, f"{where}: expected ',' or ']' after element"
+            return
+        cursor.pos += 1
+
+
+def _iter_text(fh, stem: str, single: bool = False) -> Iterator[Record]:
+    """
+    Stream records from ``fh``: a top-level JSON array, otherwise JSONL (or,
+    with ``single``, one JSON object, as in a plain *.json file).
+    """
+    head = fh.read(READ_CHUNK)
+    if head.lstrip().startswith("["):
+        yield from _iter_json_array(fh, head, stem)
+    elif single:
+        try:
+            raw = json.loads(head + fh.read())
+        except (ValueError, RecursionError) as exc:
+            yield stem, None, f"invalid JSON ({_json_error(exc)})"
+            return
+        yield _record(raw, stem, stem)
+    else:
+        # finish the partial last line of ``head`` before handing over to fh
+        lines = itertools.chain(io.StringIO(head + fh.readline()), fh)
+        yield from _iter_jsonl(lines, stem)
+
+
+def _iter_dir(folder: Path) -> Iterator[Record]:
+    for path in sorted(folder.glob("*.json")):
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                raw = json.load(fh)
+        except (OSError, ValueError) as exc:
+            yield _safe_name(path.stem), None, f"{path.name}: {exc}"
+            continue
+        except RecursionError as exc:
+            yield _safe_name(path.stem), None, f"{path.name}: {_json_error(exc)}"
+            continue
+        if not isinstance(raw, dict):
+            yield _safe_name(path.stem), None, f"{path.name}: expected a JSON object"
+            continue
+        yield _safe_name(path.stem), raw, None
+
+
+def iter_records(source: str) -> Iterator[Record]:
+    """
+    Yield raw resumes from a directory of *.json files, a JSONL file, a JSON
+    file holding an array of resumes, or JSONL / a JSON array on stdin ("-").
+    Files are streamed, so memory stays flat however large the input is.
+    Unreadable records are yielded with an error so the batch can report them
+    instead of aborting.
+    """
+    if source == "-":
+        yield from _iter_text(sys.stdin, "stdin")
+        return
+    path = Path(source)
+    if path.is_dir():
+        yield from _iter_dir(path)
+        return
+    suffix = path.suffix.lower()
+    if suffix not in JSONL_SUFFIXES + (".json",):
+        raise ValueError(
+            f"Batch source must be a directory, JSON or JSONL file: {source}"
+        )
+    with path.open("r", encoding="utf-8") as fh:
+        yield from _iter_text(fh, _safe_name(path.stem), single=suffix == ".json")
+
+
+def _unique_stems(records: Iterable[Record]) -> Iterator[Record]:
+    """
+    Suffix repeated names with -2, -3, ... so outputs stay distinct. Every
+    name handed out is remembered, so this is the one part of a batch whose
+    memory grows with input size: one short string per record.
+    """
+    used = set()
+    for name, raw, error in records:
+        stem, n = name, 1
+        while stem in used:  # keep outputs distinct when ids repeat
+            n += 1
+            stem = f"{name}-{n}"
+        used.add(stem)
+        yield stem, raw, error
+
+
+def shard_records(
+    records: Iterable[Record], index: int, count: int
+) -> Iterator[Record]:
+    """
+    Shard ``index`` of ``count``: every ``count``-th record from position
+    ``index``, named as in the full batch. The split depends only on input
+    order, so independent processes (e.g. the pods of an Indexed Job) agree
+    on it, and shard sizes differ by at most one record.
+    """
+    return itertools.islice(_unique_stems(records), index, None, count)
+
+
+def _build_and_write(raw: dict, target, write) -> None:
+    with profiling.stage("build_resume"):
+        resume = Resume.from_raw(build_resume(raw))
+    with profiling.stage("render"):
+        write(resume, target)
+
+
+def render_one(raw: dict, target, write) -> bool | None:
+    """
+    Build and render ``raw`` into ``target`` (a path or binary stream). With
+    $AUTORESUME_PDF_CACHE set, an unchanged input is served from the PDF cache
+    without building anything. Returns whether it was a cache hit (None when
+    no cache is configured).
+    """
+    cache = pdf_cache.from_env()
+    if cache is None:
+        _build_and_write(raw, target, write)
+        return None
+
+    def render(raw: dict) -> bytes:
+        buf = io.BytesIO()
+        _build_and_write(raw, buf, write)
+        return buf.getvalue()
+
+    data, hit = cache.get_or_render(raw, render)
+    if hasattr(target, "write"):
+        target.write(data)
+    else:
+        Path(target).write_bytes(data)
+    return hit
+
+
+def _render_record(record: Record, out_dir: Path, write, suffix: str = ".pdf") -> dict:
+    stem, raw, error = record
+    entry = {"name": stem, "output": None, "ok": False, "error": error}
+    start = time.perf_counter()
+    if raw is not None:
+        out_path = out_dir / f"{stem}{suffix}"
+        try:
+            hit = render_one(raw, out_path, write)
+        except Exception as exc:  # one bad record must not sink the batch
+            logger.exception("Failed to render %s", stem)
+            entry["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            entry.update(output=str(out_path), ok=True)
+            if hit is not None:
+                entry.update(cached=hit, bytes=out_path.stat().st_size)
+    entry["seconds"] = round(time.perf_counter() - start, 4)
+    return entry
+
+
+# ---- worker-process state (one writer + warm tokenizer per worker) ----
+_worker_write = None
+
+
+def _init_worker(make_writer) -> None:
+    global _worker_write
+    _worker_write = make_writer()
+    warm_up()
+
+
+def _render_chunk_in_worker(task: tuple[list[Record], Path, str]) -> list[dict]:
+    records, out_dir, suffix = task
+    return [_render_record(r, out_dir, _worker_write, suffix) for r in records]
+
+
+def iter_render_batch(
+    records: Iterable[Record],
+    out_dir: Path,
+    make_writer: Callable[[], Callable[[dict, Path], None]],
+    workers: int = 1,
+    chunksize: int = 4,
+    suffix: str = ".pdf",
+) -> Iterator[dict]:
+    """
+    Build and render every record into ``out_dir``/<name><suffix>, yielding one
+    summary entry per record, in input order, as soon as it is done.
+    ``make_writer`` is called once per process (the parent when ``workers``
+    is 1, otherwise each pool worker), so per-process setup is paid once.
+    Only a few chunks per worker are in flight at a time, so ``records`` is
+    consumed lazily and memory stays flat for any input size, apart from the
+    output names _unique_stems remembers. Failures are recorded, not raised.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    records = _unique_stems(records)
+    if workers <= 1:
+        write = make_writer()
+        for r in records:
+            yield _render_record(r, out_dir, write, suffix)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, chunksize)
+    chunks = iter(lambda: list(itertools.islice(records, chunksize)), [])
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(make_writer,)
+    ) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(
+                pool.submit(_render_chunk_in_worker, (chunk, out_dir, suffix))
+            )
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def render_batch(
+    records: Iterable[Record],
+    out_dir: Path,
+    make_writer: Callable[[], Callable[[dict, Path], None]],
+    workers: int = 1,
+    chunksize: int = 4,
+    suffix: str = ".pdf",
+) -> list[dict]:
+    """Like :func:`iter_render_batch`, collected into a list."""
+    return list(
+        iter_render_batch(records, out_dir, make_writer, workers, chunksize, suffix)
+    )
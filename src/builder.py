@@ -2,33 +2,372 @@
 # src/builder.py
 # ======================
 
-# --- deps: auto-install + data check ---
+import atexit
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
 try:
-    import nltk
-except ModuleNotFoundError:
-    import subprocess
-    import sys
+    from . import profiling
+except ImportError:  # loaded as a top-level module (python src/questions.py, tests)
+    import profiling
 
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "nltk"])
-    import nltk
+logger = logging.getLogger(__name__)
 
-import re
+# =========================
+# Sentence splitters (punkt is lazy + offline-safe; regex is dependency-free)
+# =========================
 
+# Set AUTORESUME_NLTK_OFFLINE=1 where the image ships its NLTK data: a missing
+# resource then fails fast instead of trying (and hanging on) a download.
+OFFLINE_ENV = "AUTORESUME_NLTK_OFFLINE"
+_PUNKT_RESOURCE = "tokenizers/punkt_tab/english/"
 
-def _ensure_nltk_data():
-    required = {
-        "tokenizers": ["punkt", "punkt_tab"],  # punkt_tab for newer NLTK
-        "taggers": ["averaged_perceptron_tagger"],
+
+def _offline() -> bool:
+    return os.environ.get(OFFLINE_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+@functools.lru_cache(maxsize=1)
+def _punkt_tokenizer():
+    """
+    Load NLTK's punkt tokenizer on first use and keep it for the process.
+    Nothing here runs at import time, and nothing ever pip-installs.
+    """
+    try:
+        import nltk
+        from nltk.tokenize.punkt import PunktTokenizer
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "nltk is not installed; run `pip install -r requirements.txt`"
+        ) from exc
+
+    try:
+        nltk.data.find(_PUNKT_RESOURCE)
+    except LookupError:
+        if _offline():
+            raise RuntimeError(
+                f"NLTK 'punkt_tab' data is missing and {OFFLINE_ENV} is set; "
+                "install it at build time with `python -m nltk.downloader punkt_tab`"
+            ) from None
+        nltk.download("punkt_tab", quiet=True)
+        try:
+            nltk.data.find(_PUNKT_RESOURCE)
+        except LookupError:
+            raise RuntimeError(
+                "NLTK 'punkt_tab' data is missing and could not be downloaded; "
+                "install it with `python -m nltk.downloader punkt_tab`"
+            ) from None
+    return PunktTokenizer("english")
+
+
+def punkt_sent_tokenize(text: str) -> list[str]:
+    return _punkt_tokenizer().tokenize(text or "")
+
+
+# Tokens that end in "." without ending a sentence (compared lowercase, no dot).
+_ABBREVIATIONS = frozenset(
+    {
+        "e.g", "i.e", "etc", "vs", "approx", "incl", "esp", "resp",
+        "mr", "mrs", "ms", "dr", "prof", "jr", "sr", "st",
+        "inc", "ltd", "co", "corp", "dept", "univ", "fig",
+        "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept",
+        "oct", "nov", "dec", "u.s", "u.k",
     }
-    for subdir, packages in required.items():
-        for pkg in packages:
-            try:
-                nltk.data.find(f"{subdir}/{pkg}")
-            except LookupError:
-                nltk.download(pkg)
+)  # fmt: skip
+# Sentence-final punctuation, optional closing quotes/brackets, then whitespace.
+# "3.9" and "node.js" never match (no whitespace after the dot); ";" is kept
+# inside the sentence, as punkt does. A match only starts at the first mark of
+# a run: a later start can't succeed where the first failed, and trying each
+# one made a long run of "!" quadratic.
+_SENT_END = re.compile(r"(?<![.!?])[.!?]+[\"')\]]*\s+")
+
+
+def regex_sent_tokenize(text: str) -> list[str]:
+    """
+    Split resume text into sentences with one compiled regex. Tuned to agree
+    with punkt on resume-style input (abbreviations, initials, version numbers)
+    at a fraction of the cost; see benchmarks/splitter_equivalence.py.
+    """
+    text = text or ""
+    out, start = [], 0
+    for m in _SENT_END.finditer(text):
+        end = m.start()
+        if text.startswith("..", end):
+            continue  # ellipsis: punkt keeps "Grew engagement... Increased" whole
+        i = end
+        while i > start and not text[i - 1].isspace():
+            i -= 1
+        word = text[i:end].lstrip("(\"'").lower()
+        if word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha()):
+            continue  # "e.g. Python", "J. Smith": not a sentence break
+        sent = text[start : m.end()].strip()
+        if sent:
+            out.append(sent)
+        start = m.end()
+    tail = text[start:].strip()
+    if tail:
+        out.append(tail)
+    return out
+
+
+SENTENCE_SPLITTERS = {"punkt": punkt_sent_tokenize, "regex": regex_sent_tokenize}
+# Process-wide default; AUTORESUME_SENT_SPLITTER=regex skips NLTK entirely.
+SPLITTER_ENV = "AUTORESUME_SENT_SPLITTER"
+_default_splitter = None
+
+
+def set_sentence_splitter(splitter) -> None:
+    """Set the default splitter: a SENTENCE_SPLITTERS name, callable, or None."""
+    global _default_splitter
+    if splitter is not None:
+        _resolve_splitter(splitter)  # validate eagerly
+    _default_splitter = splitter
+
+
+def _resolve_splitter(splitter=None):
+    if splitter is None:
+        splitter = _default_splitter or os.environ.get(SPLITTER_ENV) or "punkt"
+    if callable(splitter):
+        return splitter
+    try:
+        return SENTENCE_SPLITTERS[splitter]
+    except KeyError:
+        raise ValueError(
+            f"Unknown sentence splitter {splitter!r}; "
+            f"choose from {sorted(SENTENCE_SPLITTERS)}"
+        ) from None
+
+
+def _sent_tokenize(text: str, splitter=None) -> list[str]:
+    with profiling.stage("tokenize"):
+        sents = _resolve_splitter(splitter)(text or "")
+    profiling.count("sentences_split", len(sents))
+    return sents
+
+
+def warm_up() -> None:
+    """Load the sentence tokenizer now instead of on the first bullet."""
+    if _resolve_splitter() is not punkt_sent_tokenize:
+        return
+    try:
+        _punkt_tokenizer()
+    except RuntimeError as exc:  # surfaced again, per record, on first real use
+        logger.warning("Tokenizer warm-up failed: %s", exc)
+
+
+# =========================
+# Rewrite cache (in-process LRU + optional SQLite store)
+# =========================
+
+# Point AUTORESUME_REWRITE_CACHE at a SQLite file to share rewrites across runs.
+REWRITE_CACHE_ENV = "AUTORESUME_REWRITE_CACHE"
+# Bump when rewrite *logic* changes; rule-table edits are picked up by the hash.
+_REWRITE_LOGIC_VERSION = 2  # 2: summaries and fields are length-capped
+
+
+def rules_version() -> str:
+    """
+    "v<logic>-<hash of the rule tables>"; a change invalidates stored
+    rewrites. The logic prefix lets a store drop entries made by older code
+    without touching those of other rules files in use.
+    """
+    tables = {
+        "logic": _REWRITE_LOGIC_VERSION,
+        "ACTION_VERBS": sorted(ACTION_VERBS),
+        "WEAK_PREFIXES": WEAK_PREFIXES,
+        "PASSIVE_TO_ACTIVE": PASSIVE_TO_ACTIVE,
+        "TASKED_PREFIXES": TASKED_PREFIXES,
+        "LEADING_FILLER": LEADING_FILLER,
+        "REPEATED_GERUNDS": REPEATED_GERUNDS,
+        "IMPACT_RULES": IMPACT_RULES,
+        "DEFAULT_IMPACT": DEFAULT_IMPACT,
+        "config": _RULES_CONFIG,
+        "_TECH_MAP": _TECH_MAP,
+        "IRREGULAR_PAST": IRREGULAR_PAST,
+    }
+    blob = json.dumps(tables, sort_keys=True).encode("utf-8")
+    return f"v{_REWRITE_LOGIC_VERSION}-{hashlib.sha256(blob).hexdigest()[:16]}"
+
+
+class RewriteCache:
+    """
+    Size-bounded LRU of sentence rewrites, keyed on (kind, normalized
+    sentence). With ``path`` set, misses fall through to a SQLite store that
+    is versioned by ``rules_version()`` and shared across runs and processes.
+    The store runs in WAL mode and commits after every build_resume, so
+    writers hold its lock only briefly; it keeps at most ``max_rows`` rows,
+    dropping the oldest first, and never stores keys over MAX_KEY_CHARS.
+    """
+
+    _FLUSH_EVERY = 32
+    MAX_KEY_CHARS = 2000
+    DEFAULT_MAX_ROWS = 200_000
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        path: str | None = None,
+        max_rows: int = DEFAULT_MAX_ROWS,
+    ):
+        self.maxsize = maxsize
+        self.path = path
+        self.max_rows = max_rows
+        self.hits = self.disk_hits = self.misses = 0
+        self._mem: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+        self._pending = self._inserted = 0
+        self._version = None
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = rules_version()
+        return self._version
+
+    def _conn(self):
+        # Connections never cross a fork: each process opens its own.
+        if not self.path:
+            return None
+        if self._db is None or self._db_pid != os.getpid():
+            import sqlite3
+
+            db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")  # readers never wait on writers
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS rewrites (version TEXT, kind TEXT, "
+                "key TEXT, value TEXT, PRIMARY KEY (version, kind, key))"
+            )
+            # Only rewrites from older rewrite logic ("v<n>-" prefix) are
+            # dropped here; other rules files' entries may be in use elsewhere
+            # and age out via max_rows instead.
+            db.execute(
+                "DELETE FROM rewrites WHERE CAST(substr(version, 2, "
+                "instr(version, '-') - 2) AS INTEGER) < ?",
+                (_REWRITE_LOGIC_VERSION,),
+            )
+            db.commit()
+            self._db, self._db_pid, self._pending = db, os.getpid(), 0
+            self._prune()
+            atexit.register(self.flush)
+        return self._db
+
+    def get(self, kind: str, key: str, compute) -> str:
+        with self._lock:
+            k = (kind, key)
+            if k in self._mem:
+                self._mem.move_to_end(k)
+                self.hits += 1
+                return self._mem[k]
+            db = self._conn()
+            row = None
+            if db is not None:
+                row = db.execute(
+                    "SELECT value FROM rewrites WHERE version=? AND kind=? AND key=?",
+                    (self.version, kind, key),
+                ).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                value = row[0]
+            else:
+                self.misses += 1
+                value = compute(key)
+                if db is not None and len(key) <= self.MAX_KEY_CHARS:
+                    db.execute(
+                        "INSERT OR IGNORE INTO rewrites VALUES (?, ?, ?, ?)",
+                        (self.version, kind, key, value),
+                    )
+                    self._pending += 1
+                    if self._pending >= self._FLUSH_EVERY:
+                        self._commit()
+            if self.maxsize > 0:
+                self._mem[k] = value
+                if len(self._mem) > self.maxsize:
+                    self._mem.popitem(last=False)
+            return value
+
+    def _commit(self) -> None:
+        self._db.commit()
+        self._inserted += self._pending
+        self._pending = 0
+        if self._inserted >= max(self._FLUSH_EVERY, self.max_rows // 10):
+            self._prune()
+
+    def _prune(self) -> None:
+        # rowids grow with each insert, so the lowest are the oldest rows
+        db, self._inserted = self._db, 0
+        (rows,) = db.execute("SELECT count(*) FROM rewrites").fetchone()
+        if rows > self.max_rows:
+            db.execute(
+                "DELETE FROM rewrites WHERE rowid IN "
+                "(SELECT rowid FROM rewrites ORDER BY rowid LIMIT ?)",
+                (rows - self.max_rows,),
+            )
+            db.commit()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._db is not None and self._db_pid == os.getpid() and self._pending:
+                self._commit()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (
+                round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0
+            ),
+            "size": len(self._mem),
+            "maxsize": self.maxsize,
+            "path": self.path,
+            "version": self.version,
+        }
+
 
+_REWRITE_CACHE = RewriteCache(path=os.environ.get(REWRITE_CACHE_ENV) or None)
+
+
+def configure_rewrite_cache(
+    maxsize: int = 4096, path: str | None = None
+) -> RewriteCache:
+    """Replace the process-wide rewrite cache (``maxsize=0`` disables the LRU)."""
+    global _REWRITE_CACHE
+    _REWRITE_CACHE.flush()
+    _REWRITE_CACHE = RewriteCache(maxsize=maxsize, path=path)
+    return _REWRITE_CACHE
+
+
+def rewrite_cache_stats() -> dict:
+    return _REWRITE_CACHE.stats()
+
+
+def _cached(kind: str, normalize=lambda s: s):
+    """
+    Memoize a str -> str rewrite through the process-wide cache. ``normalize``
+    must not change the result (e.g. only strip what the rewrite strips anyway).
+    """
+
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(s):
+            return _REWRITE_CACHE.get(kind, normalize(s or ""), fn)
+
+        wrapper.uncached = fn
+        return wrapper
+
+    return deco
 
-_ensure_nltk_data()
 
 # =========================
 # Rewrite helpers
@@ -93,7 +432,48 @@ PASSIVE_TO_ACTIVE = [
     ),
 ]
 
+# "I was tasked with ..." openers, dropped before a leading gerund is promoted.
+TASKED_PREFIXES = [
+    r"^(i|we)\s+(was|were)\s+tasked\s+(with|to)\s+",
+    r"^was\s+tasked\s+(with|to)\s+",
+]
+
+# Naked auxiliaries and pronouns, dropped before WEAK_PREFIXES.
+LEADING_FILLER = [r"^(was|were)\s+", r"^(i|we)\s+"]
+
+# "..., managing X" after the main verb reads better as "... and X".
+REPEATED_GERUNDS = [
+    (r"\b,\s*managing\b\s+", " and "),
+    (r"\b,\s*creating\b\s+", " and "),
+]
+
+# (impact phrase, keywords): the first category with a keyword in the text wins.
+IMPACT_RULES = [
+    (
+        "increasing test coverage",
+        ["test", "qa", "pytest", "selenium", "coverage", "unit"],
+    ),
+    ("enhancing usability", ["website", "page", "ui", "ux", "portfolio"]),
+    ("improving audience engagement", ["social", "engagement", "content"]),
+    (
+        "reducing manual effort",
+        [
+            "pipeline",
+            "deploy",
+            "github actions",
+            "jenkins",
+            "automation",
+            "cli",
+            "script",
+        ],
+    ),
+]
+DEFAULT_IMPACT = "improving reliability"
+
 TECH_SPLIT = r"(?:using|with|in|via|through)\s+(.+)$"
+# DOTALL: "(.+)$" then runs to the end in one step even if a newline slipped
+# through, instead of backtracking over the line at every candidate keyword.
+_TECH_SPLIT_RE = re.compile(TECH_SPLIT, flags=re.I | re.S)
 
 _TECH_MAP = {
     "python": "Python",
@@ -125,12 +505,78 @@ _TECH_MAP = {
 }
 
 
+def _trie_pattern(words) -> str:
+    """
+    Build a regex alternation shaped like a prefix trie of ``words``.
+    Shared prefixes are factored out so each position is walked once, and
+    greedy optional tails make the longest key win ("github actions" > "github").
+    """
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-key marker
+
+    def walk(node: dict) -> str:
+        alts = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return walk(trie)
+
+
+def compile_tech_map(mapping: dict) -> tuple[re.Pattern, dict]:
+    """
+    Compile a tech map into one case-insensitive pattern + lowercase lookup,
+    so a bullet is normalized in a single scan however large the map grows.
+    """
+    lookup = {k.lower(): v for k, v in mapping.items() if k}
+    if not lookup:
+        return re.compile(r"(?!)"), lookup
+    return re.compile(r"\b" + _trie_pattern(lookup) + r"\b", flags=re.I), lookup
+
+
+_TECH_RE, _TECH_LOOKUP = compile_tech_map(_TECH_MAP)
+
+
+def _tech_repl(m: re.Match) -> str:
+    return _TECH_LOOKUP.get(m.group(0).lower(), m.group(0))
+
+
 def _normalize_tech_in_text(s: str) -> str:
-    for k, v in _TECH_MAP.items():
-        s = re.sub(rf"\b{re.escape(k)}\b", v, s, flags=re.I)
+    s, n = _TECH_RE.subn(_tech_repl, s)
+    profiling.count("tech_substitutions", n)
+    profiling.count("bullets_rewritten")
     return s
 
 
+# Longest text the rewrite rules read from one field. The patterns are all
+# linear-time; the caps bound what one pasted blob can cost on top of that.
+# Longer input is cut at a word boundary (counted as "fields_truncated").
+MAX_SUMMARY_CHARS = 4000
+MAX_FIELD_CHARS = 300
+
+
+def _capped(text, limit: int) -> str:
+    # raw JSON fields may be null (or numbers): treat them like the "" default
+    text = str(text or "")
+    if len(text) <= limit:
+        return text
+    profiling.count("fields_truncated")
+    logger.debug("Truncated a %d-character field to %d", len(text), limit)
+    head = text[:limit]
+    if not head[-1:].isspace() and not text[limit].isspace():
+        words = head.rsplit(None, 1)  # drop the word cut in two
+        if len(words) == 2:
+            head = words[0]
+    return head.rstrip()
+
+
 def _clean_sentence(s: str) -> str:
     s = s.strip()
     s = re.sub(r"\s+", " ", s)
@@ -138,9 +584,18 @@ def _clean_sentence(s: str) -> str:
     return s
 
 
+# Patterns that may start on whitespace only match from the start of a
+# whitespace run ("(?<!\s)"): a later start in the run can't succeed where the
+# first failed, and retrying from each one made long runs of spaces quadratic.
+_TECH_LIST_SEP = re.compile(r"(?:(?<!\s)\s+)?,\s*|(?<!\s)\s+and\s+")
+_DATE_COMMA = re.compile(r"(?:(?<!\s)\s+)?,\s*")
+_DATE_DASH = re.compile(r"(?:(?<!\s)\s+)?[-–—]\s*")
+
+
+@_cached("tech")
 def _capitalize_tech(s: str) -> str:
     tech = []
-    for t in re.split(r"\s*,\s*|\s+and\s+", s):
+    for t in _TECH_LIST_SEP.split(s):
         t = t.strip()
         if not t:
             continue
@@ -188,69 +643,183 @@ def _to_past(word: str) -> str:
     return w + "ed"
 
 
-def _promote_tasked_phrases(s: str) -> str:
-    s = re.sub(r"^(i|we)\s+(was|were)\s+tasked\s+(with|to)\s+", "", s, flags=re.I)
-    s = re.sub(r"^was\s+tasked\s+(with|to)\s+", "", s, flags=re.I)
-    m = re.match(r"^([a-z]+)ing\b(.*)$", s, flags=re.I)
-    if m:
-        first = _to_past(m.group(1)).capitalize()
-        rest = m.group(2)
-        s = f"{first}{rest}"
-    return s
+# =========================
+# Rule program (the rewrite tables, compiled once)
+# =========================
 
+# Point AUTORESUME_RULES at a JSON file to extend the tables without code
+# changes: {"action_verbs": ["mentored"], "impact": {"phrase": ["keyword"]}}.
+RULES_ENV = "AUTORESUME_RULES"
 
-def _dedupe_repeated_gerunds(s: str) -> str:
-    s = re.sub(r"\b,\s*managing\b\s+", " and ", s, flags=re.I)
-    s = re.sub(r"\b,\s*creating\b\s+", " and ", s, flags=re.I)
-    return s
+_GERUND_LEAD = re.compile(r"^([a-z]+)ing\b(.*)$", flags=re.I)
+_CASED_GERUND_LEAD = re.compile(r"^([A-Za-z]+)ing\b(.*)$")
+
+
+class RuleProgram(NamedTuple):
+    verbs: frozenset
+    verb_search: re.Pattern  # first action verb anywhere, as a whole word
+    verb_lead: re.Pattern  # text already opens with an action verb
+    tasked: tuple  # compiled TASKED_PREFIXES
+    passes: tuple  # (pattern, replacement), applied in order
+    impact: tuple  # (phrase, keywords), in priority order
 
 
+def load_rules(path: str | None) -> dict:
+    """
+    Read a rules file: extra "action_verbs" (a list) and "impact" categories
+    (phrase -> keywords; a known phrase gains keywords, a new one is checked
+    after the built-in categories). No path means no extra rules.
+    """
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as fh:
+        config = json.load(fh)
+    if not isinstance(config, dict):
+        raise ValueError(f"Rules file must hold a JSON object: {path}")
+    unknown = sorted(set(config) - {"action_verbs", "impact"})
+    if unknown:
+        raise ValueError(f"Unknown rule tables in {path}: {', '.join(unknown)}")
+    verbs = config.get("action_verbs", [])
+    impact = config.get("impact", {})
+    if not (
+        isinstance(verbs, list)
+        and all(isinstance(v, str) for v in verbs)
+        and isinstance(impact, dict)
+        and all(
+            isinstance(kw, list) and all(isinstance(k, str) for k in kw)
+            for kw in impact.values()
+        )
+    ):
+        raise ValueError(
+            f"Rules file wants a list of action_verbs and impact phrase -> "
+            f"keyword lists: {path}"
+        )
+    return config
+
+
+def compile_rules(extra: dict | None = None) -> RuleProgram:
+    """
+    Compile the rule tables (plus ``extra`` from load_rules) into precompiled
+    patterns, so a rewrite never joins or compiles a pattern. Action verbs
+    become one trie-shaped alternation, however many there are.
+    """
+    extra = extra or {}
+    verbs = frozenset(ACTION_VERBS) | {
+        v.strip().lower() for v in extra.get("action_verbs", []) if v.strip()
+    }
+    impact = {phrase: list(keywords) for phrase, keywords in IMPACT_RULES}
+    for phrase, keywords in extra.get("impact", {}).items():
+        impact.setdefault(phrase, []).extend(k.lower() for k in keywords if k)
+    passes = [(p, "") for p in LEADING_FILLER + WEAK_PREFIXES]
+    passes += PASSIVE_TO_ACTIVE + REPEATED_GERUNDS
+    alternation = _trie_pattern(verbs)
+    return RuleProgram(
+        verbs=verbs,
+        verb_search=re.compile(rf"\b({alternation})\b", flags=re.I),
+        verb_lead=re.compile(rf"(?:{alternation})\b", flags=re.I),
+        tasked=tuple(re.compile(p, flags=re.I) for p in TASKED_PREFIXES),
+        passes=tuple((re.compile(p, flags=re.I), rep) for p, rep in passes),
+        impact=tuple((phrase, tuple(kw)) for phrase, kw in impact.items()),
+    )
+
+
+_RULES_CONFIG = load_rules(os.environ.get(RULES_ENV))
+_RULES = None  # compiled on first use, so importing the builder stays cheap
+_RULES_LOCK = threading.Lock()
+
+
+def _rules() -> RuleProgram:
+    global _RULES
+    rules = _RULES
+    if rules is None:
+        with _RULES_LOCK:  # threads racing the first build compile once
+            if _RULES is None:
+                _RULES = compile_rules(_RULES_CONFIG)
+            rules = _RULES
+    return rules
+
+
+def configure_rules(path: str | None = None) -> RuleProgram:
+    """Recompile the process-wide rule program with the rules file at ``path``."""
+    global _RULES, _RULES_CONFIG
+    config = load_rules(path)
+    with _RULES_LOCK:
+        _RULES_CONFIG, _RULES = config, compile_rules(config)
+    # rewrites cached under the old rules are stale
+    configure_rewrite_cache(_REWRITE_CACHE.maxsize, _REWRITE_CACHE.path)
+    return _RULES
+
+
+@contextlib.contextmanager
+def configured(
+    splitter=None,
+    rules: str | None = None,
+    rewrite_cache: str | None = None,
+    rewrite_cache_size: int | None = None,
+):
+    """
+    Use a sentence splitter, rules file and/or rewrite cache (a SQLite path
+    and/or LRU size, see configure_rewrite_cache) inside a with-block, then
+    put back the process-wide settings in place before it, so a caller (e.g.
+    cli.main run as a library) leaves nothing behind.
+    """
+    global _default_splitter, _RULES_CONFIG, _RULES, _REWRITE_CACHE
+    saved = _default_splitter, _RULES_CONFIG, _RULES, _REWRITE_CACHE
+    try:
+        if splitter:
+            set_sentence_splitter(splitter)
+        if rules:
+            configure_rules(rules)
+        if rewrite_cache or rewrite_cache_size is not None:
+            size = 4096 if rewrite_cache_size is None else rewrite_cache_size
+            configure_rewrite_cache(size, rewrite_cache)
+        yield
+    finally:
+        _REWRITE_CACHE.flush()
+        _default_splitter, _RULES_CONFIG, _RULES, _REWRITE_CACHE = saved
+
+
+@_cached("opening", normalize=str.strip)
 def _strong_opening(s: str) -> str:
+    rules = _rules()
     s = s.strip()
-    s = _promote_tasked_phrases(s)
-    s = re.sub(r"^(was|were)\s+", "", s, flags=re.I)  # drop naked auxiliaries
-    s = re.sub(r"^(i|we)\s+", "", s, flags=re.I)  # drop pronouns
-    for pat in WEAK_PREFIXES:
-        s = re.sub(pat, "", s, flags=re.I)
-    for pat, rep in PASSIVE_TO_ACTIVE:
-        s = re.sub(pat, rep, s, flags=re.I)
-    s = _dedupe_repeated_gerunds(s)
-
-    m = re.match(r"^([A-Za-z]+)ing\b(.*)$", s)  # creating → Created
+    for pat in rules.tasked:
+        s = pat.sub("", s)
+    m = _GERUND_LEAD.match(s)
+    if m:
+        s = _to_past(m.group(1)).capitalize() + m.group(2)
+    for pat, rep in rules.passes:
+        s = pat.sub(rep, s)
+
+    m = _CASED_GERUND_LEAD.match(s)  # creating → Created
     if m:
         s = _to_past(m.group(1)).capitalize() + m.group(2)
 
     words = s.split()
-    if words and words[0].lower() not in ACTION_VERBS:
-        m = re.search(r"\b(" + "|".join(ACTION_VERBS) + r")\b", s, flags=re.I)
+    if words and words[0].lower() not in rules.verbs:
+        m = rules.verb_search.search(s)
         if m:
-            verb = m.group(1)
-            s = (
-                verb.capitalize()
-                + " "
-                + re.sub(
-                    r".*?\b" + re.escape(verb) + r"\b", "", s, count=1, flags=re.I
-                ).strip()
-            )
+            # Lead with the verb, dropping what precedes it on its line.
+            line = s.rfind("\n", 0, m.start()) + 1
+            s = m.group(1).capitalize() + " " + (s[:line] + s[m.end() :]).strip()
 
     # If we still didn't land on a verb-led opening, use a neutral "Delivered ..."
-    if not re.match(r"^(" + "|".join(ACTION_VERBS) + r")\b", s, flags=re.I):
+    if not rules.verb_lead.match(s):
         s = "Delivered " + s
 
     return s[0:1].upper() + s[1:] if s else s
 
 
 # generic fallback (kept for dev/testing)
-def rewrite_to_resume_bullets(summary: str) -> list[str]:
-    from nltk.tokenize import sent_tokenize
-
+def rewrite_to_resume_bullets(summary: str, splitter=None) -> list[str]:
+    summary = _capped(summary, MAX_SUMMARY_CHARS)
     bullets = []
-    for sent in sent_tokenize(summary or ""):
+    for sent in _sent_tokenize(summary, splitter):
         sent = _clean_sentence(sent)
         if not sent:
             continue
         tech = None
-        m = re.search(TECH_SPLIT, sent, flags=re.I)
+        m = _TECH_SPLIT_RE.search(sent)
         if m:
             tech = _capitalize_tech(m.group(1))
             sent = sent[: m.start()].strip()
@@ -284,47 +853,36 @@ _RESULT_PHRASES = [
 ]
 
 
+@_cached("impact", normalize=str.lower)
 def _pick_impact(text: str) -> str:
     t = (text or "").lower()
-    if any(w in t for w in ["test", "qa", "pytest", "selenium", "coverage", "unit"]):
-        return "increasing test coverage"
-    if any(w in t for w in ["website", "page", "ui", "ux", "portfolio"]):
-        return "enhancing usability"
-    if "social" in t or "engagement" in t or "content" in t:
-        return "improving audience engagement"
-    if any(
-        w in t
-        for w in [
-            "pipeline",
-            "deploy",
-            "github actions",
-            "jenkins",
-            "automation",
-            "cli",
-            "script",
-        ]
-    ):
-        return "reducing manual effort"
-    return "improving reliability"
+    # Plain substring tests: at this table size they beat one combined scan.
+    for phrase, keywords in _rules().impact:
+        for w in keywords:
+            if w in t:
+                return phrase
+    return DEFAULT_IMPACT
 
 
 def _tools_phrase_for(val):
     if not val:
         return ""
-    if isinstance(val, str):
-        cleaned = _capitalize_tech(val)
-    else:
-        cleaned = _capitalize_tech(", ".join([str(x) for x in val if x]))
+    if not isinstance(val, str):
+        val = ", ".join([str(x) for x in val if x])
+    cleaned = _capitalize_tech(_capped(val, MAX_FIELD_CHARS))
     return f" using {cleaned}" if cleaned else ""
 
 
 def make_star_bullets(
-    summary: str, role: str = "", org: str = "", tools=None
+    summary: str, role: str = "", org: str = "", tools=None, splitter=None
 ) -> list[str]:
-    from nltk.tokenize import sent_tokenize
-
+    summary, role = _capped(summary, MAX_SUMMARY_CHARS), _capped(role, MAX_FIELD_CHARS)
+    if isinstance(tools, str):
+        tools = _capped(tools, MAX_FIELD_CHARS)
     sents = [
-        _clean_sentence(s) for s in sent_tokenize(summary or "") if _clean_sentence(s)
+        _clean_sentence(s)
+        for s in _sent_tokenize(summary, splitter)
+        if _clean_sentence(s)
     ]
     joined = " ".join(sents)
 
@@ -340,11 +898,14 @@ def make_star_bullets(
     return [b1, b2, b3]
 
 
-def make_xyz_bullets(summary: str, tools=None, max_bullets: int = 2) -> list[str]:
-    from nltk.tokenize import sent_tokenize
-
+def make_xyz_bullets(
+    summary: str, tools=None, max_bullets: int = 2, splitter=None
+) -> list[str]:
+    summary = _capped(summary, MAX_SUMMARY_CHARS)
     sents = [
-        _clean_sentence(s) for s in sent_tokenize(summary or "") if _clean_sentence(s)
+        _clean_sentence(s)
+        for s in _sent_tokenize(summary, splitter)
+        if _clean_sentence(s)
     ]
     if not sents:
         return []
@@ -377,8 +938,9 @@ def make_xyz_bullets(summary: str, tools=None, max_bullets: int = 2) -> list[str
 def _normalize_date_range(s: str) -> str:
     if not s:
         return s
-    s = re.sub(r"\s*,\s*", " ", s)  # "Jun,2025" -> "Jun 2025"
-    s = re.sub(r"\s*[-–—]\s*", " – ", s)  # normalize dash to en dash
+    s = _capped(s, MAX_FIELD_CHARS)
+    s = _DATE_COMMA.sub(" ", s)  # "Jun,2025" -> "Jun 2025"
+    s = _DATE_DASH.sub(" – ", s)  # normalize dash to en dash
     s = re.sub(r"\bpresent\b", "Present", s, flags=re.I)
     s = re.sub(r"\s+", " ", s).strip()
     return s
@@ -389,24 +951,10 @@ def _normalize_date_range(s: str) -> str:
 # =========================
 
 
-def build_resume(raw: dict) -> dict:
-    """
-    Turn raw input from questions.py into structured, bullet-ready data for the PDF.
-      - Experience   → STAR (3 bullets)
-      - Projects     → XYZ  (≤2 bullets)
-      - Extracurrics → XYZ  (≤2 bullets)
-    """
-    structured = {
-        "contact": raw.get("contact", {}),
-        "education": raw.get("education", []),
-        "skills": raw.get("skills", {}),
-        "experience": [],
-        "projects": [],
-        "extracurriculars": [],
-    }
-
-    # --- Experiences → STAR ---
-    for exp in raw.get("experience", []):
+def _experience_section(entries, splitter=None) -> list:
+    # Experiences → STAR
+    out = []
+    for exp in entries:
         source_text = " ".join(exp.get("bullets", [])) or exp.get("summary", "") or ""
         bullets = (
             make_star_bullets(
@@ -414,12 +962,13 @@ def build_resume(raw: dict) -> dict:
                 role=exp.get("title", ""),
                 org=exp.get("company", ""),
                 tools=exp.get("tools") or exp.get("stack") or exp.get("tech"),
+                splitter=splitter,
             )
             if source_text
             else []
         )
 
-        structured["experience"].append(
+        out.append(
             {
                 "title": exp.get("title", ""),
                 "company": exp.get("company", ""),
@@ -428,21 +977,25 @@ def build_resume(raw: dict) -> dict:
                 "bullets": bullets[:3],
             }
         )
+    return out
+
 
-    # --- Projects → XYZ ---
-    for proj in raw.get("projects", []):
+def _projects_section(entries, splitter=None) -> list:
+    # Projects → XYZ
+    out = []
+    for proj in entries:
         source_text = (
             " ".join(proj.get("bullets", []))
             or proj.get("summary", "")
             or proj.get("title", "")
         )
         bullets = (
-            make_xyz_bullets(source_text, tools=proj.get("tools"))
+            make_xyz_bullets(source_text, tools=proj.get("tools"), splitter=splitter)
             if source_text
             else []
         )
 
-        structured["projects"].append(
+        out.append(
             {
                 "title": proj.get("title", ""),
                 "tools": proj.get("tools", ""),
@@ -450,25 +1003,74 @@ def build_resume(raw: dict) -> dict:
                 "bullets": bullets[:2],
             }
         )
+    return out
 
-    # --- Extracurriculars → XYZ ---
-    for ex in raw.get("extracurriculars", []):
+
+def _extracurriculars_section(entries, splitter=None) -> list:
+    # Extracurriculars → XYZ
+    out = []
+    for ex in entries:
         source_text = (
             " ".join(ex.get("bullets", []))
             or ex.get("summary", "")
             or ex.get("description", "")
             or ex.get("title", "")
         )
-        bullets = make_xyz_bullets(source_text, tools=None) if source_text else []
+        bullets = (
+            make_xyz_bullets(source_text, tools=None, splitter=splitter)
+            if source_text
+            else []
+        )
 
-        structured["extracurriculars"].append(
+        out.append(
             {
                 "title": ex.get("title", ""),
                 "dates": _normalize_date_range(ex.get("dates", ex.get("date", ""))),
                 "bullets": bullets[:2],
             }
         )
+    return out
+
+
+# Structured key -> (type of the value when missing from raw, section builder
+# or None for sections that pass through unchanged), in output order.
+SECTIONS = {
+    "contact": (dict, None),
+    "education": (list, None),
+    "skills": (dict, None),
+    "experience": (list, _experience_section),
+    "projects": (list, _projects_section),
+    "extracurriculars": (list, _extracurriculars_section),
+}
+
+
+def build_section(key: str, value, splitter=None):
+    """
+    Build one section of build_resume's output from its raw ``value``, e.g.
+    as soon as that part of the input is known. Flushes like build_resume.
+    """
+    _, build = SECTIONS[key]
+    if build is None:
+        return value
+    out = build(value, splitter)
+    _REWRITE_CACHE.flush()
+    return out
+
+
+def build_resume(raw: dict, splitter=None) -> dict:
+    """
+    Turn raw input from questions.py into structured, bullet-ready data for the PDF.
+      - Experience   → STAR (3 bullets)
+      - Projects     → XYZ  (≤2 bullets)
+      - Extracurrics → XYZ  (≤2 bullets)
+    ``splitter`` picks the sentence splitter for this call (see SENTENCE_SPLITTERS).
+    """
+    structured = {}
+    for key, (default, build) in SECTIONS.items():
+        value = raw[key] if key in raw else default()
+        structured[key] = value if build is None else build(value, splitter)
 
+    _REWRITE_CACHE.flush()  # pool workers exit without running atexit hooks
     return structured
 
 
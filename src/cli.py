@@ -1,78 +1,494 @@
-"""CLI to generate a resume PDF from JSON input (robust import)."""
+"""
+CLI to generate resume PDFs from JSON input.
+
+Startup is kept cheap for short-lived job pods: only argument handling is
+imported up front, and the batch, rendering and reportlab modules load in
+the stage that needs them (see test_cli_cold_start_stays_within_budget).
+"""
 
 from __future__ import annotations
 
 import argparse
-import importlib
-import inspect
+import contextlib
+import functools
+import itertools
 import json
 import logging
+import os
+import sys
 from pathlib import Path
 
-from src.builder import build_resume
+from src import profiling
+from src.builder import (
+    REWRITE_CACHE_ENV,
+    RULES_ENV,
+    SENTENCE_SPLITTERS,
+    SPLITTER_ENV,
+    configured,
+    load_rules,
+    rewrite_cache_stats,
+)
+from src.fonts import FONT_ENV, parse_spec
+from src.formats import (
+    FORMATS,
+    RENDERERS,
+    output_paths,
+    parse_formats,
+    render_formats,
+    write_formats,
+)
+from src.pdf_cache import (
+    CACHE_DIR_ENV,
+    CACHE_MAX_MB_ENV,
+    FIT_ENV,
+    REPRODUCIBLE_ENV,
+    from_env,
+)
 
 logger = logging.getLogger(__name__)
 
+# Set by Kubernetes in each pod of an Indexed Job.
+SHARD_INDEX_ENV = "JOB_COMPLETION_INDEX"
+
+
+def _default_writer():
+    """
+    Return ``write(resume, target)`` where target is a path or a binary
+    stream. Module-level (picklable), so pool workers can build their own.
+    """
+    from src.pdf_generator import render_pdf
+
+    def write(resume: dict, target) -> None:
+        if hasattr(target, "write"):
+            render_pdf(resume, target)
+        else:
+            Path(target).write_bytes(render_pdf(resume))
+
+    return write
+
 
-def _resolve_pdf_callable():
+def _formats_writer(formats: tuple[str, ...]):
     """
-    Find a callable in src.pdf_generator that can produce a PDF.
-    Tries common func names; falls back to PDFGenerator class.
+    Like _default_writer, but renders every format in ``formats`` from the
+    one build: the first to the target path, the rest next to it with their
+    own suffix (see formats.output_paths). A stream gets the first format.
     """
-    mod = importlib.import_module("src.pdf_generator")
 
-    for name in ("generate_pdf", "create_pdf", "write_pdf", "build_pdf", "render_pdf"):
-        fn = getattr(mod, name, None)
-        if callable(fn):
-            return fn
+    def write(resume, target) -> None:
+        if hasattr(target, "write"):
+            target.write(render_formats(resume, formats[:1])[formats[0]])
+        else:
+            write_formats(resume, target, formats)
+
+    return write
+
+
+def _cache_summary(hits: int, misses: int, bytes_saved: int) -> dict | None:
+    # Counted from the per-record entries so pool workers' hits are included.
+    if not hits + misses:
+        return None
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / (hits + misses), 4),
+        "bytes_saved": bytes_saved,
+    }
+
+
+def _write_summary(path: str, summary: dict, records) -> None:
+    """Write ``summary`` with a "records" list copied from JSON lines."""
+    head = json.dumps(summary, indent=2)[: -len("\n}")]
+    with Path(path).open("w", encoding="utf-8") as out:
+        out.write(head + ',\n  "records": [')
+        for i, line in enumerate(records):
+            out.write(("," if i else "") + "\n    " + line.rstrip("\n"))
+        out.write("\n  ]\n}\n")
+
+
+def _shard_arg(spec: str) -> tuple[int, int]:
+    """
+    argparse type for --shard: "INDEX/COUNT", or just "COUNT" with the
+    index taken from $JOB_COMPLETION_INDEX.
+    """
+    index, sep, count = spec.rpartition("/")
+    if not sep:
+        index = os.environ.get(SHARD_INDEX_ENV)
+        if index is None:
+            raise argparse.ArgumentTypeError(
+                f"{spec!r} has no INDEX/ and ${SHARD_INDEX_ENV} is not set"
+            )
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected INDEX/COUNT, got {spec!r}")
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"need 0 <= INDEX < COUNT, got {spec!r}")
+    return index, count
+
+
+def _merge_summaries(paths) -> dict:
+    """
+    Merge the --summary files of the shards of one batch. Records are put
+    back in input order and tagged with their shard; "shards" lists what
+    each shard rendered and which shards have not reported. With a shard
+    missing, input order can't be rebuilt (its records' positions are
+    unknown), so records are listed shard by shard and "order" says so.
+    """
+    summaries = [json.loads(Path(p).read_text(encoding="utf-8")) for p in paths]
+    by_index, counts = {}, set()
+    for path, s in zip(paths, summaries):
+        if "shard" not in s:
+            raise ValueError(f"{path} is not a --shard summary")
+        index = s["shard"]["index"]
+        if index in by_index:
+            raise ValueError(f"{path}: shard {index} appears more than once")
+        by_index[index] = s
+        counts.add(s["shard"]["count"])
+    if len(counts) != 1:
+        raise ValueError(f"Summaries come from different shard counts: {counts}")
+    (count,) = counts
+
+    total = sum(s["total"] for s in summaries)
+    failed = sum(s["failed"] for s in summaries)
+    merged = {"total": total, "succeeded": total - failed, "failed": failed}
+    caches = [s["pdf_cache"] for s in summaries if "pdf_cache" in s]
+    cache = _cache_summary(
+        sum(c["hits"] for c in caches),
+        sum(c["misses"] for c in caches),
+        sum(c["bytes_saved"] for c in caches),
+    )
+    if cache:
+        merged["pdf_cache"] = cache
+    missing = sorted(set(range(count)) - set(by_index))
+    merged["shards"] = {
+        "count": count,
+        "missing": missing,
+        "order": "by shard" if missing else "input",
+        "rendered": {
+            str(i): [r["name"] for r in s["records"] if r["ok"]]
+            for i, s in sorted(by_index.items())
+        },
+    }
+    columns = [
+        [{**r, "shard": i} for r in s["records"]] for i, s in sorted(by_index.items())
+    ]
+    if missing:
+        merged["records"] = list(itertools.chain.from_iterable(columns))
+    else:
+        # shard i holds input positions i, i + count, ...: interleave them back
+        merged["records"] = [
+            r for row in itertools.zip_longest(*columns) for r in row if r is not None
+        ]
+    return merged
+
+
+def _run_merge(args) -> int:
+    merged = _merge_summaries(args.merge_summaries)
+    records = merged.pop("records")
+    _write_summary(args.summary, merged, (json.dumps(r) for r in records))
+    missing = merged["shards"]["missing"]
+    logger.info(
+        "Merged %d shard summaries: %d/%d resumes rendered",
+        len(args.merge_summaries),
+        merged["succeeded"],
+        merged["total"],
+    )
+    if missing:
+        logger.error("Shards that have not reported: %s", missing)
+    return 1 if merged["failed"] or missing else 0
+
+
+def _make_writer(formats: tuple[str, ...]):
+    if formats == ("pdf",):
+        return _default_writer
+    return functools.partial(_formats_writer, formats)  # picklable for workers
+
+
+def _run_batch(args) -> int:
+    import tempfile
 
-    cls = getattr(mod, "PDFGenerator", None)
-    if cls is not None:
-        inst = cls()
-        if callable(getattr(inst, "generate", None)):
-            return lambda resume, out: inst.generate(resume, out)
-        if callable(getattr(inst, "build", None)):
-            return lambda resume, out: inst.build(resume, out)
+    from src.batch import iter_records, iter_render_batch, shard_records
 
-    public = [n for n in dir(mod) if not n.startswith("_")]
-    raise RuntimeError(
-        "Could not find a PDF writer in src.pdf_generator. "
-        f"Tried common names and PDFGenerator. Available: {public}"
+    records = iter_records(args.batch)
+    if args.shard:
+        records = shard_records(records, *args.shard)
+    workers = args.workers or os.cpu_count() or 1
+    results = iter_render_batch(
+        records,
+        Path(args.out_dir),
+        _make_writer(args.formats),
+        workers=workers,
+        chunksize=args.chunksize,
+        suffix=RENDERERS[args.formats[0]].suffix,
     )
+    # Entries are tallied and spilled as they arrive, not collected, so
+    # arbitrarily large batches only keep their output names in memory.
+    total = failed = hits = misses = bytes_saved = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spill:
+        for r in results:
+            total += 1
+            if not r["ok"]:
+                failed += 1
+                logger.error("FAILED %s: %s", r["name"], r["error"])
+            if r.get("cached"):
+                hits += 1
+                bytes_saved += r["bytes"]
+            elif "cached" in r:
+                misses += 1
+            if args.summary:
+                spill.write(json.dumps(r) + "\n")
+        shard = " (shard %d/%d)" % args.shard if args.shard else ""
+        logger.info("Rendered %d/%d resumes%s", total - failed, total, shard)
 
+        cache = _cache_summary(hits, misses, bytes_saved)
+        if cache:
+            logger.info("PDF cache: %s", cache)
 
-def main() -> None:
+        if args.summary:
+            summary = {"total": total, "succeeded": total - failed, "failed": failed}
+            if cache:
+                summary["pdf_cache"] = cache
+            if args.shard:
+                summary["shard"] = dict(zip(("index", "count"), args.shard))
+            spill.seek(0)
+            _write_summary(args.summary, summary, spill)
+    return 1 if failed else 0
+
+
+def main(argv=None) -> int:
     parser = argparse.ArgumentParser(description="Generate resume PDF from JSON")
-    parser.add_argument("--input", required=True, help="Path to raw JSON data")
-    parser.add_argument("--output", required=True, help="Output PDF path")
-    args = parser.parse_args()
+    parser.add_argument("--input", help="Path to raw JSON data ('-' for stdin)")
+    parser.add_argument("--output", help="Output PDF path ('-' for stdout)")
+    parser.add_argument(
+        "--batch",
+        metavar="SOURCE",
+        help="Directory of *.json files, a JSONL or JSON-array file, or '-' for "
+        "either on stdin (streamed)",
+    )
+    parser.add_argument("--out-dir", help="Output directory for --batch PDFs")
+    parser.add_argument(
+        "--summary", metavar="PATH", help="Write a JSON per-record batch summary"
+    )
+    parser.add_argument(
+        "--shard",
+        type=_shard_arg,
+        metavar="INDEX/COUNT",
+        help="Render only shard INDEX of COUNT (0-based) of --batch; with just "
+        f"COUNT, INDEX is read from ${SHARD_INDEX_ENV} (Kubernetes Indexed Jobs)",
+    )
+    parser.add_argument(
+        "--merge-summaries",
+        nargs="+",
+        metavar="PATH",
+        help="Merge the --summary files of every --shard into --summary",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --batch (0 = one per CPU; default 1)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=4,
+        help="Records handed to a worker at a time with --workers (default 4)",
+    )
+    parser.add_argument(
+        "--rewrite-cache",
+        metavar="PATH",
+        help="SQLite file caching bullet rewrites across runs "
+        f"(default: ${REWRITE_CACHE_ENV})",
+    )
+    parser.add_argument(
+        "--splitter",
+        choices=sorted(SENTENCE_SPLITTERS),
+        help=f"Sentence splitter (default: ${SPLITTER_ENV} or punkt)",
+    )
+    parser.add_argument(
+        "--rules",
+        metavar="PATH",
+        help="JSON file adding action verbs and impact categories to the "
+        f"rewrite rules (default: ${RULES_ENV})",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write a JSON stage-timing/counter report ('-' for stderr)",
+    )
+    parser.add_argument(
+        "--cprofile", metavar="PATH", help="Also dump cProfile stats to PATH"
+    )
+    parser.add_argument(
+        "--font",
+        metavar="REGULAR[,BOLD[,ITALIC]]",
+        help=f"TrueType font files for non-Latin text (default: ${FONT_ENV} "
+        "or Helvetica)",
+    )
+    parser.add_argument(
+        "--format",
+        default="pdf",
+        metavar="FMT[,FMT...]",
+        help=f"Output formats from one build: {', '.join(FORMATS)} or all "
+        "(default pdf). The first is written to --output, the rest next to it "
+        "with their own suffix",
+    )
+    parser.add_argument(
+        "--fit",
+        action="store_true",
+        help="Shrink fonts and spacing so each resume fits on one page",
+    )
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Byte-identical PDFs for identical input: fixed timestamps and "
+        f"content-derived document IDs (default: ${REPRODUCIBLE_ENV})",
+    )
+    parser.add_argument(
+        "--pdf-cache",
+        metavar="DIR",
+        help=f"Reuse PDFs for unchanged inputs (default: ${CACHE_DIR_ENV})",
+    )
+    parser.add_argument(
+        "--pdf-cache-max-mb",
+        type=float,
+        help="Size bound for --pdf-cache; least recently used PDFs are evicted",
+    )
+    args = parser.parse_args(argv)
+
+    if args.merge_summaries:
+        if args.batch or args.input or args.output or not args.summary:
+            parser.error("--merge-summaries takes only --summary for the result")
+        try:
+            return _run_merge(args)
+        except (OSError, ValueError, KeyError) as exc:
+            parser.error(f"--merge-summaries: {exc}")
+    if args.shard and not args.batch:
+        parser.error("--shard requires --batch")
+    if args.batch:
+        if args.input or args.output:
+            parser.error("--batch cannot be combined with --input/--output")
+        if not args.out_dir:
+            parser.error("--batch requires --out-dir")
+    elif not (args.input and args.output):
+        parser.error("--input and --output are required (or use --batch)")
+    try:
+        args.formats = parse_formats(args.format)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if len(args.formats) > 1 and args.output == "-":
+        parser.error("--output - takes a single --format")
+    if args.formats != ("pdf",) and args.pdf_cache:
+        parser.error("--pdf-cache only caches --format pdf")
+
+    if args.rules:
+        try:
+            load_rules(args.rules)
+        except (OSError, ValueError) as exc:
+            parser.error(f"--rules: {exc}")
+    if args.font:
+        try:
+            parse_spec(args.font)
+        except ValueError as exc:
+            parser.error(str(exc))
 
-    input_path = Path(args.input)
-    output_path = Path(args.output)
+    # Settings reach pool workers through the environment they inherit; both
+    # the environment and the builder are restored when the run ends.
+    env = {
+        SPLITTER_ENV: args.splitter,
+        RULES_ENV: args.rules,
+        FONT_ENV: args.font,
+        FIT_ENV: "1" if args.fit else None,
+        REPRODUCIBLE_ENV: "1" if args.reproducible else None,
+        CACHE_DIR_ENV: args.pdf_cache,
+        CACHE_MAX_MB_ENV: str(args.pdf_cache_max_mb) if args.pdf_cache_max_mb else None,
+        REWRITE_CACHE_ENV: args.rewrite_cache,
+    }
+    # A deployment-wide $AUTORESUME_PDF_CACHE only applies to PDF-only runs.
+    unset = (CACHE_DIR_ENV,) if args.formats != ("pdf",) else ()
+    if unset and os.environ.get(CACHE_DIR_ENV):
+        logger.debug("Ignoring $%s for --format %s", CACHE_DIR_ENV, args.format)
+    with (
+        _environ(env, unset),
+        configured(args.splitter, args.rules, args.rewrite_cache),
+    ):
+        return _profiled_run(args)
 
-    with input_path.open("r", encoding="utf-8") as fh:
-        raw = json.load(fh)
 
-    resume = build_resume(raw)
-    pdf_callable = _resolve_pdf_callable()
+@contextlib.contextmanager
+def _environ(updates: dict, unset=()):
+    """Set the non-None ``updates`` and remove ``unset`` for a with-block."""
+    saved = {k: os.environ.get(k) for k in [*updates, *unset]}
+    try:
+        os.environ.update({k: v for k, v in updates.items() if v is not None})
+        for k in unset:
+            os.environ.pop(k, None)
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _profiled_run(args) -> int:
+    if not (args.profile or args.cprofile):
+        return _run(args)
+
+    if args.batch and args.workers != 1:
+        logger.warning("--profile only covers the parent process with --workers")
+    profile = profiling.enable()
+    cprof = None
+    if args.cprofile:
+        import cProfile
 
-    sig = inspect.signature(pdf_callable)
+        cprof = cProfile.Profile()
+        cprof.enable()
     try:
-        if len(sig.parameters) >= 2:
-            pdf_callable(resume, str(output_path))
+        return _run(args)
+    finally:
+        if cprof is not None:
+            cprof.disable()
+            cprof.dump_stats(args.cprofile)
+        profiling.disable()
+        report = profile.report()
+        report["rewrite_cache"] = rewrite_cache_stats()
+        text = json.dumps(report, indent=2)
+        if args.profile == "-":
+            print(text, file=sys.stderr)
+        elif args.profile:
+            Path(args.profile).write_text(text, encoding="utf-8")
+
+
+def _run(args) -> int:
+    if args.batch:
+        return _run_batch(args)
+    from src.batch import render_one
+
+    with profiling.stage("json_load"):
+        if args.input == "-":
+            raw = json.load(sys.stdin)
         else:
-            pdf_bytes = pdf_callable(resume)
-            output_path.write_bytes(pdf_bytes)
-    except TypeError:
-        try:
-            pdf_callable(resume, str(output_path))
-        except TypeError:
-            pdf_bytes = pdf_callable(resume)
-            output_path.write_bytes(pdf_bytes)
+            with Path(args.input).open("r", encoding="utf-8") as fh:
+                raw = json.load(fh)
 
-    logger.info("Wrote %s", output_path)
+    target = sys.stdout.buffer if args.output == "-" else args.output
+    hit = render_one(raw, target, _make_writer(args.formats)())
+    if target is sys.stdout.buffer:
+        target.flush()
+        logger.info("Wrote %s to stdout", args.formats[0])
+    elif args.formats == ("pdf",):
+        logger.info("Wrote %s", args.output)
+    else:
+        for path in output_paths(args.output, args.formats).values():
+            logger.info("Wrote %s", path)
+    if hit is not None:
+        logger.info("PDF cache %s: %s", "hit" if hit else "miss", from_env().stats())
+    logger.debug("Rewrite cache: %s", rewrite_cache_stats())
+    return 0
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
-    main()
+    sys.exit(main())
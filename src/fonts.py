@@ -0,0 +1,87 @@
+"""
+Font families for the PDF renderer.
+
+The built-in Helvetica family only covers Latin-1, so names and text in
+other scripts need a TrueType family. ``register_family`` parses each TTF
+file once per process and registers it with reportlab (which embeds only the
+glyphs a document actually uses). Later renders, including every record of a
+batch, just look up the registered fonts.
+
+A family is configured as "REGULAR.ttf[,BOLD.ttf[,ITALIC.ttf]]", via
+``--font`` or $AUTORESUME_FONT so pool workers pick it up too.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+FONT_ENV = "AUTORESUME_FONT"
+
+
+class FontFamily(NamedTuple):
+    regular: str
+    bold: str
+    italic: str
+
+
+HELVETICA = FontFamily("Helvetica", "Helvetica-Bold", "Helvetica-Oblique")
+
+
+def _face(path: str) -> str:
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    # reportlab's font registry is global, so the name must tell apart
+    # same-named files in different directories
+    resolved = Path(path).resolve()
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:8]
+    name = f"{resolved.stem}-{digest}"
+    if name not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont(name, str(resolved)))
+    return name
+
+
+@functools.lru_cache(maxsize=None)
+def register_family(
+    regular: str, bold: str | None = None, italic: str | None = None
+) -> FontFamily:
+    """
+    Register a TrueType family (missing faces fall back to ``regular``) and
+    map <b>/<i> markup onto it. Cached: each file is parsed once per process.
+    """
+    from reportlab.lib.fonts import addMapping
+
+    family = FontFamily(
+        _face(regular), _face(bold or regular), _face(italic or regular)
+    )
+    addMapping(family.regular, 0, 0, family.regular)
+    addMapping(family.regular, 1, 0, family.bold)
+    addMapping(family.regular, 0, 1, family.italic)
+    addMapping(family.regular, 1, 1, family.bold)
+    return family
+
+
+@functools.lru_cache(maxsize=None)
+def parse_spec(spec: str) -> FontFamily:
+    """Resolve a "REGULAR[,BOLD[,ITALIC]]" spec; empty means Helvetica."""
+    paths = [p.strip() for p in spec.split(",") if p.strip()]
+    if not paths:
+        return HELVETICA
+    if len(paths) > 3:
+        raise ValueError(f"Font spec takes at most 3 files: {spec!r}")
+    for path in paths:
+        if not Path(path).is_file():
+            raise ValueError(f"Font file not found: {path}")
+    return register_family(*paths)
+
+
+def spec_from_env() -> str:
+    return os.environ.get(FONT_ENV, "")
+
+
+def from_env() -> FontFamily:
+    return parse_spec(spec_from_env())
@@ -0,0 +1,336 @@
+"""
+Output formats: one built resume rendered as PDF, plain text, Markdown
+and/or HTML.
+
+The text formats share one normalized outline of the resume (``outline``),
+built once per request with the same ``norm`` / ``contact_line`` helpers
+the PDF renderer uses, so every format carries the same text.
+``render_formats`` takes the structured resume once and runs the requested
+renderers in turn; the text renderers are cheap next to the PDF, so "all
+formats" costs little more than the PDF alone.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+import unicodedata
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+if TYPE_CHECKING:  # imported on first render, not by ``--help``
+    from .model import Resume
+
+
+# Normalize fancy Unicode to ASCII-friendly characters for Helvetica
+def norm(s: str) -> str:
+    s = unicodedata.normalize("NFKC", str(s or ""))
+    return (
+        s.replace("\u2013", "-")  # en dash –
+        .replace("\u2014", "-")  # em dash —
+        .replace("\u2212", "-")  # minus sign −
+        .replace("\u00a0", " ")  # non-breaking space
+    )
+
+
+def contact_line(c) -> str:
+    fields = (c.location, c.email, c.phone, c.linkedin, c.github, c.portfolio)
+    return " • ".join(norm(f) for f in fields if f)
+
+
+def bullet_text(raw) -> str:
+    return norm(str(raw)).lstrip("• ").rstrip(".") + "."
+
+
+# ---- Outline: the resume as normalized sections, shared by text formats ----
+class Row(NamedTuple):
+    """A title line with a right-hand detail, an optional subtitle line, then
+    bullets. Skills rows carry their items as ``text`` instead."""
+
+    title: str
+    detail: str = ""
+    subtitle: str = ""
+    subdetail: str = ""
+    bullets: tuple[str, ...] = ()
+    text: str = ""
+
+
+class Section(NamedTuple):
+    title: str
+    rows: tuple[Row, ...]
+
+
+class Outline(NamedTuple):
+    name: str
+    contact: str
+    sections: tuple[Section, ...]
+
+
+def outline(resume: Resume) -> Outline:
+    """Normalize ``resume`` once, in the PDF's section order."""
+    sections = []
+
+    def add(title, rows):
+        if rows:
+            sections.append(Section(title, tuple(rows)))
+
+    def bullets(items):
+        return tuple(bullet_text(b) for b in items)
+
+    rows = []
+    for ed in resume.education:
+        degree = norm(ed.degree)
+        if ed.gpa:
+            degree = f"{degree} — GPA: {norm(ed.gpa)}"
+        rows.append(Row(norm(ed.school), norm(ed.location), degree, norm(ed.dates)))
+    add("Education", rows)
+    add(
+        "Experience",
+        [
+            Row(
+                norm(e.title),
+                norm(e.dates),
+                norm(e.company),
+                norm(e.location),
+                bullets(e.bullets),
+            )
+            for e in resume.experience
+        ],
+    )
+    add(
+        "Projects",
+        [
+            Row(
+                norm(p.title) + (f" | {norm(p.tools)}" if p.tools else ""),
+                norm(p.dates),
+                bullets=bullets(p.bullets),
+            )
+            for p in resume.projects
+        ],
+    )
+    add(
+        "Technical Skills",
+        [
+            Row(norm(category), text=", ".join(norm(x) for x in items))
+            for category, items in resume.skills.items()
+        ],
+    )
+    add(
+        "Extracurriculars",
+        [
+            Row(norm(ex.title), norm(ex.dates), bullets=bullets(ex.bullets))
+            for ex in resume.extracurriculars
+        ],
+    )
+    return Outline(
+        norm(resume.contact.full_name), contact_line(resume.contact), tuple(sections)
+    )
+
+
+# ---- Renderers: (resume, outline) -> bytes ----
+TEXT_WIDTH = 80
+
+
+def _columns(left: str, right: str) -> str:
+    if not right:
+        return left
+    return left + " " * max(2, TEXT_WIDTH - len(left) - len(right)) + right
+
+
+def render_text(resume: Resume, doc: Outline) -> bytes:
+    lines = []
+    if doc.name:
+        lines.append(doc.name)
+    if doc.contact:
+        lines.append(doc.contact)
+    for section in doc.sections:
+        title = section.title.upper()
+        lines += ["", title, "-" * len(title)]
+        for row in section.rows:
+            if row.text:
+                lines.append(f"{row.title}: {row.text}")
+                continue
+            lines.append(_columns(row.title, row.detail))
+            if row.subtitle or row.subdetail:
+                lines.append(_columns(row.subtitle, row.subdetail))
+            lines += [f"  • {b}" for b in row.bullets]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+_MD_SPECIAL = re.compile(r"([\\`*_\[\]<>])")
+
+
+def _md(s: str) -> str:
+    return _MD_SPECIAL.sub(r"\\\1", s)
+
+
+def render_markdown(resume: Resume, doc: Outline) -> bytes:
+    lines = []
+    if doc.name:
+        lines += [f"# {_md(doc.name)}", ""]
+    if doc.contact:
+        lines += [_md(doc.contact), ""]
+    for section in doc.sections:
+        lines += [f"## {section.title}", ""]
+        for row in section.rows:
+            if row.text:
+                lines += [f"**{_md(row.title)}:** {_md(row.text)}", ""]
+                continue
+            head = f"**{_md(row.title)}**" + (
+                f" — {_md(row.detail)}" if row.detail else ""
+            )
+            if row.subtitle or row.subdetail:
+                sub = " — ".join(_md(s) for s in (row.subtitle, row.subdetail) if s)
+                head += f"  \n*{sub}*"
+            lines += [head, ""]
+            if row.bullets:
+                lines += [f"- {_md(b)}" for b in row.bullets] + [""]
+    return "\n".join(lines).encode("utf-8")
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font: 10pt/1.3 Helvetica, Arial, sans-serif; max-width: 7in; margin: 0.6in auto; }}
+h1 {{ font-size: 20pt; text-align: center; margin: 0; }}
+.contact {{ text-align: center; margin: 2px 0 6px; }}
+h2 {{ font-size: 11pt; text-transform: uppercase; border-bottom: 1px solid #000; margin: 10px 0 4px; }}
+.row {{ display: flex; justify-content: space-between; }}
+.row.sub {{ font-style: italic; }}
+ul {{ margin: 2px 0 6px; padding-left: 18px; }}
+p {{ margin: 2px 0; }}
+</style>
+</head>
+<body>
+"""
+
+
+def _html_row(left: str, right: str, cls: str = "row") -> str:
+    return (
+        f'<div class="{cls}"><span>{html.escape(left)}</span>'
+        f"<span>{html.escape(right)}</span></div>"
+    )
+
+
+def render_html(resume: Resume, doc: Outline) -> bytes:
+    esc = html.escape
+    parts = [_HTML_HEAD.format(title=esc(doc.name or "Resume"))]
+    if doc.name:
+        parts.append(f"<h1>{esc(doc.name)}</h1>")
+    if doc.contact:
+        parts.append(f'<p class="contact">{esc(doc.contact)}</p>')
+    for section in doc.sections:
+        parts.append(f"<section>\n<h2>{esc(section.title)}</h2>")
+        for row in section.rows:
+            if row.text:
+                parts.append(f"<p><b>{esc(row.title)}:</b> {esc(row.text)}</p>")
+                continue
+            parts.append(_html_row(row.title, row.detail))
+            if row.subtitle or row.subdetail:
+                parts.append(_html_row(row.subtitle, row.subdetail, "row sub"))
+            if row.bullets:
+                items = "".join(f"<li>{esc(b)}</li>" for b in row.bullets)
+                parts.append(f"<ul>{items}</ul>")
+        parts.append("</section>")
+    parts.append("</body>\n</html>\n")
+    return "\n".join(parts).encode("utf-8")
+
+
+def _render_pdf(resume: Resume, doc: Outline) -> bytes:
+    try:  # reportlab is only imported when a PDF is asked for
+        from . import pdf_generator
+    except ImportError:
+        import pdf_generator
+
+    return pdf_generator.render_pdf(resume)
+
+
+class Renderer(NamedTuple):
+    suffix: str
+    media_type: str
+    render: Callable[[Resume, Outline], bytes]
+
+
+# Format name -> renderer; the name is also the file suffix.
+RENDERERS = {
+    "pdf": Renderer(".pdf", "application/pdf", _render_pdf),
+    "txt": Renderer(".txt", "text/plain; charset=utf-8", render_text),
+    "md": Renderer(".md", "text/markdown; charset=utf-8", render_markdown),
+    "html": Renderer(".html", "text/html; charset=utf-8", render_html),
+}
+FORMATS = tuple(RENDERERS)
+
+
+def parse_formats(spec: str) -> tuple[str, ...]:
+    """Resolve a comma-separated list ("pdf,md" or "all") to format names."""
+    names = [f.strip().lower() for f in spec.split(",") if f.strip()]
+    if names == ["all"]:
+        return FORMATS
+    unknown = [f for f in names if f not in RENDERERS]
+    if unknown or not names:
+        raise ValueError(
+            f"Unknown output format(s) {', '.join(unknown) or spec!r}; "
+            f"choose from {', '.join(FORMATS)} or all"
+        )
+    return tuple(dict.fromkeys(names))
+
+
+def _coerce(structured) -> Resume:
+    try:
+        from .model import Resume
+    except ImportError:  # loaded as a top-level module (python src/questions.py, tests)
+        from model import Resume
+
+    return Resume.coerce(structured)
+
+
+def _check(formats) -> tuple[str, ...]:
+    formats = tuple(formats)
+    unknown = [f for f in formats if f not in RENDERERS]
+    if unknown:
+        raise ValueError(f"Unknown output format(s): {', '.join(unknown)}")
+    return formats
+
+
+def render_formats(structured, formats=("pdf",)) -> dict[str, bytes]:
+    """
+    Render ``structured`` (a Resume or build_resume's dict) once per format.
+    Returns {format: bytes} in the order asked for. The renderers are pure
+    Python, so they run one after another: threads would only take turns on
+    the GIL.
+    """
+    formats = _check(formats)
+    resume = _coerce(structured)
+    doc = outline(resume)
+    return {f: RENDERERS[f].render(resume, doc) for f in formats}
+
+
+def output_paths(path, formats=("pdf",)) -> dict[str, Path]:
+    """
+    Where write_formats puts each format. The first format is written to
+    ``path`` exactly as given. The others are siblings: a known output suffix
+    on ``path`` is swapped for theirs (cv.pdf -> cv.md), anything else is
+    kept and theirs appended (cv.v2 -> cv.v2.md, cv -> cv.md).
+    """
+    path, formats = Path(path), _check(formats)
+    stem = path.name
+    if path.suffix.lower() in {r.suffix for r in RENDERERS.values()}:
+        stem = path.name[: -len(path.suffix)]
+    paths = {formats[0]: path}
+    for fmt in formats[1:]:
+        paths[fmt] = path.with_name(stem + RENDERERS[fmt].suffix)
+    return paths
+
+
+def write_formats(structured, path, formats=("pdf",)) -> dict[str, Path]:
+    """
+    Render every format and write it where output_paths says. Returns
+    {format: path}.
+    """
+    paths = output_paths(path, formats)
+    for fmt, data in render_formats(structured, formats).items():
+        paths[fmt].write_bytes(data)
+    return paths
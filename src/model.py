@@ -0,0 +1,175 @@
+"""
+Typed resume model: the structured output of build_resume as slotted
+dataclasses.
+
+Raw and structured dicts spell the same field several ways ("dates"/"date",
+"GPA"/"gpa", "full_name"/"Full name"); ``Resume.from_raw`` resolves those
+aliases once, so renderers read plain attributes. Every field is a string,
+a list of strings or a dict of string lists, which makes ``to_json`` /
+``from_json`` loss-free.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _first(raw: dict, *keys: str) -> str:
+    # Same semantics as the old ``raw.get(a) or raw.get(b)`` chains.
+    for key in keys:
+        if raw.get(key):
+            return _text(raw[key])
+    return ""
+
+
+def _strings(values) -> list[str]:
+    return [_text(v) for v in values or []]
+
+
+@dataclass(slots=True)
+class Contact:
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+    linkedin: str = ""
+    github: str = ""
+    portfolio: str = ""
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> Contact:
+        raw = raw or {}
+        return cls(
+            full_name=_first(raw, "full_name", "Full name"),
+            email=_first(raw, "email"),
+            phone=_first(raw, "phone"),
+            location=_first(raw, "location", "Location"),
+            linkedin=_first(raw, "linkedin"),
+            github=_first(raw, "github"),
+            portfolio=_first(raw, "portfolio"),
+        )
+
+
+@dataclass(slots=True)
+class Education:
+    school: str = ""
+    degree: str = ""
+    location: str = ""
+    dates: str = ""
+    gpa: str = ""
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> Education:
+        return cls(
+            school=_first(raw, "school"),
+            degree=_first(raw, "degree"),
+            location=_first(raw, "location"),
+            dates=_first(raw, "date", "dates"),
+            gpa=_first(raw, "GPA", "gpa"),
+        )
+
+
+@dataclass(slots=True)
+class Experience:
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    dates: str = ""
+    bullets: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> Experience:
+        return cls(
+            title=_first(raw, "title"),
+            company=_first(raw, "company"),
+            location=_first(raw, "location"),
+            dates=_first(raw, "dates", "date"),
+            bullets=_strings(raw.get("bullets")),
+        )
+
+
+@dataclass(slots=True)
+class Project:
+    title: str = ""
+    tools: str = ""
+    dates: str = ""
+    bullets: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> Project:
+        tools = raw.get("tools")
+        if isinstance(tools, list):  # tools come as a string OR a list
+            tools = ", ".join(map(str, tools))
+        return cls(
+            title=_first(raw, "title"),
+            tools=_text(tools or ""),
+            dates=_first(raw, "dates", "date"),
+            bullets=_strings(raw.get("bullets")),
+        )
+
+
+@dataclass(slots=True)
+class Extracurricular:
+    title: str = ""
+    dates: str = ""
+    bullets: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> Extracurricular:
+        return cls(
+            title=_first(raw, "title"),
+            dates=_first(raw, "dates", "date"),
+            bullets=_strings(raw.get("bullets")),
+        )
+
+
+def _skills(raw: dict) -> dict[str, list[str]]:
+    skills = {}
+    for category, items in (raw or {}).items():
+        if not isinstance(items, (list, tuple)):
+            items = [items] if items else []
+        skills[_text(category)] = [_text(x) for x in items if str(x).strip()]
+    return skills
+
+
+@dataclass(slots=True)
+class Resume:
+    contact: Contact = field(default_factory=Contact)
+    education: list[Education] = field(default_factory=list)
+    experience: list[Experience] = field(default_factory=list)
+    projects: list[Project] = field(default_factory=list)
+    skills: dict[str, list[str]] = field(default_factory=dict)
+    extracurriculars: list[Extracurricular] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> Resume:
+        """Adapt a structured (or raw) resume dict, resolving key aliases."""
+        return cls(
+            contact=Contact.from_raw(raw.get("contact")),
+            education=[Education.from_raw(e) for e in raw.get("education") or []],
+            experience=[Experience.from_raw(e) for e in raw.get("experience") or []],
+            projects=[Project.from_raw(p) for p in raw.get("projects") or []],
+            skills=_skills(raw.get("skills")),
+            extracurriculars=[
+                Extracurricular.from_raw(e) for e in raw.get("extracurriculars") or []
+            ],
+        )
+
+    @classmethod
+    def coerce(cls, resume: Resume | dict) -> Resume:
+        return cls.from_raw(resume) if isinstance(resume, dict) else resume
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+
+    @classmethod
+    def from_json(cls, text: str) -> Resume:
+        return cls.from_raw(json.loads(text))
@@ -0,0 +1,215 @@
+"""
+Content-addressed cache of rendered PDFs.
+
+The key hashes the canonical raw input together with everything that can
+change the output: the builder rule version, the active sentence splitter,
+the builder and renderer sources, any style overrides and the reportlab
+version. A hit returns the stored bytes without building or rendering
+anything. The store is a directory of <key>.pdf files bounded by size,
+evicting least-recently-used entries.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from src import builder, fonts
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "AUTORESUME_PDF_CACHE"
+CACHE_MAX_MB_ENV = "AUTORESUME_PDF_CACHE_MAX_MB"
+DEFAULT_MAX_BYTES = 512 * 2**20
+# modules whose source decides what a cached PDF looks like
+_SOURCE_MODULES = (
+    "src.builder",
+    "src.model",
+    "src.fonts",
+    "src.pdf_generator",
+    "src.formats",
+)
+# pdf_generator's FIT_ENV and REPRODUCIBLE_ENV, spelled out so a cache hit
+# never imports reportlab
+FIT_ENV = "AUTORESUME_FIT"
+REPRODUCIBLE_ENV = "AUTORESUME_REPRODUCIBLE"
+
+
+@functools.lru_cache(maxsize=1)
+def renderer_version() -> str:
+    """Hash of the builder/renderer sources + reportlab version (no reportlab import)."""
+    import importlib.metadata
+    import importlib.util
+
+    h = hashlib.sha256()
+    for module in _SOURCE_MODULES:
+        h.update(Path(importlib.util.find_spec(module).origin).read_bytes())
+    try:
+        h.update(importlib.metadata.version("reportlab").encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    return h.hexdigest()[:16]
+
+
+def _canonical(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode(
+        "utf-8"
+    )
+
+
+def cache_key(raw: dict, style_overrides: dict | None = None) -> str:
+    h = hashlib.sha256(_canonical(raw))
+    if style_overrides:
+        h.update(b"\0overrides:" + _canonical(style_overrides))
+    h.update(builder.rules_version().encode())
+    h.update(builder._resolve_splitter().__name__.encode())
+    h.update(renderer_version().encode())
+    h.update(fonts.spec_from_env().encode())
+    h.update(os.environ.get(FIT_ENV, "").encode())
+    h.update(os.environ.get(REPRODUCIBLE_ENV, "").encode())
+    return h.hexdigest()
+
+
+class PDFCache:
+    """
+    Size-bounded LRU directory of rendered PDFs. Several processes may share
+    one directory: writes are atomic renames, and every ``_RESCAN_EVERY`` puts
+    the index is rebuilt from the directory itself, so entries written by
+    other processes count against ``max_bytes`` too. Between rescans the
+    directory can overshoot by what the other writers added meanwhile.
+    Rescans also delete *.tmp files left by writers that died mid-put.
+    """
+
+    _RESCAN_EVERY = 32
+    # a *.tmp this old belongs to a writer that died before renaming it
+    _STALE_TMP_S = 300
+
+    def __init__(self, root, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._index: OrderedDict = OrderedDict()
+        self._total = 0
+        self._rescan()
+
+    def _rescan(self) -> None:
+        # key -> size, least recently used first (ordered by file mtime)
+        entries, stale_before = [], time.time() - self._STALE_TMP_S
+        with os.scandir(self.root) as it:
+            for entry in it:
+                is_pdf = entry.name.endswith(".pdf")
+                if not is_pdf and not entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:  # evicted by another process
+                    continue
+                if is_pdf:
+                    entries.append((st.st_mtime, entry.name[:-4], st.st_size))
+                elif st.st_mtime < stale_before:
+                    Path(entry.path).unlink(missing_ok=True)
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total = sum(self._index.values())
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.pdf"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+                self._total -= self._index.pop(key, 0)
+            return None
+        try:
+            os.utime(path)  # recency survives restarts via mtime
+        except OSError:  # evicted meanwhile: the bytes read are still good
+            pass
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += len(data)
+            self._total += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        import tempfile
+
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, self._path(key))  # atomic: readers never see partials
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._puts += 1
+            if self._puts % self._RESCAN_EVERY == 0:
+                self._rescan()  # picks up the new file as most recent
+            else:
+                self._total += len(data) - self._index.pop(key, 0)
+                self._index[key] = len(data)
+            while self._total > self.max_bytes and self._index:
+                old, size = self._index.popitem(last=False)
+                self._total -= size
+                self._path(old).unlink(missing_ok=True)
+
+    def get_or_render(
+        self, raw: dict, render, style_overrides: dict | None = None
+    ) -> tuple[bytes, bool]:
+        """
+        Return (pdf bytes, was_hit); ``render(raw)`` runs only on a miss.
+        Pass the ``style_overrides`` the renderer applies so they are part of
+        the key.
+        """
+        key = cache_key(raw, style_overrides)
+        data = self.get(key)
+        if data is not None:
+            return data, True
+        data = render(raw)
+        self.put(key, data)
+        return data, False
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "bytes_saved": self.bytes_saved,
+            "entries": len(self._index),
+            "bytes": self._total,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_env_cache: tuple | None = None
+
+
+def from_env() -> PDFCache | None:
+    """The process-wide cache configured by $AUTORESUME_PDF_CACHE, if any."""
+    global _env_cache
+    root = os.environ.get(CACHE_DIR_ENV)
+    mb = os.environ.get(CACHE_MAX_MB_ENV)
+    if not root:
+        return None
+    if _env_cache is None or _env_cache[0] != (root, mb):
+        max_bytes = int(float(mb) * 2**20) if mb else DEFAULT_MAX_BYTES
+        _env_cache = ((root, mb), PDFCache(root, max_bytes))
+    return _env_cache[1]
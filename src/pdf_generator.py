@@ -15,29 +15,39 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-import unicodedata
-
-
-# Normalize fancy Unicode to ASCII-friendly characters for Helvetica
-def _norm(s: str) -> str:
-    s = unicodedata.normalize("NFKC", str(s or ""))
-    return (
-        s.replace("\u2013", "-")  # en dash –
-        .replace("\u2014", "-")  # em dash —
-        .replace("\u2212", "-")  # minus sign −
-        .replace("\u00a0", " ")  # non-breaking space
-    )
-
-
-# ---- Styles (monochrome, Helvetica) ----
-def _styles():
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Frame
+import functools
+import hashlib
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+try:
+    from . import fonts, profiling
+    from .formats import bullet_text, contact_line as _contact_line, norm as _norm
+    from .model import Resume
+except ImportError:  # loaded as a top-level module (python src/questions.py, tests)
+    import fonts
+    import profiling
+    from formats import bullet_text, contact_line as _contact_line, norm as _norm
+    from model import Resume
+
+logger = logging.getLogger(__name__)
+
+
+# ---- Styles (monochrome, Helvetica unless a TTF family is configured) ----
+def _build_styles(family: fonts.FontFamily = fonts.HELVETICA):
     base = getSampleStyleSheet()
     black = colors.black
     return {
         "name": ParagraphStyle(
             "name",
             parent=base["Heading1"],
-            fontName="Helvetica-Bold",
+            fontName=family.bold,
             fontSize=22,
             leading=26,
             alignment=TA_CENTER,
@@ -47,7 +57,7 @@ def _styles():
         "contact": ParagraphStyle(
             "contact",
             parent=base["Normal"],
-            fontName="Helvetica",
+            fontName=family.regular,
             fontSize=9.5,
             leading=12,
             alignment=TA_CENTER,
@@ -57,7 +67,7 @@ def _styles():
         "section": ParagraphStyle(
             "section",
             parent=base["Heading2"],
-            fontName="Helvetica-Bold",
+            fontName=family.bold,
             fontSize=11.5,
             leading=14,
             alignment=TA_LEFT,
@@ -68,7 +78,7 @@ def _styles():
         "subhead_bold": ParagraphStyle(
             "subhead_bold",
             parent=base["Normal"],
-            fontName="Helvetica-Bold",
+            fontName=family.bold,
             fontSize=10.5,
             leading=13,
             alignment=TA_LEFT,
@@ -78,7 +88,7 @@ def _styles():
         "subhead_ital": ParagraphStyle(
             "subhead_ital",
             parent=base["Normal"],
-            fontName="Helvetica-Oblique",
+            fontName=family.italic,
             fontSize=10,
             leading=12,
             alignment=TA_LEFT,
@@ -88,7 +98,7 @@ def _styles():
         "right_small": ParagraphStyle(
             "right_small",
             parent=base["Normal"],
-            fontName="Helvetica",
+            fontName=family.regular,
             fontSize=9.5,
             leading=12,
             alignment=TA_RIGHT,
@@ -97,7 +107,7 @@ def _styles():
         "body": ParagraphStyle(
             "body",
             parent=base["Normal"],
-            fontName="Helvetica",
+            fontName=family.regular,
             fontSize=9.5,
             leading=12,
             alignment=TA_LEFT,
@@ -107,16 +117,100 @@ def _styles():
         "skill": ParagraphStyle(
             "skill",
             parent=base["Normal"],
-            fontName="Helvetica",
+            fontName=family.regular,
             fontSize=9.5,
             leading=12,
             alignment=TA_LEFT,
             textColor=black,
             spaceAfter=1,
         ),
+        # not a text style: ``leading`` is the gap left between entries
+        "gap": ParagraphStyle("gap", leading=6),
     }
 
 
+def _scale_styles(styles: dict, scale: float) -> dict:
+    # Fit-to-page: shrink type, leading and vertical spacing together.
+    return {
+        name: style.clone(
+            name,
+            fontSize=style.fontSize * scale,
+            leading=style.leading * scale,
+            spaceBefore=style.spaceBefore * scale,
+            spaceAfter=style.spaceAfter * scale,
+        )
+        for name, style in styles.items()
+    }
+
+
+# ids of the shared registries (one per font family and scale); only these
+# are cacheable
+_base_ids: set[int] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _base_styles(family: fonts.FontFamily = fonts.HELVETICA, scale: float = 1.0):
+    # Built once per process, family and scale; treat the styles as read-only.
+    styles = _build_styles(family)
+    if scale != 1.0:
+        styles = _scale_styles(styles, scale)
+    styles = MappingProxyType(styles)
+    _base_ids.add(id(styles))
+    return styles
+
+
+def _styles(overrides: dict | None = None, family=None, scale: float = 1.0):
+    """
+    Shared, read-only style registry. ``overrides`` maps a style name to
+    ParagraphStyle attributes (e.g. {"body": {"fontSize": 10}}); only those
+    styles are cloned, the rest are reused as-is. Overrides are given at full
+    size and shrink with ``scale`` like every other style.
+    """
+    family = family or fonts.HELVETICA
+    base = _base_styles(family, scale)
+    if not overrides:
+        return base
+    full_size = _base_styles(family)
+    overridden = {
+        name: full_size[name].clone(name, **attrs) for name, attrs in overrides.items()
+    }
+    if scale != 1.0:
+        overridden = _scale_styles(overridden, scale)
+    return MappingProxyType({**base, **overridden})
+
+
+# Text column = LETTER width minus the 0.75in margins on both sides.
+_CONTENT_WIDTH = 6.5 * inch
+
+
+@functools.lru_cache(maxsize=None)
+def _col_widths(col_ratio=(0.72, 0.28)):
+    return (col_ratio[0] * _CONTENT_WIDTH, col_ratio[1] * _CONTENT_WIDTH)
+
+
+@functools.lru_cache(maxsize=None)
+def _row_style(pad=(0, 0, 0, 0)):
+    # Tables only read their TableStyle's commands, so one instance is shared.
+    return TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), pad[0]),
+            ("TOPPADDING", (0, 0), (-1, -1), pad[1]),
+            ("RIGHTPADDING", (0, 0), (-1, -1), pad[2]),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), pad[3]),
+        ]
+    )
+
+
+def warm_up() -> None:
+    """
+    Build the shared styles (registering any configured TTF family) now
+    instead of during the first render.
+    """
+    _base_styles(fonts.from_env())
+    _row_style()
+
+
 # ---- Utilities ----
 def _hr():
     return HRFlowable(
@@ -128,198 +222,472 @@ def _caps(s: str) -> str:
     return _norm(s).upper()
 
 
-def _contact_line(c: dict) -> str:
-    bits = []
-    loc = c.get("location") or c.get("Location")
-    if c.get("email"):
-        bits.append(_norm(c["email"]))
-    if c.get("phone"):
-        bits.append(_norm(c["phone"]))
-    if c.get("linkedin"):
-        bits.append(_norm(c["linkedin"]))
-    if c.get("github"):
-        bits.append(_norm(c["github"]))
-    if c.get("portfolio"):
-        bits.append(_norm(c["portfolio"]))
-    if loc:
-        bits.insert(0, _norm(loc))
-    return " • ".join(bits)
+def _parsed(text, style):
+    """
+    Parse paragraph markup once and return a factory of fresh Paragraphs
+    sharing that parse. Flowables carry layout state and cannot be reused
+    across builds, but the parsed fragments can.
+    """
+    p = Paragraph(text, style)
+    text, frags, style, bullet = p.text, p.frags, p.style, p.bulletText
+    return lambda: Paragraph(text, style, bulletText=bullet, frags=frags)
 
 
 def _two_col_row(
     left_para, right_para, styles, col_ratio=(0.72, 0.28), pad=(0, 0, 0, 0)
 ):
-    t = Table(
-        [
-            [
-                Paragraph(left_para, styles["subhead_bold"]),
-                Paragraph(right_para, styles["right_small"]),
-            ]
-        ],
-        colWidths=[col_ratio[0] * 6.5 * inch, col_ratio[1] * 6.5 * inch],
-        hAlign="LEFT",
-    )
-    t.setStyle(
-        TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), pad[0]),
-                ("TOPPADDING", (0, 0), (-1, -1), pad[1]),
-                ("RIGHTPADDING", (0, 0), (-1, -1), pad[2]),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), pad[3]),
-            ]
-        )
-    )
-    return t
+    left = _parsed(left_para, styles["subhead_bold"])
+    right = _parsed(right_para, styles["right_small"])
+    widths, style = _col_widths(tuple(col_ratio)), _row_style(tuple(pad))
+    return lambda: _row_table(left(), right(), widths, style)
 
 
 def _subrow(left_text, right_text, styles):
-    t = Table(
-        [
-            [
-                Paragraph(left_text, styles["subhead_ital"]),
-                Paragraph(right_text, styles["right_small"]),
-            ]
-        ],
-        colWidths=[0.72 * 6.5 * inch, 0.28 * 6.5 * inch],
-        hAlign="LEFT",
-    )
-    t.setStyle(
-        TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ]
-        )
-    )
+    left = _parsed(left_text, styles["subhead_ital"])
+    right = _parsed(right_text, styles["right_small"])
+    widths, style = _col_widths(), _row_style()
+    return lambda: _row_table(left(), right(), widths, style)
+
+
+def _row_table(left, right, widths, style):
+    t = Table([[left, right]], colWidths=widths, hAlign="LEFT")
+    t.setStyle(style)
     return t
 
 
 def _bullets(styles, items):
     pars = []
     for raw in items or []:
-        t = _norm(str(raw)).lstrip("• ").rstrip(".")
-        pars.append(ListItem(Paragraph(t + ".", styles["body"]), leftIndent=6))
-    return ListFlowable(pars, bulletType="bullet", leftIndent=14)
+        pars.append(_parsed(bullet_text(raw), styles["body"]))
+    return lambda: ListFlowable(
+        [ListItem(p(), leftIndent=6) for p in pars],
+        bulletType="bullet",
+        leftIndent=14,
+    )
+
+
+def _spacer(S):
+    height = S["gap"].leading
+    return lambda: Spacer(1, height)
 
 
 # ---- Public API ----
-def build_pdf(structured: dict, filename: str = "AutoResume.pdf"):
-    S = _styles()
+FIT_ENV = "AUTORESUME_FIT"
+REPRODUCIBLE_ENV = "AUTORESUME_REPRODUCIBLE"
+# Document info keys callers may set; "author" defaults to the resume's name.
+METADATA_KEYS = ("title", "author", "subject", "creator", "keywords")
+DEFAULT_TITLE = "AutoResume"
+
+
+def build_pdf(
+    structured,
+    filename: str = "AutoResume.pdf",
+    style_overrides=None,
+    family=None,
+    fit=None,
+    reproducible=None,
+    metadata=None,
+):
+    _build_doc(
+        structured, filename, style_overrides, family, fit, reproducible, metadata
+    )
+    return filename
+
 
-    doc = SimpleDocTemplate(
-        filename,
+def render_pdf(
+    structured,
+    stream=None,
+    style_overrides=None,
+    family=None,
+    fit=None,
+    reproducible=None,
+    metadata=None,
+):
+    """
+    Render without touching the filesystem: write into a binary ``stream``
+    (returns None) or, when no stream is given, return the PDF as bytes.
+    ``structured`` is a Resume or the dict build_resume returns; ``family``
+    is a fonts.FontFamily (default: $AUTORESUME_FONT, else Helvetica).
+    ``fit`` shrinks the layout to one page (default: $AUTORESUME_FIT).
+    ``reproducible`` fixes the timestamps and document ID so the same input
+    always gives the same bytes (default: $AUTORESUME_REPRODUCIBLE).
+    ``metadata`` overrides document info fields (see METADATA_KEYS).
+    """
+    args = (style_overrides, family, fit, reproducible, metadata)
+    if stream is not None:
+        _build_doc(structured, stream, *args)
+        return None
+    buf = io.BytesIO()
+    _build_doc(structured, buf, *args)
+    return buf.getvalue()
+
+
+def fit_to_page(structured, style_overrides=None, family=None) -> dict:
+    """
+    Find the largest scale at which the resume fits on one page, without
+    rendering it. Returns {"scale", "fits", "passes"}.
+    """
+    resume = Resume.coerce(structured)
+    return _fit(resume, style_overrides, family or fonts.from_env())[1]
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "") not in ("", "0")
+
+
+def _build_doc(
+    structured,
+    target,
+    style_overrides=None,
+    family=None,
+    fit=None,
+    reproducible=None,
+    metadata=None,
+):
+    # ``target`` is a path or a writable binary stream; reportlab accepts both.
+    resume = Resume.coerce(structured)
+    family = family or fonts.from_env()
+    if fit is None:
+        fit = _env_flag(FIT_ENV)
+    if reproducible is None:
+        reproducible = _env_flag(REPRODUCIBLE_ENV)
+    info = _doc_info(resume, metadata)
+    report = None
+    with profiling.stage("story"):
+        if fit:
+            story, report = _fit(resume, style_overrides, family)
+        else:
+            story = _build_story(resume, _styles(style_overrides, family))
+    profiling.count("flowables", len(story))
+    with profiling.stage("doc_build"):
+        doc = _doc_template(target, info, reproducible)
+        doc.build(story)
+    if report is not None:
+        report["fits"] = report["fits"] and doc.page == 1
+        profiling.count("fit_passes", report["passes"])
+        logger.info(
+            "Fit to page: scale %.2f after %d layout passes%s",
+            report["scale"],
+            report["passes"],
+            "" if report["fits"] else " (still longer than one page)",
+        )
+    return report
+
+
+_PAGE_MARGINS = {
+    "leftMargin": 0.75 * inch,
+    "rightMargin": 0.75 * inch,
+    "topMargin": 0.6 * inch,
+    "bottomMargin": 0.6 * inch,
+}
+
+
+def _doc_info(resume: Resume, metadata=None) -> dict:
+    info = {"title": DEFAULT_TITLE, "author": _norm(resume.contact.full_name)}
+    for key, value in (metadata or {}).items():
+        if key not in METADATA_KEYS:
+            raise ValueError(
+                f"Unknown PDF metadata field {key!r}; "
+                f"choose from {', '.join(METADATA_KEYS)}"
+            )
+        info[key] = value
+    return info
+
+
+def _doc_template(target, info: dict, reproducible=False) -> SimpleDocTemplate:
+    # invariant mode pins the creation date and derives the document ID from
+    # the content; None keeps reportlab's global rl_config.invariant.
+    return SimpleDocTemplate(
+        target,
         pagesize=LETTER,
-        leftMargin=0.75 * inch,
-        rightMargin=0.75 * inch,
-        topMargin=0.6 * inch,
-        bottomMargin=0.6 * inch,
-        title="AutoResume",
-        author=_norm((structured.get("contact", {}) or {}).get("full_name", "")),
+        **_PAGE_MARGINS,
+        invariant=1 if reproducible else None,
+        **info,
     )
-    story = []
 
-    # NAME + CONTACT
-    contact = structured.get("contact", {}) or {}
-    name = _norm(contact.get("full_name") or contact.get("Full name") or "")
+
+# ---- Fit to page ----
+# Candidate scales run from FIT_MIN_SCALE to 1.0 in FIT_STEPS even steps, so
+# trials at the same scale share styles and cached section recipes.
+FIT_MIN_SCALE = 0.7
+FIT_STEPS = 30
+
+
+@functools.lru_cache(maxsize=1)
+def _frame_size() -> tuple[float, float]:
+    # The single frame SimpleDocTemplate lays a page out in (the page minus
+    # our margins), less the frame's default paddings.
+    height = LETTER[1] - _PAGE_MARGINS["topMargin"] - _PAGE_MARGINS["bottomMargin"]
+    frame = Frame(0, 0, _CONTENT_WIDTH, height)
+    return (
+        frame.width - frame.leftPadding - frame.rightPadding,
+        frame.height - frame.topPadding - frame.bottomPadding,
+    )
+
+
+def _measure(flowables, canv=None) -> tuple:
+    """
+    (space before, height, space after) of each flowable wrapped to the
+    frame width. Our flowables' heights depend only on that width, not on
+    the height left on the page.
+    """
+    width, frame_height = _frame_size()
+    canv = canv or Canvas(io.BytesIO(), pagesize=LETTER)  # some measure via it
+    boxes = []
+    for flowable in flowables:
+        _, height = flowable.wrapOn(canv, width, frame_height)
+        boxes.append((flowable.getSpaceBefore(), height, flowable.getSpaceAfter()))
+    return tuple(boxes)
+
+
+def _stack(boxes) -> tuple[bool, float]:
+    """
+    Stack measured boxes on one page: the vertical bookkeeping of
+    reportlab's Frame.add (collapsed space before/after, none before the
+    first flowable). Returns whether they fit and the height they need,
+    measured to the end even when they overflow.
+    """
+    frame_height = _frame_size()[1]
+    y, fits, prev_after = frame_height, True, None
+    for before, height, after in boxes:
+        space = 0 if prev_after is None else max(before - prev_after, 0)
+        if y - space <= 0:
+            fits = False
+        y -= height + space
+        if y < -1e-6:  # reportlab's _FUZZ
+            fits = False
+        prev_after = after
+        y -= after
+    return fits, frame_height - y
+
+
+def _dry_layout(story: list) -> tuple[bool, float]:
+    """Lay ``story`` out on one page without drawing it; see _stack."""
+    return _stack(_measure(story))
+
+
+def _fit(resume: Resume, style_overrides, family) -> tuple[list, dict]:
+    """
+    Find the largest candidate scale whose story fits on one page. The first
+    pass (full size) measures the overflow, which gives an estimate to
+    gallop out from before bisecting.
+    Trials measure sections through the layout cache, so fitting a resume
+    whose sections were laid out before at these scales wraps nothing.
+    Returns the winning story (ready to build) and a report of the chosen
+    scale and number of layout passes.
+    """
+    trials = {}
+
+    def trial(step: int) -> bool:
+        scale = round(FIT_MIN_SCALE + (1 - FIT_MIN_SCALE) * step / FIT_STEPS, 4)
+        S = _styles(style_overrides, family, scale)
+        fits, needed = _stack(_story_boxes(resume, S))
+        trials[step] = (scale, S, fits, needed)
+        return fits
+
+    good, bad = -1, FIT_STEPS  # largest step known to fit / smallest that doesn't
+    if trial(FIT_STEPS):
+        good = FIT_STEPS
+    else:
+        # Needed height shrinks about linearly with the scale (line counts
+        # barely change), so the overflow predicts the answer to a step or two.
+        ratio = _frame_size()[1] / trials[FIT_STEPS][3]
+        step = (ratio - FIT_MIN_SCALE) / (1 - FIT_MIN_SCALE) * FIT_STEPS
+        step, delta = min(max(int(step), 0), FIT_STEPS - 1), 1
+        while bad - good > 1:
+            if trial(step):
+                good, step = step, step + delta
+            else:
+                bad, step = step, step - delta
+            delta *= 2
+            if not good < step < bad:  # bracketed: bisect the rest
+                step = (good + bad) // 2
+    # nothing fits: report the smallest scale (bad == 0 was tried)
+    scale, S, fits, _ = trials[max(good, 0)]
+    story = _build_story(resume, S)
+    return story, {"scale": scale, "fits": fits, "passes": len(trials)}
+
+
+def _header_section(contact, S) -> list:
+    recipe = []
+    name = _norm(contact.full_name)
     if name:
-        story.append(Paragraph(name, S["name"]))
+        recipe.append(_parsed(name, S["name"]))
     contact_line = _contact_line(contact)
     if contact_line:
-        story.append(Paragraph(contact_line, S["contact"]))
-    story.append(Spacer(1, 6))
-
-    # EDUCATION
-    edu = structured.get("education", []) or []
-    if edu:
-        story.append(Paragraph(_caps("Education"), S["section"]))
-        story.append(_hr())
-        for ed in edu:
-            school = _norm(ed.get("school"))
-            degree = _norm(ed.get("degree"))
-            loc = _norm(ed.get("location"))
-            dates = _norm(ed.get("date") or ed.get("dates"))
-
-            gpa = ed.get("GPA") or ed.get("gpa")
-            if gpa:
-                degree = f"{degree} — GPA: {_norm(gpa)}"
-
-            story.append(_two_col_row(school, loc, S))
-            story.append(_subrow(degree, dates, S))
-            story.append(Spacer(1, 6))
-
-    # EXPERIENCE
-    exp = structured.get("experience", []) or []
-    if exp:
-        story.append(Paragraph(_caps("Experience"), S["section"]))
-        story.append(_hr())
-        for e in exp:
-            title = _norm(e.get("title"))
-            company = _norm(e.get("company"))
-            loc = _norm(e.get("location"))
-            dates = _norm(e.get("dates") or e.get("date"))
-
-            story.append(_two_col_row(title, dates, S))
-            story.append(_subrow(company, loc, S))
-
-            bullets = e.get("bullets", [])
-            if bullets:
-                story.append(_bullets(S, bullets))
-                story.append(Spacer(1, 6))
-
-    # PROJECTS
-    projects = structured.get("projects", []) or []
-    if projects:
-        story.append(Paragraph(_caps("Projects"), S["section"]))
-        story.append(_hr())
-        for p in projects:
-            title = _norm(p.get("title"))
-
-            # Handle tools as string OR list
-            val = p.get("tools")
-            if isinstance(val, list):
-                tools = _norm(", ".join(map(str, val)))
-            else:
-                tools = _norm(val or "")
-
-            dates = _norm(p.get("dates") or p.get("date"))
-
-            left = f"{title}" + (f" | {tools}" if tools else "")
-            story.append(_two_col_row(left, dates, S))
-            bullets = p.get("bullets", [])
-            if bullets:
-                story.append(_bullets(S, bullets))
-            story.append(Spacer(1, 6))
-
-    # TECHNICAL SKILLS
-    skills = structured.get("skills", {}) or {}
-    if skills:
-        story.append(Paragraph(_caps("Technical Skills"), S["section"]))
-        story.append(_hr())
-        for category, items in skills.items():
-            if isinstance(items, (list, tuple)):
-                txt = ", ".join([_norm(x) for x in items if str(x).strip()])
-            else:
-                txt = _norm(items)
-            story.append(Paragraph(f"<b>{_norm(category)}:</b> {txt}", S["skill"]))
-        story.append(Spacer(1, 6))
-
-    # EXTRACURRICULARS
-    extras = structured.get("extracurriculars", []) or []
-    if extras:
-        story.append(Paragraph(_caps("Extracurriculars"), S["section"]))
-        story.append(_hr())
-        for ex in extras:
-            title = _norm(ex.get("title"))
-            dates = _norm(ex.get("dates") or ex.get("date"))
-            story.append(_two_col_row(title, dates, S))
-            bullets = ex.get("bullets", [])
-            if bullets:
-                story.append(_bullets(S, bullets))
-            story.append(Spacer(1, 6))
-
-    doc.build(story)
-    return filename
+        recipe.append(_parsed(contact_line, S["contact"]))
+    recipe.append(_spacer(S))
+    return recipe
+
+
+def _section_title(title: str, S) -> list:
+    return [_parsed(_caps(title), S["section"]), _hr]
+
+
+def _education_section(edu: list, S) -> list:
+    if not edu:
+        return []
+    recipe = _section_title("Education", S)
+    for ed in edu:
+        degree = _norm(ed.degree)
+        if ed.gpa:
+            degree = f"{degree} — GPA: {_norm(ed.gpa)}"
+
+        recipe.append(_two_col_row(_norm(ed.school), _norm(ed.location), S))
+        recipe.append(_subrow(degree, _norm(ed.dates), S))
+        recipe.append(_spacer(S))
+    return recipe
+
+
+def _experience_section(exp: list, S) -> list:
+    if not exp:
+        return []
+    recipe = _section_title("Experience", S)
+    for e in exp:
+        recipe.append(_two_col_row(_norm(e.title), _norm(e.dates), S))
+        recipe.append(_subrow(_norm(e.company), _norm(e.location), S))
+        if e.bullets:
+            recipe.append(_bullets(S, e.bullets))
+            recipe.append(_spacer(S))
+    return recipe
+
+
+def _projects_section(projects: list, S) -> list:
+    if not projects:
+        return []
+    recipe = _section_title("Projects", S)
+    for p in projects:
+        title, tools = _norm(p.title), _norm(p.tools)
+        left = f"{title}" + (f" | {tools}" if tools else "")
+        recipe.append(_two_col_row(left, _norm(p.dates), S))
+        if p.bullets:
+            recipe.append(_bullets(S, p.bullets))
+        recipe.append(_spacer(S))
+    return recipe
+
+
+def _skills_section(skills: dict, S) -> list:
+    if not skills:
+        return []
+    recipe = _section_title("Technical Skills", S)
+    for category, items in skills.items():
+        txt = ", ".join(_norm(x) for x in items)
+        recipe.append(_parsed(f"<b>{_norm(category)}:</b> {txt}", S["skill"]))
+    recipe.append(_spacer(S))
+    return recipe
+
+
+def _extracurriculars_section(extras: list, S) -> list:
+    if not extras:
+        return []
+    recipe = _section_title("Extracurriculars", S)
+    for ex in extras:
+        recipe.append(_two_col_row(_norm(ex.title), _norm(ex.dates), S))
+        if ex.bullets:
+            recipe.append(_bullets(S, ex.bullets))
+        recipe.append(_spacer(S))
+    return recipe
+
+
+# Story order: Resume attribute -> recipe builder
+_SECTIONS = (
+    ("contact", _header_section),
+    ("education", _education_section),
+    ("experience", _experience_section),
+    ("projects", _projects_section),
+    ("skills", _skills_section),
+    ("extracurriculars", _extracurriculars_section),
+)
+
+# Section recipes (lists of flowable factories) keyed by a hash of the
+# section's data, so re-rendering after an edit only re-parses what changed.
+_SECTION_CACHE_SIZE = 512
+_section_cache: OrderedDict = OrderedDict()
+_section_lock = threading.Lock()
+_section_stats = {"hits": 0, "misses": 0}
+
+
+def _recipe_key(key: str, data, S) -> tuple | None:
+    if id(S) not in _base_ids:  # per-call overrides: build, don't cache
+        return None
+    # model reprs are deterministic and cover every field
+    return (id(S), key, hashlib.sha1(repr(data).encode("utf-8")).hexdigest())
+
+
+def _section_recipe(key: str, data, builder, S, ck=None) -> list:
+    ck = ck or _recipe_key(key, data, S)
+    if ck is None:
+        return builder(data, S)
+    with _section_lock:
+        recipe = _section_cache.get(ck)
+        if recipe is not None:
+            _section_cache.move_to_end(ck)
+            _section_stats["hits"] += 1
+            return recipe
+    recipe = builder(data, S)
+    with _section_lock:
+        _section_stats["misses"] += 1
+        _section_cache[ck] = recipe
+        if len(_section_cache) > _SECTION_CACHE_SIZE:
+            _section_cache.popitem(last=False)
+    return recipe
+
+
+# Measured boxes of a section (see _measure), keyed by its recipe key and the
+# frame width: fit-to-page trials of a section already laid out at that
+# scale skip wrapping it.
+_layout_cache: OrderedDict = OrderedDict()
+_layout_stats = {"layout_hits": 0, "layout_misses": 0}
+
+
+def _story_boxes(resume: Resume, S) -> list:
+    """Measured boxes of the whole story, section by section via the cache."""
+    width = _frame_size()[0]
+    boxes, canv = [], None
+    for key, builder in _SECTIONS:
+        data = getattr(resume, key)
+        ck = _recipe_key(key, data, S)
+        lk = None if ck is None else (ck, width)
+        with _section_lock:
+            section = _layout_cache.get(lk) if lk else None
+            if section is not None:
+                _layout_cache.move_to_end(lk)
+                _layout_stats["layout_hits"] += 1
+        if section is None:
+            canv = canv or Canvas(io.BytesIO(), pagesize=LETTER)
+            recipe = _section_recipe(key, data, builder, S, ck)
+            section = _measure([make() for make in recipe], canv)
+            if lk:
+                with _section_lock:
+                    _layout_stats["layout_misses"] += 1
+                    _layout_cache[lk] = section
+                    if len(_layout_cache) > _SECTION_CACHE_SIZE:
+                        _layout_cache.popitem(last=False)
+        boxes.extend(section)
+    return boxes
+
+
+def section_cache_stats() -> dict:
+    return {**_section_stats, **_layout_stats, "size": len(_section_cache)}
+
+
+def prebuild(structured, family=None) -> None:
+    """
+    Parse the sections present in ``structured`` (a partial build_resume
+    dict, or a Resume) into the section cache ahead of time, so rendering the
+    whole resume later only has to lay out the pages.
+    """
+    resume = Resume.coerce(structured)
+    S = _styles(None, family or fonts.from_env())
+    present = structured.keys() if isinstance(structured, dict) else dict(_SECTIONS)
+    for key, builder in _SECTIONS:
+        if key in present:
+            _section_recipe(key, getattr(resume, key), builder, S)
+
+
+def _build_story(resume: Resume, S) -> list:
+    story = []
+    for key, builder in _SECTIONS:
+        data = getattr(resume, key)
+        story.extend(make() for make in _section_recipe(key, data, builder, S))
+    return story
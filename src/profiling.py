@@ -0,0 +1,88 @@
+"""
+Stage timers and counters for the render pipeline.
+
+Disabled by default: ``stage()`` hands back a shared no-op context manager
+and ``count()`` is one global check, so the hooks stay in production code.
+``enable()`` starts collecting into a fresh Profile for this process.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Profile:
+    """Accumulated wall time/calls per stage plus free-form counters."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: dict[str, list] = {}  # name -> [seconds, calls]
+        self.counters: Counter = Counter()
+
+    def report(self) -> dict:
+        return {
+            "total_seconds": round(time.perf_counter() - self.started, 6),
+            "stages": {
+                name: {"seconds": round(secs, 6), "calls": calls}
+                for name, (secs, calls) in self.stages.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+
+class _Stage:
+    __slots__ = ("profile", "name", "t0")
+
+    def __init__(self, profile: Profile, name: str):
+        self.profile, self.name = profile, name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        entry = self.profile.stages.setdefault(self.name, [0.0, 0])
+        entry[0] += time.perf_counter() - self.t0
+        entry[1] += 1
+        return False
+
+
+_active: Profile | None = None
+
+
+def enable() -> Profile:
+    global _active
+    _active = Profile()
+    return _active
+
+
+def disable() -> Profile | None:
+    global _active
+    profile, _active = _active, None
+    return profile
+
+
+def stage(name: str):
+    """``with stage("doc_build"): ...`` times the block when profiling is on."""
+    profile = _active
+    return _NULL_STAGE if profile is None else _Stage(profile, name)
+
+
+def count(name: str, n: int = 1) -> None:
+    profile = _active
+    if profile is not None:
+        profile.counters[name] += n
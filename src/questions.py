@@ -1,6 +1,8 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+import builder
 from builder import build_resume
-from pdf_generator import build_pdf
 
 
 # ---------- Helper Functions ----------
@@ -195,29 +197,88 @@ def extra_curriculars():
 
 
 # ---------- New Bundler Function ----------
-def collect_all_input():
-    return {
-        "contact": contact_info(),
-        "education": education_info(),
-        "experience": experience_info(),
-        "projects": project_info(),
-        "skills": skill_info(),
-        "extracurriculars": extra_curriculars(),
-    }
-    # (removed unreachable build_resume(resume_data) call)
+def collect_all_input(on_section=None):
+    """
+    Prompt for every section in turn. ``on_section(key, value)`` is called as
+    soon as each one is complete (see Prebuilder).
+    """
+    raw = {}
+    for key, ask in (
+        ("contact", contact_info),
+        ("education", education_info),
+        ("experience", experience_info),
+        ("projects", project_info),
+        ("skills", skill_info),
+        ("extracurriculars", extra_curriculars),
+    ):
+        raw[key] = ask()
+        if on_section:
+            on_section(key, raw[key])
+    return raw
+
+
+# ---------- Background Pre-building ----------
+def _warm_up():
+    import pdf_generator  # reportlab loads here, not after the last answer
+
+    builder.warm_up()
+    pdf_generator.warm_up()
+
+
+def _prebuild_section(key, value):
+    import pdf_generator
+
+    section = builder.build_section(key, value)
+    pdf_generator.prebuild({key: section})
+    return section
+
+
+class Prebuilder:
+    """
+    Uses the minutes spent at the prompts: a background thread warms the
+    tokenizer, rewrite rules and PDF renderer, then builds each section (and
+    parses it for the PDF) as soon as it has been entered, so only page
+    layout is left after the last answer.
+    """
+
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prebuild")
+        self._pool.submit(_warm_up)
+        self._sections = {}
+
+    def add(self, key, value):
+        self._sections[key] = self._pool.submit(_prebuild_section, key, value)
+
+    def build(self, raw):
+        """build_resume(raw), reusing the sections built in the background."""
+        structured = build_resume(
+            {k: v for k, v in raw.items() if k not in self._sections}
+        )
+        for key, future in self._sections.items():
+            structured[key] = future.result()
+        return structured
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
 
 # ---------- Main Runner ----------
 if __name__ == "__main__":
-    # 1) Gather raw inputs
-    raw = collect_all_input()
+    # 1) Gather raw inputs, building each section in the background
+    prebuilder = Prebuilder()
+    try:
+        raw = collect_all_input(prebuilder.add)
 
-    # 2) Transform to bullet-ready (Experience→STAR, Projects/Extracurriculars→XYZ)
-    structured = build_resume(raw)
+        # 2) Transform to bullet-ready (Experience→STAR, Projects/Extracurriculars→XYZ)
+        structured = prebuilder.build(raw)
+    finally:
+        prebuilder.close()
 
     # (Optional) Preview in console
     print("\nTransformed (STAR/XYZ) resume data:\n", structured)
 
-    # 3) Build the PDF from transformed data
+    # 3) Build the PDF from transformed data (sections are already parsed)
+    from pdf_generator import build_pdf
+
     pdf_path = build_pdf(structured, filename="AutoResume.pdf")
     print(f"\nPDF created: {pdf_path}")
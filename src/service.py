@@ -0,0 +1,283 @@
+"""
+Long-running HTTP render service (stdlib only, no broker).
+
+    python -m src.service --port 8080 --workers 4 --max-queue 16
+
+POST /render   raw resume JSON in, application/pdf out (with an ETag; a
+               matching If-None-Match gets 304 Not Modified)
+GET  /healthz  liveness: the HTTP loop is up
+GET  /readyz   readiness: every worker has warmed the builder and renderer,
+               the pool is not broken and not every worker is stuck on a
+               render that already timed out
+
+CPU work runs in a process pool whose workers stay warm between requests.
+At most workers + max-queue renders are admitted at once; anything beyond
+that is rejected with 503 + Retry-After instead of piling up in memory.
+With --reproducible, identical input always renders identical bytes, so the
+ETag is stable across requests, workers and replicas.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker() -> None:
+    from src import builder, pdf_generator
+
+    builder.warm_up()
+    pdf_generator.warm_up()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _render(raw: dict, reproducible=None) -> bytes:
+    from src.builder import build_resume
+    from src.pdf_generator import render_pdf
+
+    return render_pdf(build_resume(raw), reproducible=reproducible)
+
+
+class RenderService:
+    """A warm process pool plus an admission limit (the backpressure)."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 8,
+        timeout: float = 60.0,
+        reproducible=None,
+    ):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.reproducible = reproducible  # None: $AUTORESUME_REPRODUCIBLE
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker)
+        self._slots = threading.BoundedSemaphore(self.workers + max(0, max_queue))
+        self.ready = threading.Event()  # set once every worker is warm
+        self.broken = False
+        self.overrunning = 0  # timed-out renders still holding a worker
+        self._lock = threading.Lock()
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            return (
+                self.ready.is_set()
+                and not self.broken
+                and self.overrunning < self.workers
+            )
+
+    def warm(self) -> None:
+        """Start every worker and wait for its initializer; then mark ready."""
+        pings = [self.pool.submit(_ping) for _ in range(self.workers)]
+        for f in pings:
+            f.result()
+        self.ready.set()
+        logger.info("Render service ready with %d workers", self.workers)
+
+    def submit(self, raw: dict) -> Future | None:
+        """Queue a render, or return None when the service is saturated."""
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            fut = self.pool.submit(_render, raw, self.reproducible)
+        except BaseException as exc:
+            self._slots.release()
+            if isinstance(exc, BrokenProcessPool):
+                self.mark_broken()
+            raise
+        fut.add_done_callback(lambda _: self._slots.release())
+        return fut
+
+    def timed_out(self, fut: Future) -> None:
+        """
+        Give up on ``fut``. A queued render is cancelled; one already running
+        can't be stopped, so it keeps its admission slot and is counted until
+        it finishes (readiness drops while every worker is stuck like that).
+        """
+        if fut.cancel():
+            return
+        with self._lock:
+            self.overrunning += 1
+        logger.warning("A render overran its timeout and still holds a worker")
+
+        def finished(_):
+            with self._lock:
+                self.overrunning -= 1
+
+        fut.add_done_callback(finished)
+
+    def mark_broken(self) -> None:
+        with self._lock:
+            if not self.broken:
+                logger.error("Render pool is broken; reporting not ready")
+            self.broken = True
+
+    def close(self) -> None:
+        self.ready.clear()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    if not header:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def make_handler(service: RenderService, max_body: int = 1 << 20):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "AutoResume"
+
+        def _send(self, status: int, body: bytes, ctype: str, headers=()):
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in headers:
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _json(self, status: int, payload: dict, headers=()):
+            body = json.dumps(payload).encode("utf-8")
+            self._send(status, body, "application/json", headers)
+
+        def do_GET(self):
+            if self.path == "/healthz":
+                self._json(200, {"status": "ok"})
+            elif self.path == "/readyz":
+                ready = service.is_ready()
+                self._json(200 if ready else 503, {"ready": ready})
+            else:
+                self._json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/render":
+                self._json(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self._json(400, {"error": "invalid Content-Length"})
+                return
+            if length == 0 or length > max_body:
+                self._json(413 if length else 411, {"error": "bad body size"})
+                return
+            try:
+                raw = json.loads(self.rfile.read(length))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                self._json(400, {"error": f"invalid JSON: {exc}"})
+                return
+            except RecursionError:  # json's answer to very deep nesting
+                self._json(400, {"error": "invalid JSON: nested too deeply"})
+                return
+            if not isinstance(raw, dict):
+                self._json(400, {"error": "expected a JSON object"})
+                return
+
+            try:
+                fut = service.submit(raw)
+                if fut is None:
+                    self._json(503, {"error": "busy"}, [("Retry-After", "1")])
+                    return
+                pdf = fut.result(timeout=service.timeout)
+            except FutureTimeout:
+                service.timed_out(fut)
+                self._json(504, {"error": "render timed out"})
+                return
+            except BrokenProcessPool:
+                service.mark_broken()
+                self._json(503, {"error": "render pool is broken"})
+                return
+            except Exception as exc:
+                logger.exception("Render failed")
+                self._json(500, {"error": f"{type(exc).__name__}: {exc}"})
+                return
+            etag = '"%s"' % hashlib.sha256(pdf).hexdigest()[:32]
+            if _etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self._send(200, pdf, "application/pdf", [("ETag", etag)])
+
+        def log_message(self, format, *args):
+            logger.info("%s %s", self.address_string(), format % args)
+
+    return Handler
+
+
+def make_server(
+    host: str, port: int, service: RenderService, max_body: int = 1 << 20
+) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), make_handler(service, max_body))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve resume PDFs over HTTP")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="Render processes (0 = one per CPU)"
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=8,
+        help="Renders allowed to wait for a worker before 503 (default 8)",
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds/render")
+    parser.add_argument(
+        "--max-body", type=int, default=1 << 20, help="Max request bytes (1 MiB)"
+    )
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Render byte-identical PDFs for identical input (stable ETags)",
+    )
+    args = parser.parse_args(argv)
+
+    service = RenderService(
+        workers=args.workers or os.cpu_count() or 1,
+        max_queue=args.max_queue,
+        timeout=args.timeout,
+        reproducible=args.reproducible or None,
+    )
+    server = make_server(args.host, args.port, service, args.max_body)
+    threading.Thread(target=service.warm, daemon=True).start()
+
+    def _stop(*_):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    logger.info("Listening on %s:%d", args.host, server.server_address[1])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,77 @@
+import math
+import random
+
+import pytest
+
+from src.ats import TermIndex, resume_text, terms
+from src.model import Experience, Resume
+
+
+def _resume(*bullets, skills=None):
+    return Resume(
+        experience=[Experience(title="Engineer", bullets=list(bullets))],
+        skills=skills or {},
+    )
+
+
+def test_ranks_resumes_and_reports_keywords():
+    index = TermIndex.build(
+        [
+            ("web", _resume("Built pages in HTML and CSS.")),
+            ("ops", _resume("Ran docker and kubernetes with github actions.")),
+            ("py", _resume("Wrote python services.", skills={"Tools": ["Docker"]})),
+        ]
+    )
+    job = "Python developer with Docker, Kubernetes and GitHub Actions experience."
+
+    results = index.score(job, top=2)
+
+    assert [r["name"] for r in results] == ["ops", "py"]
+    assert results[0]["score"] > results[1]["score"] > 0
+    assert set(results[0]["matched"]) == {"Docker", "Kubernetes", "GitHub Actions"}
+    assert "Python" in results[0]["missing"]
+    assert "Python" in results[1]["matched"] and "Docker" in results[1]["matched"]
+
+
+def test_tech_aliases_share_a_term():
+    assert terms("Used the CLI daily") == terms("used the command line daily")
+    assert "experience" not in terms("5+ years experience")
+
+
+def test_scores_match_a_dense_reference():
+    rng = random.Random(0)
+    words = "python docker sql react flask aws git pandas api cache queue".split()
+    docs = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        for _ in range(40)
+    ]
+    job = "python sql sql api latency"
+    resumes = [_resume(d) for d in docs]
+    index = TermIndex.build((str(i), r) for i, r in enumerate(resumes))
+    got = {r["name"]: r["score"] for r in index.score(job, top=len(docs))}
+
+    # straightforward dense TF-IDF + cosine over the same tokens
+    counts = [_count(terms(resume_text(r))) for r in resumes]
+    n = len(docs)
+    df = {t: sum(t in c for c in counts) for c in counts for t in c}
+
+    def vec(c):
+        return {
+            t: (1 + math.log(k)) * (math.log((1 + n) / (1 + df.get(t, 0))) + 1)
+            for t, k in c.items()
+        }
+
+    q = vec(_count(terms(job)))
+    qn = math.sqrt(sum(w * w for w in q.values()))
+    for i, c in enumerate(counts):
+        v = vec(c)
+        vn = math.sqrt(sum(w * w for w in v.values()))
+        expected = sum(w * v.get(t, 0) for t, w in q.items()) / (vn * qn) if vn else 0
+        assert got[str(i)] == pytest.approx(expected, abs=1e-4)
+
+
+def _count(tokens):
+    out = {}
+    for t in tokens:
+        out[t] = out.get(t, 0) + 1
+    return out
@@ -0,0 +1,25 @@
+from benchmarks.suite import STAGES, compare, run_preset
+from benchmarks.synthetic import make_resume
+
+
+def test_synthetic_resume_has_requested_shape():
+    raw = make_resume(experiences=4, projects=2, extracurriculars=0, sentences=3)
+    assert (len(raw["experience"]), len(raw["projects"])) == (4, 2)
+    assert raw["extracurriculars"] == []
+    assert make_resume(seed=3) == make_resume(seed=3)
+
+
+def test_suite_reports_stages_and_flags_regressions():
+    from src import builder
+
+    cache = builder.configure_rewrite_cache(maxsize=64)
+    try:
+        res = run_preset("tiny", runs=2, splitter="regex")
+        assert builder._REWRITE_CACHE is cache  # the caller's cache is back
+    finally:
+        builder.configure_rewrite_cache()
+    assert set(STAGES) <= set(res) and res["throughput_per_s"] > 0
+
+    slower = {s: {"p50_ms": res[s]["p50_ms"] * 2 + 1} for s in STAGES}
+    assert compare({"presets": {"tiny": res}}, {"presets": {"tiny": slower}}, 0.1)
+    assert not compare({"presets": {"tiny": res}}, {"presets": {"tiny": res}}, 0.1)
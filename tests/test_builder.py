@@ -1,6 +1,32 @@
+import json
 import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
 from builder import build_resume, rewrite_to_resume_bullets
 
+IMPORT_BUDGET_S = 0.5
+# Per-summary bound for adversarial input; ordinary summaries take ~1 ms.
+PATHOLOGICAL_BUDGET_S = 0.5
+
+# Strings that made the old patterns backtrack (runs of sentence marks, of
+# whitespace before a missing separator) or that repeat the rules' own
+# keywords, each stretched to ``n`` characters.
+PATHOLOGICAL = {
+    "marks": lambda n: "!" * n + "x",
+    "dots": lambda n: "." * n + "x",
+    "brackets": lambda n: "a." + ")" * n + "x",
+    "spaces": lambda n: "a" + " " * n + "b",
+    "mixed_ws": lambda n: "\t \n" * (n // 3) + "x",
+    "keywords": lambda n: "in x\n" * (n // 5),
+    "pronouns": lambda n: "we was i helped " * (n // 16),
+    "gerunds": lambda n: ("a" * 50 + "ing, managing ") * (n // 64),
+    "one_word": lambda n: "a" * n,
+    "dashes": lambda n: "- ," * (n // 3),
+}
+
 
 def test_rewrite_makes_strong_bullets():
     summary = "I was tasked with creating the site using python. delivered outcomes."
@@ -20,3 +46,268 @@ def test_experience_bullets_not_starting_with_i(sample_raw):
     bullets = out["experience"][0]["bullets"]
     assert bullets, "Experience bullets should not be empty"
     assert not any(re.match(r"•\s*i\b", b, flags=re.I) for b in bullets)
+
+
+def test_tech_normalizer_matches_per_key_loop():
+    from builder import _TECH_MAP, _normalize_tech_in_text
+
+    def legacy(s):
+        for k, v in _TECH_MAP.items():
+            s = re.sub(rf"\b{re.escape(k)}\b", v, s, flags=re.I)
+        return s
+
+    samples = [
+        "• Shipped via github actions, GITHUB and git.",
+        "• Queried mysql and sql from the CLI and command line.",
+        "• Built javascript, java and typescript apps; githubactions stays.",
+    ]
+    for s in samples:
+        assert _normalize_tech_in_text(s) == legacy(s)
+    assert "GitHub Actions" in _normalize_tech_in_text("used github actions")
+
+
+def test_import_is_lazy_and_fast():
+    # Importing the builder must not load NLTK (or hit the network / pip).
+    code = (
+        "import sys, time; t = time.perf_counter(); import src.builder; "
+        "print(time.perf_counter() - t, 'nltk' in sys.modules)"
+    )
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+    )
+    elapsed, nltk_loaded = out.stdout.split()
+    assert nltk_loaded == "False"
+    assert float(elapsed) < IMPORT_BUDGET_S
+
+
+def test_rules_compile_once_under_concurrent_first_use(monkeypatch):
+    import threading
+    import time
+
+    import builder
+
+    compiled = []
+    real = builder.compile_rules
+
+    def slow_compile(config):
+        compiled.append(config)
+        time.sleep(0.05)  # widen the race window
+        return real(config)
+
+    monkeypatch.setattr(builder, "compile_rules", slow_compile)
+    monkeypatch.setattr(builder, "_RULES", None)
+    seen = []
+    threads = [
+        threading.Thread(target=lambda: seen.append(builder._rules())) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(compiled) == 1
+    assert all(rules is seen[0] for rules in seen)
+
+
+def test_offline_mode_fails_fast(monkeypatch):
+    import builder
+    import nltk
+
+    def missing(_):
+        raise LookupError("punkt_tab")
+
+    def no_download(*a, **k):
+        raise AssertionError("download attempted in offline mode")
+
+    monkeypatch.setenv(builder.OFFLINE_ENV, "1")
+    monkeypatch.setattr(nltk.data, "find", missing)
+    monkeypatch.setattr(nltk, "download", no_download)
+    builder._punkt_tokenizer.cache_clear()
+    try:
+        with pytest.raises(RuntimeError, match="punkt_tab"):
+            builder.rewrite_to_resume_bullets("Built a site.")
+    finally:
+        builder._punkt_tokenizer.cache_clear()
+
+
+def test_rewrite_cache_hits_and_persists(tmp_path, sample_raw, monkeypatch):
+    import builder
+
+    db = str(tmp_path / "rewrites.sqlite")
+    try:
+        cache = builder.configure_rewrite_cache(maxsize=64, path=db)
+        first = build_resume(sample_raw)
+        assert cache.misses and not cache.hits
+        assert build_resume(sample_raw) == first
+        assert cache.hits == cache.misses
+
+        # A fresh process-wide cache is served from the SQLite store.
+        cache = builder.configure_rewrite_cache(maxsize=64, path=db)
+        assert build_resume(sample_raw) == first
+        assert cache.disk_hits and not cache.misses
+
+        # Editing a rule table changes the version and invalidates the store.
+        monkeypatch.setattr(builder, "ACTION_VERBS", builder.ACTION_VERBS | {"x"})
+        cache = builder.configure_rewrite_cache(maxsize=64, path=db)
+        build_resume(sample_raw)
+        assert cache.misses and not cache.disk_hits
+    finally:
+        builder.configure_rewrite_cache()
+
+
+def test_rewrite_store_is_bounded_and_shared_across_rule_sets(tmp_path, monkeypatch):
+    import sqlite3
+
+    import builder
+
+    db = str(tmp_path / "rewrites.sqlite")
+    monkeypatch.setattr(builder, "_REWRITE_LOGIC_VERSION", 1)
+
+    def store(version, max_rows=1000):
+        cache = builder.RewriteCache(maxsize=0, path=db, max_rows=max_rows)
+        cache._version = version
+        return cache
+
+    other = store("v1-other")
+    other.get("opening", "built it", str.upper)
+    other.flush()
+    old = store("v0-legacy")
+    old.get("opening", "built it", str.upper)
+    old.flush()
+
+    # Opening under the current logic keeps the other rule set's entries
+    # and drops those of older logic.
+    mine = store("v1-mine", max_rows=40)
+    mine._conn()
+    with sqlite3.connect(db) as conn:
+        versions = {v for (v,) in conn.execute("SELECT version FROM rewrites")}
+    assert versions == {"v1-other"}
+
+    mine.get("opening", "x" * (mine.MAX_KEY_CHARS + 1), str.upper)  # not stored
+    for i in range(200):
+        mine.get("opening", f"sentence {i}", str.upper)
+    mine.flush()
+    mine._prune()
+    with sqlite3.connect(db) as conn:
+        keys = [k for (k,) in conn.execute("SELECT key FROM rewrites ORDER BY rowid")]
+    assert len(keys) == 40 and keys[-1] == "sentence 199"
+    assert all(len(k) <= mine.MAX_KEY_CHARS for k in keys)
+
+
+def test_regex_splitter_handles_resume_text():
+    from builder import regex_sent_tokenize
+
+    text = "Built APIs, e.g. REST; upgraded to Python 3.9. Worked with J. Smith! Done"
+    assert regex_sent_tokenize(text) == [
+        "Built APIs, e.g. REST; upgraded to Python 3.9.",
+        "Worked with J. Smith!",
+        "Done",
+    ]
+
+
+def test_splitter_is_selectable_per_call(sample_raw):
+    assert build_resume(sample_raw, splitter="regex") == build_resume(sample_raw)
+    with pytest.raises(ValueError, match="Unknown sentence splitter"):
+        build_resume(sample_raw, splitter="nope")
+
+
+def test_rule_program_matches_golden_corpus():
+    import builder
+
+    golden = json.loads(
+        (Path(__file__).parent / "data" / "rewrite_rules_golden.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    for text, expected in golden["opening"]:
+        assert builder._strong_opening.uncached(text) == expected, text
+    for text, expected in golden["impact"]:
+        assert builder._pick_impact.uncached(text) == expected, text
+
+
+def test_rules_file_adds_verbs_and_impact_categories(tmp_path):
+    import builder
+
+    path = tmp_path / "rules.json"
+    path.write_text(
+        json.dumps(
+            {
+                "action_verbs": ["Mentored"],
+                "impact": {
+                    "improving data quality": ["etl"],
+                    "enhancing usability": ["accessibility"],
+                },
+            }
+        )
+    )
+    before = builder.rules_version()
+    assert builder._strong_opening("Mentored two interns") == (
+        "Delivered Mentored two interns"
+    )
+    try:
+        builder.configure_rules(str(path))
+        assert builder.rules_version() != before
+        assert builder._strong_opening("Mentored two interns") == (
+            "Mentored two interns"
+        )
+        assert builder._strong_opening("Onboarding: mentored two interns") == (
+            "Mentored two interns"
+        )
+        assert builder._pick_impact("Wrote ETL jobs") == "improving data quality"
+        assert builder._pick_impact("Audited accessibility") == "enhancing usability"
+        assert builder._pick_impact("Wrote ETL tests") == "increasing test coverage"
+    finally:
+        builder.configure_rules()
+    assert builder.rules_version() == before
+
+    path.write_text(json.dumps({"verbs": ["mentored"]}))
+    with pytest.raises(ValueError, match="Unknown rule tables"):
+        builder.load_rules(str(path))
+
+
+def test_pathological_input_is_linear_and_capped():
+    import time
+
+    import builder
+
+    with builder.configured(rewrite_cache_size=0):
+        for name, make in PATHOLOGICAL.items():
+            # Field caps: a pasted 200 KB blob in every field the rules read.
+            blob = make(200_000)
+            raw = {
+                "experience": [{"title": blob, "summary": blob, "dates": blob}],
+                "projects": [{"title": "x", "summary": blob, "tools": blob}],
+            }
+            for splitter in ("regex", "punkt"):
+                start = time.perf_counter()
+                build_resume(raw, splitter=splitter)
+                elapsed = time.perf_counter() - start
+                assert elapsed < PATHOLOGICAL_BUDGET_S, (name, splitter, elapsed)
+
+            # The patterns themselves, uncapped.
+            text = make(50_000)
+            start = time.perf_counter()
+            builder.regex_sent_tokenize(text)
+            builder._strong_opening.uncached(text)
+            builder._capitalize_tech.uncached(text)
+            builder._TECH_SPLIT_RE.search(text)
+            builder._DATE_DASH.sub(" ", builder._DATE_COMMA.sub(" ", text))
+            elapsed = time.perf_counter() - start
+            assert elapsed < PATHOLOGICAL_BUDGET_S, (name, elapsed)
+
+    capped = builder._capped("word " * 2000, builder.MAX_FIELD_CHARS)
+    assert len(capped) <= builder.MAX_FIELD_CHARS and capped.endswith("word")
+
+
+def test_null_title_and_summary_build_like_missing_ones():
+    from builder import make_star_bullets, make_xyz_bullets
+
+    summary = "Built the billing service. Cut invoice errors with Python."
+    for item in ("experience", "projects", "extracurriculars"):
+        nulls = build_resume({item: [{"title": None, "summary": summary}]})
+        missing = build_resume({item: [{"summary": summary}]})
+        assert nulls[item][0]["bullets"] == missing[item][0]["bullets"]
+        nulls = build_resume({item: [{"title": "Intern", "summary": None}]})
+        assert nulls[item] == build_resume({item: [{"title": "Intern"}]})[item]
+    assert make_star_bullets(summary, role=None) == make_star_bullets(summary)
+    assert make_xyz_bullets(None) == [] and rewrite_to_resume_bullets(None) == []
@@ -0,0 +1,365 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.cli import main
+
+
+def test_batch_renders_jsonl_and_reports_failures(tmp_path, sample_raw):
+    src = tmp_path / "resumes.jsonl"
+    lines = [
+        json.dumps({**sample_raw, "id": "alice"}),
+        "{not json",
+        json.dumps(sample_raw),
+    ]
+    src.write_text("\n".join(lines), encoding="utf-8")
+    out_dir = tmp_path / "out"
+    summary = tmp_path / "summary.json"
+
+    rc = main(
+        ["--batch", str(src), "--out-dir", str(out_dir), "--summary", str(summary)]
+    )
+
+    report = json.loads(summary.read_text())
+    assert rc == 1
+    assert (report["total"], report["succeeded"], report["failed"]) == (3, 2, 1)
+    assert [r["ok"] for r in report["records"]] == [True, False, True]
+    assert (out_dir / "alice.pdf").stat().st_size > 0
+    assert (out_dir / "resumes-000003.pdf").exists()
+
+
+def test_deeply_nested_records_fail_alone(tmp_path, sample_raw):
+    from src import batch
+
+    src = tmp_path / "resumes.jsonl"
+    src.write_text(json.dumps(sample_raw) + "\n" + "[" * 100_000, "utf-8")
+    assert [error for _, _, error in batch.iter_records(str(src))] == [
+        None,
+        "line 2: invalid JSON (nested too deeply)",
+    ]
+    single = tmp_path / "deep.json"
+    single.write_text("{" + '"a":{' * 100_000, "utf-8")
+    assert [error for _, _, error in batch.iter_records(str(single))] == [
+        "invalid JSON (nested too deeply)"
+    ]
+
+    summary = tmp_path / "summary.json"
+    args = ["--batch", str(src), "--out-dir", str(tmp_path / "out")]
+    assert main(args + ["--summary", str(summary)]) == 1
+    report = json.loads(summary.read_text())
+    assert (report["succeeded"], report["failed"]) == (1, 1)
+
+
+def test_batch_renders_directory(tmp_path, sample_raw):
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for name in ("a", "b"):
+        (in_dir / f"{name}.json").write_text(json.dumps(sample_raw), encoding="utf-8")
+
+    assert main(["--batch", str(in_dir), "--out-dir", str(tmp_path / "out")]) == 0
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["a.pdf", "b.pdf"]
+
+
+def test_parallel_batch_matches_serial(tmp_path, sample_raw):
+    src = tmp_path / "resumes.jsonl"
+    lines = [json.dumps({**sample_raw, "id": f"r{i}"}) for i in range(5)]
+    lines.insert(2, "[]")
+    src.write_text("\n".join(lines), encoding="utf-8")
+
+    reports = []
+    for workers in ("1", "2"):
+        summary = tmp_path / f"summary-{workers}.json"
+        out_dir = tmp_path / f"out-{workers}"
+        args = ["--batch", str(src), "--out-dir", str(out_dir)]
+        main(
+            args + ["--workers", workers, "--chunksize", "2", "--summary", str(summary)]
+        )
+        reports.append(json.loads(summary.read_text()))
+
+    serial, parallel = (
+        [(r["name"], r["ok"], r["error"]) for r in rep["records"]] for rep in reports
+    )
+    assert serial == parallel
+    assert [name for name, *_ in serial] == [
+        "r0",
+        "r1",
+        "resumes-000003",
+        "r2",
+        "r3",
+        "r4",
+    ]
+
+
+def test_stdin_to_stdout(sample_raw):
+    root = Path(__file__).resolve().parents[1]
+    proc = subprocess.run(
+        [sys.executable, "-m", "src.cli", "--input", "-", "--output", "-"],
+        input=json.dumps(sample_raw).encode(),
+        cwd=root,
+        capture_output=True,
+        check=True,
+    )
+    assert proc.stdout.startswith(b"%PDF")
+    assert proc.stdout.rstrip().endswith(b"%%EOF")
+
+
+def test_profile_reports_stages_and_counters(tmp_path, sample_raw):
+    from src import profiling
+
+    assert profiling.stage("idle") is profiling._NULL_STAGE  # off by default
+    src = tmp_path / "in.json"
+    src.write_text(json.dumps(sample_raw), encoding="utf-8")
+    report_path = tmp_path / "profile.json"
+    cprof_path = tmp_path / "run.prof"
+
+    args = ["--input", str(src), "--output", str(tmp_path / "out.pdf")]
+    main(args + ["--profile", str(report_path), "--cprofile", str(cprof_path)])
+
+    report = json.loads(report_path.read_text())
+    stages = report["stages"]
+    for name in ("json_load", "build_resume", "tokenize", "story", "doc_build"):
+        assert stages[name]["calls"] >= 1
+    assert report["counters"]["bullets_rewritten"] > 0
+    assert report["counters"]["flowables"] > 0
+    assert cprof_path.stat().st_size > 0
+    assert profiling.stage("idle") is profiling._NULL_STAGE  # switched back off
+
+
+def test_json_array_is_streamed_across_read_chunks(tmp_path, monkeypatch, sample_raw):
+    from src import batch
+
+    monkeypatch.setattr(batch, "READ_CHUNK", 7)  # split every record
+    src = tmp_path / "resumes.json"
+    items = [{**sample_raw, "id": "alice"}, "oops", sample_raw]
+    src.write_text(" [\n" + ",\n".join(map(json.dumps, items)) + "\n]", "utf-8")
+
+    records = list(batch.iter_records(str(src)))
+    assert [(name, error) for name, _, error in records] == [
+        ("alice", None),
+        ("resumes-000002", "element 2: expected a JSON object"),
+        ("resumes-000003", None),
+    ]
+    assert records[2][1] == sample_raw
+
+    src.write_text("[" + json.dumps(sample_raw) + ' {"x": 1}]', "utf-8")
+    *_, (_, raw, error) = batch.iter_records(str(src))
+    assert raw is None and "expected ',' or ']'" in error
+
+    # a too deeply nested element fails the rest of the array, not the run
+    src.write_text("[" + json.dumps(sample_raw) + "," + "[" * 100_000, "utf-8")
+    assert [error for _, _, error in batch.iter_records(str(src))] == [
+        None,
+        "element 2: invalid JSON (nested too deeply)",
+    ]
+    folder = tmp_path / "dir"
+    folder.mkdir()
+    (folder / "deep.json").write_text("[" * 100_000, "utf-8")
+    (folder / "ok.json").write_text(json.dumps(sample_raw), "utf-8")
+    assert [(name, error) for name, _, error in batch.iter_records(str(folder))] == [
+        ("deep", "deep.json: nested too deeply"),
+        ("ok", None),
+    ]
+
+    # a bare number cut at a chunk boundary is read whole, not as "12"
+    src.write_text("[12345]", "utf-8")
+    assert [error for _, _, error in batch.iter_records(str(src))] == [
+        "element 1: expected a JSON object"
+    ]
+
+
+def test_large_json_element_is_decoded_in_few_attempts(tmp_path, monkeypatch):
+    from src import batch
+
+    attempts = []
+
+    class CountingDecoder(json.JSONDecoder):
+        def raw_decode(self, s, idx=0):
+            attempts.append(idx)
+            return super().raw_decode(s, idx)
+
+    monkeypatch.setattr(batch, "READ_CHUNK", 64)
+    monkeypatch.setattr(batch._TextCursor, "_decoder", CountingDecoder())
+    src = tmp_path / "big.json"
+    src.write_text(json.dumps([{"id": "big", "padding": "x" * 200_000}]), "utf-8")
+
+    [(name, raw, error)] = batch.iter_records(str(src))
+    assert (name, error) == ("big", None) and len(raw["padding"]) == 200_000
+    assert len(attempts) < 20  # one retry per 64-char chunk would be ~3000
+
+
+def test_streaming_batch_memory_is_flat(tmp_path, sample_raw):
+    # ~50 MB JSON array; peak RSS while reading it must stay far below that.
+    src = tmp_path / "big.json"
+    record = json.dumps({**sample_raw, "padding": "x" * 2000})
+    count = 20_000
+    with src.open("w", encoding="utf-8") as fh:
+        fh.write("[")
+        for i in range(count):
+            fh.write(("," if i else "") + record)
+        fh.write("]")
+    assert src.stat().st_size > 45 << 20
+
+    code = (
+        "import resource, sys\n"
+        "from src.batch import iter_records\n"
+        "base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        "n = sum(raw is not None for _, raw, _ in iter_records(sys.argv[1]))\n"
+        "peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        "print(n, (peak - base) * 1024)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code, str(src)],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    n, grown = map(int, proc.stdout.split())
+    assert n == count
+    assert grown < 16 << 20
+
+
+def test_parallel_batch_consumes_input_lazily(tmp_path):
+    from src.batch import iter_render_batch
+    from src.cli import _default_writer
+
+    pulled = 0
+
+    def records():
+        nonlocal pulled
+        for i in range(40):
+            pulled += 1
+            yield f"r{i}", None, "skipped"  # error records render instantly
+
+    workers, chunksize = 2, 3
+    results = iter_render_batch(
+        records(), tmp_path, _default_writer, workers=workers, chunksize=chunksize
+    )
+    for done, _ in enumerate(results, start=1):
+        assert pulled - done <= 2 * workers * chunksize
+    assert done == pulled == 40
+
+
+def test_shards_split_input_order_evenly(sample_raw):
+    from src.batch import shard_records
+
+    records = [(f"r{i}", sample_raw, None) for i in range(10)] + [("r0", None, "x")]
+    shards = [[n for n, _, _ in shard_records(records, i, 3)] for i in range(3)]
+    assert shards == [
+        ["r0", "r3", "r6", "r9"],
+        ["r1", "r4", "r7", "r0-2"],
+        ["r2", "r5", "r8"],
+    ]
+
+
+def test_shards_run_side_by_side_and_merge(tmp_path, sample_raw):
+    src = tmp_path / "resumes.jsonl"
+    lines = [json.dumps({**sample_raw, "id": f"r{i}"}) for i in range(6)]
+    lines.insert(4, "{not json")
+    src.write_text("\n".join(lines), encoding="utf-8")
+    out_dir = tmp_path / "out"
+    root = Path(__file__).resolve().parents[1]
+
+    procs, summaries = [], []
+    for index in range(3):
+        summaries.append(tmp_path / f"summary-{index}.json")
+        # the last shard takes its index from the Indexed Job environment
+        shard = f"{index}/3" if index < 2 else "3"
+        cmd = [sys.executable, "-m", "src.cli", "--batch", str(src)]
+        cmd += ["--out-dir", str(out_dir), "--shard", shard]
+        cmd += ["--summary", str(summaries[-1])]
+        env = {**os.environ, "JOB_COMPLETION_INDEX": str(index)}
+        procs.append(subprocess.Popen(cmd, cwd=root, env=env))
+    assert [p.wait() for p in procs] == [0, 1, 0]
+
+    merged = tmp_path / "merged.json"
+    assert main(["--merge-summaries", *map(str, summaries), "--summary", str(merged)])
+    report = json.loads(merged.read_text())
+    assert (report["total"], report["succeeded"], report["failed"]) == (7, 6, 1)
+    assert [(r["name"], r["shard"]) for r in report["records"]] == [
+        ("r0", 0), ("r1", 1), ("r2", 2), ("r3", 0),
+        ("resumes-000005", 1), ("r4", 2), ("r5", 0),
+    ]  # fmt: skip
+    assert (report["shards"]["missing"], report["shards"]["order"]) == ([], "input")
+    assert report["shards"]["rendered"] == {
+        "0": ["r0", "r3", "r5"],
+        "1": ["r1"],
+        "2": ["r2", "r4"],
+    }
+    assert sorted(p.stem for p in out_dir.iterdir()) == [f"r{i}" for i in range(6)]
+
+    # without shard 2 the input positions are unknown: list shard by shard
+    main(["--merge-summaries", *map(str, summaries[:2]), "--summary", str(merged)])
+    partial = json.loads(merged.read_text())
+    assert (partial["shards"]["missing"], partial["shards"]["order"]) == (
+        [2],
+        "by shard",
+    )
+    assert [r["name"] for r in partial["records"]] == [
+        "r0", "r3", "r5", "r1", "resumes-000005",
+    ]  # fmt: skip
+
+
+# Measured ~40 ms; importing every stage up front took ~90 ms.
+COLD_START_BUDGET_US = 150_000
+# Loaded only by the stage that needs them, never by --help or a usage error.
+HEAVY_MODULES = (
+    "reportlab",
+    "nltk",
+    "numpy",
+    "multiprocessing",
+    "src.batch",
+    "src.model",
+)
+
+
+def _import_times(*args) -> dict[str, int]:
+    """Run python -X importtime and return {module: cumulative microseconds}."""
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in out.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def test_cli_cold_start_stays_within_budget():
+    times = _import_times("-c", "import src.cli")
+    assert times["src.cli"] < COLD_START_BUDGET_US
+    help_times = _import_times("-m", "src.cli", "--help")
+    for loaded in (times, help_times):
+        heavy = [
+            m for m in loaded if m.split(".")[0] in HEAVY_MODULES or m in HEAVY_MODULES
+        ]
+        assert heavy == []
+
+
+def test_settings_do_not_outlive_the_run(tmp_path, sample_raw):
+    from src import builder  # the module cli configures
+
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps({"action_verbs": ["mentored"]}))
+    src = tmp_path / "in.json"
+    src.write_text(json.dumps(sample_raw))
+    before = dict(os.environ), builder._default_splitter, builder._REWRITE_CACHE
+    args = ["--input", str(src), "--output", str(tmp_path / "out.pdf")]
+    args += ["--splitter", "regex", "--rules", str(rules), "--fit", "--reproducible"]
+    args += ["--rewrite-cache", str(tmp_path / "rewrites.sqlite")]
+
+    assert main(args) == 0
+    assert (
+        dict(os.environ),
+        builder._default_splitter,
+        builder._REWRITE_CACHE,
+    ) == before
+    assert "mentored" not in builder._rules().verbs
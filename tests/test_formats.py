@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+
+import pytest
+from builder import build_resume
+from formats import (
+    FORMATS,
+    output_paths,
+    parse_formats,
+    render_formats,
+    write_formats,
+)
+from model import Resume
+
+from src.cli import main
+
+
+def _resume(sample_raw):
+    raw = {
+        **sample_raw,
+        "contact": {"full_name": "Ada <Dev>", "email": "ada@example.com"},
+        "skills": {"Languages": ["Python", "C*"]},
+    }
+    return Resume.from_raw(build_resume(raw))
+
+
+def test_all_formats_carry_the_same_normalized_text(sample_raw):
+    resume = _resume(sample_raw)
+    out = render_formats(resume, FORMATS)
+
+    assert list(out) == list(FORMATS)
+    assert out["pdf"].startswith(b"%PDF")
+    text, md, page = (out[f].decode("utf-8") for f in ("txt", "md", "html"))
+    bullet = resume.experience[0].bullets[0].lstrip("• ")
+    for body in (text, md, page):
+        assert "Oct 2024 - Present" in body  # en dash normalized, as in the PDF
+        assert "ada@example.com" in body
+    assert "Ada <Dev>" in text and bullet in text
+    assert "# Ada \\<Dev\\>" in md and "C\\*" in md
+    assert "<h1>Ada &lt;Dev&gt;</h1>" in page and "<li>" in page
+
+
+def test_write_formats_writes_siblings(tmp_path, sample_raw):
+    paths = write_formats(_resume(sample_raw), tmp_path / "cv.pdf", ("pdf", "md"))
+    assert paths == {"pdf": tmp_path / "cv.pdf", "md": tmp_path / "cv.md"}
+    assert all(p.stat().st_size for p in paths.values())
+
+
+def test_output_paths_keep_the_given_name():
+    assert output_paths("out/cv.pdf", ("md",)) == {"md": Path("out/cv.pdf")}
+    assert output_paths("out/resume.v2", ("pdf", "txt")) == {
+        "pdf": Path("out/resume.v2"),
+        "txt": Path("out/resume.v2.txt"),
+    }
+    assert output_paths("cv", ("html", "md")) == {
+        "html": Path("cv"),
+        "md": Path("cv.md"),
+    }
+
+
+def test_parse_formats():
+    assert parse_formats("pdf, md,pdf") == ("pdf", "md")
+    assert parse_formats("all") == FORMATS
+    with pytest.raises(ValueError, match="docx"):
+        parse_formats("pdf,docx")
+
+
+def test_cli_builds_once_for_every_format(tmp_path, monkeypatch, sample_raw):
+    import json
+
+    import src.batch
+
+    calls = []
+    real = src.batch.build_resume
+    monkeypatch.setattr(
+        src.batch, "build_resume", lambda raw: calls.append(1) or real(raw)
+    )
+    src_path = tmp_path / "in.json"
+    src_path.write_text(json.dumps(sample_raw), encoding="utf-8")
+
+    rc = main(
+        ["--input", str(src_path), "--output", str(tmp_path / "cv.pdf")]
+        + ["--format", "all"]
+    )
+    assert rc == 0 and len(calls) == 1
+    assert sorted(p.name for p in tmp_path.glob("cv.*")) == [
+        "cv.html",
+        "cv.md",
+        "cv.pdf",
+        "cv.txt",
+    ]
+
+    out_dir = tmp_path / "out"
+    main(["--batch", str(src_path), "--out-dir", str(out_dir), "--format", "md,txt"])
+    assert sorted(p.name for p in out_dir.iterdir()) == ["in.md", "in.txt"]
+
+
+def test_environment_pdf_cache_is_ignored_for_other_formats(
+    tmp_path, monkeypatch, sample_raw
+):
+    import json
+
+    from src.pdf_cache import CACHE_DIR_ENV
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    src_path = tmp_path / "in.json"
+    src_path.write_text(json.dumps(sample_raw), encoding="utf-8")
+
+    args = ["--input", str(src_path), "--output", str(tmp_path / "cv.md")]
+    assert main(args + ["--format", "md"]) == 0
+    assert "## Education" in (tmp_path / "cv.md").read_text(encoding="utf-8")
+    assert not list(cache_dir.glob("*.pdf"))
+    assert os.environ[CACHE_DIR_ENV] == str(cache_dir)  # restored after the run
+
+    with pytest.raises(SystemExit):  # an explicit --pdf-cache still errors
+        main(args + ["--format", "md", "--pdf-cache", str(cache_dir)])
@@ -0,0 +1,43 @@
+from builder import build_resume
+from model import Contact, Education, Project, Resume
+
+
+def test_from_raw_resolves_aliases_once():
+    resume = Resume.from_raw(
+        {
+            "contact": {"Full name": "Ada Lovelace", "Location": "London"},
+            "education": [{"school": "UCL", "date": "2020", "gpa": 3.9}],
+            "projects": [{"title": "Engine", "tools": ["Python", "C"], "date": "2021"}],
+            "skills": {"Languages": ["Python", " ", "C"], "Tools": "Git", "Other": ""},
+        }
+    )
+    assert resume.contact == Contact(full_name="Ada Lovelace", location="London")
+    assert resume.education == [Education(school="UCL", dates="2020", gpa="3.9")]
+    assert resume.projects == [Project(title="Engine", tools="Python, C", dates="2021")]
+    assert resume.skills == {
+        "Languages": ["Python", "C"],
+        "Tools": ["Git"],
+        "Other": [],
+    }
+    assert not hasattr(resume, "__dict__")  # slotted
+
+
+def test_json_round_trip_is_lossless(sample_raw):
+    resume = Resume.from_raw(build_resume(sample_raw))
+    again = Resume.from_json(resume.to_json())
+    assert again == resume
+    assert again.to_dict() == resume.to_dict()
+    assert again.experience[0].bullets
+
+
+def test_renderers_accept_model_or_dict(sample_raw):
+    from reportlab import rl_config
+
+    from pdf_generator import render_pdf
+
+    structured = build_resume(sample_raw)
+    old_invariant, rl_config.invariant = rl_config.invariant, 1
+    try:
+        assert render_pdf(Resume.from_raw(structured)) == render_pdf(structured)
+    finally:
+        rl_config.invariant = old_invariant
@@ -1,6 +1,17 @@
+import copy
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
 from builder import build_resume
 from pdf_generator import build_pdf
-import os
 
 
 def test_build_pdf_writes_file(tmp_path, sample_raw):
@@ -9,3 +20,195 @@ def test_build_pdf_writes_file(tmp_path, sample_raw):
     pdf_path = build_pdf(structured, filename=str(out))
     assert os.path.exists(pdf_path), "PDF file was not created"
     assert os.path.getsize(pdf_path) > 0, "PDF seems empty"
+
+
+def test_style_registry_is_shared_and_overrides_are_isolated(tmp_path, sample_raw):
+    from pdf_generator import _styles
+
+    assert _styles() is _styles()
+    custom = _styles({"body": {"fontSize": 11}})
+    assert custom["body"].fontSize == 11
+    assert _styles()["body"].fontSize == 9.5
+    assert custom["name"] is _styles()["name"]
+    # fit-to-page shrinks overridden styles along with the rest
+    shrunk = _styles({"body": {"fontSize": 11}}, scale=0.8)
+    assert shrunk["body"].fontSize == 11 * 0.8
+    assert shrunk["name"] is _styles(scale=0.8)["name"]
+
+    out = tmp_path / "Resume.pdf"
+    build_pdf(
+        build_resume(sample_raw),
+        filename=str(out),
+        style_overrides={"body": {"fontSize": 11}},
+    )
+    assert os.path.getsize(out) > 0
+
+
+def test_render_pdf_returns_bytes_or_writes_stream(sample_raw):
+    from pdf_generator import render_pdf
+
+    structured = build_resume(sample_raw)
+    data = render_pdf(structured)
+    assert data.startswith(b"%PDF")
+
+    buf = io.BytesIO()
+    assert render_pdf(structured, buf) is None
+    assert buf.getvalue().startswith(b"%PDF")
+
+
+def test_reproducible_output_is_byte_identical(sample_raw, monkeypatch):
+    from reportlab import rl_config
+
+    from pdf_generator import REPRODUCIBLE_ENV, render_pdf
+
+    monkeypatch.setattr(rl_config, "invariant", 0)
+    structured = build_resume(sample_raw, splitter="regex")
+
+    def digest(**kwargs):
+        return hashlib.sha256(render_pdf(structured, **kwargs)).hexdigest()
+
+    pinned = digest(reproducible=True)
+    assert digest(reproducible=True) == pinned
+    monkeypatch.setenv(REPRODUCIBLE_ENV, "1")
+    assert digest() == pinned
+
+    # ... and in a fresh process, where nothing is cached or warmed up
+    code = (
+        "import hashlib, json, sys; from builder import build_resume; "
+        "from pdf_generator import render_pdf; "
+        "raw = build_resume(json.load(sys.stdin), splitter='regex'); "
+        "print(hashlib.sha256(render_pdf(raw, reproducible=True)).hexdigest())"
+    )
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root / "src",
+        input=json.dumps(sample_raw),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == pinned
+
+    titled = render_pdf(structured, metadata={"title": "Offer", "subject": "CV"})
+    assert b"(Offer)" in titled and b"(CV)" in titled
+    assert hashlib.sha256(titled).hexdigest() != pinned
+    with pytest.raises(ValueError, match="metadata"):
+        render_pdf(structured, metadata={"producer": "x"})
+
+
+def test_section_cache_reuses_unchanged_sections(sample_raw):
+    from reportlab import rl_config
+
+    import pdf_generator
+    from pdf_generator import render_pdf, section_cache_stats
+
+    structured = build_resume(sample_raw)
+    render_pdf(structured)
+    edited = copy.deepcopy(structured)
+    edited.setdefault("projects", []).append(
+        {"title": "Edited", "tools": "Python", "bullets": ["Shipped a change."]}
+    )
+
+    before = section_cache_stats()
+    old_invariant, rl_config.invariant = rl_config.invariant, 1
+    try:
+        cached = render_pdf(edited)
+        after = section_cache_stats()
+        pdf_generator._section_cache.clear()
+        fresh = render_pdf(edited)
+    finally:
+        rl_config.invariant = old_invariant
+
+    # only the projects section is rebuilt; the rest come from the cache
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == len(pdf_generator._SECTIONS) - 1
+    assert cached == fresh
+
+
+def test_truetype_family_is_registered_once_and_subset(sample_raw, monkeypatch):
+    from reportlab.pdfbase import ttfonts
+
+    import fonts
+    from pdf_generator import render_pdf
+
+    vera = os.path.join(os.path.dirname(ttfonts.__file__), "..", "fonts")
+    spec = ",".join(os.path.join(vera, f) for f in ("Vera.ttf", "VeraBd.ttf"))
+    family = fonts.parse_spec(spec)
+    assert [face.rsplit("-", 1)[0] for face in family] == ["Vera", "VeraBd", "Vera"]
+    assert family.italic == family.regular
+
+    parsed = []
+    real_init = ttfonts.TTFont.__init__
+    monkeypatch.setattr(
+        ttfonts.TTFont,
+        "__init__",
+        lambda self, *a, **kw: parsed.append(a) or real_init(self, *a, **kw),
+    )
+    monkeypatch.setenv(fonts.FONT_ENV, spec)
+    structured = build_resume(sample_raw)
+    structured["contact"]["full_name"] = "Zoë Ångström"
+    data = render_pdf(structured)
+    render_pdf(structured)
+    assert parsed == []  # renders reuse the registered fonts
+
+    assert re.search(rb"/BaseFont /[A-Z]{6}\+BitstreamVera", data)  # a subset
+    assert len(data) < 80_000
+
+
+def test_same_named_fonts_in_different_dirs_do_not_collide(tmp_path):
+    from reportlab.pdfbase import ttfonts
+
+    import fonts
+
+    vera = os.path.join(os.path.dirname(ttfonts.__file__), "..", "fonts")
+    faces = []
+    for folder, source in (("a", "Vera.ttf"), ("b", "VeraBd.ttf")):
+        (tmp_path / folder).mkdir()
+        target = tmp_path / folder / "Resume.ttf"
+        shutil.copy(os.path.join(vera, source), target)
+        faces.append(fonts.parse_spec(str(target)).regular)
+    assert faces[0] != faces[1]
+
+
+def test_bad_font_spec_is_rejected():
+    import fonts
+
+    with pytest.raises(ValueError, match="not found"):
+        fonts.parse_spec("/nonexistent/font.ttf")
+    assert fonts.parse_spec("") is fonts.HELVETICA
+
+
+def test_fit_to_page_shrinks_long_resume_onto_one_page(sample_raw):
+    import pdf_generator
+    from benchmarks.synthetic import make_resume
+    from pdf_generator import fit_to_page, render_pdf
+
+    def pages(data):
+        return len(re.findall(rb"/Type /Page[^s]", data))
+
+    raw = make_resume(experiences=5, projects=3, extracurriculars=2, seed=1)
+    structured = build_resume(raw, splitter="regex")
+    assert pages(render_pdf(structured, fit=False)) == 2
+
+    report = fit_to_page(structured)
+    assert report["fits"] and report["scale"] < 1
+    assert report["passes"] <= 6  # vs 31 candidate scales
+    # a second fit re-measures nothing: every section's layout is cached
+    before = pdf_generator.section_cache_stats()
+    assert fit_to_page(structured) == report
+    after = pdf_generator.section_cache_stats()
+    assert after["layout_misses"] == before["layout_misses"]
+    assert after["layout_hits"] > before["layout_hits"]
+    assert pages(render_pdf(structured, fit=True)) == 1
+
+    # the chosen scale is the largest candidate that fits
+    bigger = pdf_generator._styles(scale=round(report["scale"] + 0.01, 4))
+    story = pdf_generator._build_story(pdf_generator.Resume.coerce(structured), bigger)
+    assert not pdf_generator._dry_layout(story)[0]
+
+    assert fit_to_page(build_resume(sample_raw)) == {
+        "scale": 1.0,
+        "fits": True,
+        "passes": 1,
+    }
@@ -0,0 +1,75 @@
+import json
+import os
+import time
+
+from src.cli import main
+from src.pdf_cache import CACHE_DIR_ENV, CACHE_MAX_MB_ENV, PDFCache, cache_key
+
+
+def test_key_is_canonical_and_content_sensitive(sample_raw):
+    reordered = dict(reversed(list(sample_raw.items())))
+    assert cache_key(reordered) == cache_key(sample_raw)
+    changed = {**sample_raw, "skills": {"languages": ["Go"]}}
+    assert cache_key(changed) != cache_key(sample_raw)
+    bigger = {"body": {"fontSize": 12}}
+    assert cache_key(sample_raw, bigger) != cache_key(sample_raw)
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = PDFCache(tmp_path, max_bytes=25)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 10)
+    assert cache.get("a") == b"x" * 10  # "a" is now most recently used
+    cache.put("c", b"x" * 10)  # over budget: evicts "b"
+    assert cache.get("b") is None
+    assert sorted(p.stem for p in tmp_path.glob("*.pdf")) == ["a", "c"]
+    assert cache.stats()["bytes_saved"] == 10
+
+
+def test_size_bound_counts_other_processes_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(PDFCache, "_RESCAN_EVERY", 1)
+    first, second = PDFCache(tmp_path, max_bytes=25), PDFCache(tmp_path, max_bytes=25)
+    for i, cache in enumerate([first, second, first, second]):
+        cache.put(f"k{i}", b"x" * 10)
+    on_disk = sum(p.stat().st_size for p in tmp_path.glob("*.pdf"))
+    assert on_disk <= 25
+    assert second.get("k3") == b"x" * 10  # the newest entry survives
+
+
+def test_eviction_races_and_dead_writers_leave_no_trace(tmp_path, monkeypatch):
+    cache = PDFCache(tmp_path)
+    cache.put("a", b"x" * 10)
+
+    def evicted(*args, **kwargs):
+        raise FileNotFoundError  # another process evicts after the read
+
+    monkeypatch.setattr(os, "utime", evicted)
+    assert cache.get("a") == b"x" * 10
+    monkeypatch.undo()
+
+    stale, fresh = tmp_path / "dead.tmp", tmp_path / "writing.tmp"
+    stale.write_bytes(b"x" * 10)
+    fresh.write_bytes(b"x" * 10)
+    old = time.time() - PDFCache._STALE_TMP_S - 1
+    os.utime(stale, (old, old))
+    PDFCache(tmp_path)  # rescans on open
+    assert not stale.exists() and fresh.exists()
+
+
+def test_batch_serves_unchanged_inputs_from_cache(tmp_path, sample_raw):
+    src = tmp_path / "resumes.jsonl"
+    src.write_text(json.dumps(sample_raw) + "\n" + json.dumps(sample_raw))
+    summary = tmp_path / "summary.json"
+    args = ["--batch", str(src), "--out-dir", str(tmp_path / "out")]
+    args += ["--pdf-cache", str(tmp_path / "cache"), "--summary", str(summary)]
+
+    assert main(args) == 0
+    first = json.loads(summary.read_text())["pdf_cache"]
+    assert (first["hits"], first["misses"]) == (1, 1)  # second record is a hit
+
+    assert main(args) == 0
+    second = json.loads(summary.read_text())["pdf_cache"]
+    assert (second["hits"], second["hit_ratio"]) == (2, 1.0)
+    assert second["bytes_saved"] > 0
+    # the settings are scoped to each run
+    assert CACHE_DIR_ENV not in os.environ and CACHE_MAX_MB_ENV not in os.environ
@@ -0,0 +1,85 @@
+import builtins
+
+import pdf_generator
+import questions
+from builder import build_resume
+
+ANSWERS = [
+    # contact
+    "Ada Lovelace",
+    "ada@example.com",
+    "+15550100",
+    "London, UK",
+    "no",
+    "yes",
+    "https://github.com/ada",
+    "no",
+    # education
+    "University of London",
+    "Mathematics",
+    "Jan 2020",
+    "Present",
+    "London, UK",
+    "yes",
+    "3.9",
+    "no",
+    # experience
+    "Analyst",
+    "Engines Ltd",
+    "London, UK",
+    "May 2023",
+    "Present",
+    "I was tasked with testing the engine using python. Automated the reports.",
+    "no",
+    # projects
+    "yes",
+    "Notes",
+    "Python, Docker",
+    "Feb 2025",
+    "Present",
+    "Built a note-taking CLI. Wrote tests with pytest.",
+    "no",
+    # skills
+    "Languages",
+    "Python",
+    "done",
+    "no",
+    # extracurriculars
+    "no",
+]
+
+
+def test_sections_are_prebuilt_while_prompting(monkeypatch, capsys):
+    answers = iter(ANSWERS)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+
+    prebuilder = questions.Prebuilder()
+    seen = []
+    try:
+        raw = questions.collect_all_input(
+            lambda key, value: (seen.append(key), prebuilder.add(key, value))
+        )
+        structured = prebuilder.build(raw)
+    finally:
+        prebuilder.close()
+
+    assert (
+        seen
+        == list(raw)
+        == [
+            "contact",
+            "education",
+            "experience",
+            "projects",
+            "skills",
+            "extracurriculars",
+        ]
+    )
+    assert structured == build_resume(raw)
+
+    # Every section was parsed for the PDF in the background.
+    before = pdf_generator.section_cache_stats()
+    pdf_generator.render_pdf(structured)
+    after = pdf_generator.section_cache_stats()
+    assert after["hits"] - before["hits"] == 6
+    assert after["misses"] == before["misses"]
@@ -0,0 +1,116 @@
+import http.client
+import json
+import os
+import signal
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.service import RenderService, make_server
+
+
+@pytest.fixture
+def server():
+    service = RenderService(workers=1, max_queue=0, reproducible=True)  # as deployed
+    service.warm()
+    srv = make_server("127.0.0.1", 0, service)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv, service, f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+    service.close()
+
+
+def _post(url, payload: bytes, headers=()):
+    req = urllib.request.Request(url + "/render", data=payload, method="POST")
+    req.add_header("Content-Type", "application/json")
+    for k, v in headers:
+        req.add_header(k, v)
+    return urllib.request.urlopen(req, timeout=30)
+
+
+def test_health_ready_and_render(server, sample_raw):
+    _, _, url = server
+    assert urllib.request.urlopen(url + "/healthz").status == 200
+    assert urllib.request.urlopen(url + "/readyz").status == 200
+
+    resp = _post(url, json.dumps(sample_raw).encode())
+    assert resp.headers["Content-Type"] == "application/pdf"
+    assert resp.read().startswith(b"%PDF")
+
+
+def test_rejects_bad_json_and_applies_backpressure(server, sample_raw):
+    _, service, url = server
+    with pytest.raises(urllib.error.HTTPError) as err:
+        _post(url, b"{nope")
+    assert err.value.code == 400
+    with pytest.raises(urllib.error.HTTPError) as err:
+        _post(url, b"[" * 100_000)
+    assert err.value.code == 400
+    assert json.load(err.value) == {"error": "invalid JSON: nested too deeply"}
+
+    service._slots.acquire()  # occupy the only admission slot
+    try:
+        with pytest.raises(urllib.error.HTTPError) as err:
+            _post(url, json.dumps(sample_raw).encode())
+        assert err.value.code == 503
+        assert err.value.headers["Retry-After"] == "1"
+    finally:
+        service._slots.release()
+
+
+def test_etag_is_stable_and_revalidates(server, sample_raw):
+    _, _, url = server
+    body = json.dumps(sample_raw).encode()
+    first, second = _post(url, body), _post(url, body)
+    etag = first.headers["ETag"]
+    assert etag and second.headers["ETag"] == etag
+    assert first.read() == second.read()
+
+    with pytest.raises(urllib.error.HTTPError) as err:
+        _post(url, body, [("If-None-Match", f'"stale", W/{etag}')])
+    assert err.value.code == 304
+    assert err.value.headers["ETag"] == etag
+    assert _post(url, body, [("If-None-Match", '"stale"')]).status == 200
+
+
+def _raw_post(url, content_length: str):
+    host, port = url.removeprefix("http://").split(":")
+    conn = http.client.HTTPConnection(host, int(port), timeout=30)
+    conn.putrequest("POST", "/render")
+    conn.putheader("Content-Length", content_length)
+    conn.endheaders()
+    return conn.getresponse().status
+
+
+def test_bad_content_length_is_a_client_error(server):
+    _, _, url = server
+    assert _raw_post(url, "abc") == 400
+    assert _raw_post(url, "-5") == 400
+    assert _raw_post(url, str(2 << 20)) == 413
+
+
+def test_readiness_tracks_overruns_and_a_broken_pool():
+    service = RenderService(workers=1, max_queue=0)
+    service.warm()
+    try:
+        assert service.is_ready()
+        slow = service.pool.submit(time.sleep, 0.5)
+        time.sleep(0.1)  # let it start running
+        service.timed_out(slow)
+        assert service.overrunning == 1 and not service.is_ready()
+        slow.result()
+        assert service.overrunning == 0 and service.is_ready()
+
+        os.kill(service.pool.submit(os.getpid).result(), signal.SIGKILL)
+        with pytest.raises(BrokenProcessPool):
+            service.pool.submit(os.getpid).result()
+        with pytest.raises(BrokenProcessPool):
+            service.submit({})
+        assert not service.is_ready()
+    finally:
+        service.close()